@@ -0,0 +1,68 @@
+# Copyright (c) 2022, cemysce
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+from gamecore import LetterStatus, letter_statuses_from_pattern_code, score_guess_digits
+
+class Adversary:
+
+    # Stands in for a game's answer (Absurdle-style), by not settling on one
+    #  until it has to: each guess splits the remaining candidate answers into
+    #  buckets by the letter statuses they would give it, and the adversary
+    #  answers with whichever letter statuses keep the largest bucket (ties
+    #  going to the one revealing fewest right letters, then fewest misplaced
+    #  letters).  Since every valid guess is typically a candidate, the guess
+    #  is scored against all remaining candidates at once with NumPy if it's
+    #  available (see patterns.split_by_pattern_code()), rather than one at a
+    #  time.
+
+    def __init__(self, lexicon):
+        # assert that there are candidate answers to choose between
+        assert lexicon.ANSWERS
+
+        self.__LEXICON = lexicon
+        try:
+            # imported here so that NumPy is optional (without it, candidates
+            #  are scored one at a time, which is much slower)
+            from patterns import encode_words, split_by_pattern_code
+        except ImportError:
+            self.__encoded_candidates    = None
+            self.__split_by_pattern_code = None
+        else:
+            self.__encoded_candidates    = encode_words(lexicon.ANSWERS)
+            self.__split_by_pattern_code = split_by_pattern_code
+
+    def __split_one_at_a_time(self, guess_word, candidates):
+        candidate_letter_counts = self.__LEXICON.answer_letter_counts()
+        buckets = {}
+        while candidates:
+            lowest_bit = candidates & -candidates
+            i = lowest_bit.bit_length() - 1
+            code = 0
+            for d in score_guess_digits(guess_word,
+                                        self.__LEXICON.ANSWERS[i],
+                                        candidate_letter_counts[i]):
+                code = code*3 + d
+            buckets[code] = buckets.get(code, 0) | lowest_bit
+            candidates ^= lowest_bit
+        return buckets
+
+    def respond(self, guess_word, candidates):
+        # Returns the guess's letter statuses and the bitset (over the
+        #  Lexicon's answers) of candidates still remaining after it, given
+        #  the bitset of candidates remaining before it.
+        if self.__split_by_pattern_code is None:
+            buckets = self.__split_one_at_a_time(guess_word, candidates)
+        else:
+            buckets = self.__split_by_pattern_code(guess_word,
+                                                   self.__encoded_candidates,
+                                                   candidates)
+        def bucket_rank(code):
+            letter_statuses = letter_statuses_from_pattern_code(code, len(guess_word))
+            return (bin(buckets[code]).count('1'),
+                    -letter_statuses.count(LetterStatus.RIGHT),
+                    -letter_statuses.count(LetterStatus.MISPLACED))
+        code = max(buckets, key=bucket_rank)
+        return (letter_statuses_from_pattern_code(code, len(guess_word)), buckets[code])
@@ -0,0 +1,67 @@
+# Copyright (c) 2022, cemysce
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+from collections import Counter, namedtuple
+from math        import log2
+
+from gamecore import GuessResult, pattern_code, score_guess
+
+# How one of the player's guesses narrowed down the possible answers, next to
+#  the best guess that could have been made instead (and how far it would
+#  have narrowed them down, or None if it couldn't be worked out).
+GuessAnalysis = namedtuple('GuessAnalysis', ('word',
+                                             'remaining_before',
+                                             'remaining_after',
+                                             'best_guess',
+                                             'best_remaining_after'))
+
+def expected_information(guess_word, answers):
+    # Expected bits of information from making the guess, if the answer is
+    #  equally likely to be any of the specified answers (same as
+    #  solver._entropies(), but in pure Python for a single guess).
+    if not answers:
+        return 0.0
+    bucket_sizes = Counter(pattern_code(score_guess(guess_word, a))
+                           for a in answers)
+    return (  log2(len(answers))
+            - sum(c*log2(c) for c in bucket_sizes.values()) / len(answers))
+
+def _remaining_after(game_core, guess_word):
+    # plays the guess on a fork of the game, leaving the game itself as is
+    fork = game_core.fork()
+    for l in guess_word:
+        fork.append_letter_to_pending_guess(l)
+    (guess_result, _, _) = fork.submit_pending_guess()
+    if guess_result not in (GuessResult.RIGHT,
+                            GuessResult.WRONG,
+                            GuessResult.WRONG_AND_GAME_OVER):
+        return None
+    return fork.remaining_answer_count()
+
+def analyze_game(game_core, best_guess):
+    # Returns a GuessAnalysis for each guess made so far, using the given
+    #  function to choose the best guess for each turn.  Earlier turns are
+    #  reached by undoing guesses on a fork of the game (which shares all of
+    #  the game's state, so that undoing is cheap and needs no re-scoring).
+    fork = game_core.fork()
+    while fork.pending_guess_letters:
+        fork.remove_last_letter_from_pending_guess()
+    analyses = []
+    remaining_after = fork.remaining_answer_count()
+    for guess in reversed(game_core.guesses):
+        fork.undo()
+        best = best_guess(fork)
+        analyses.append(GuessAnalysis(guess.word,
+                                      fork.remaining_answer_count(),
+                                      remaining_after,
+                                      best,
+                                      (remaining_after
+                                       if best == guess.word else
+                                       None if best is None else
+                                       _remaining_after(fork, best))))
+        remaining_after = analyses[-1].remaining_before
+    analyses.reverse()
+    return analyses
@@ -5,12 +5,15 @@
 # LICENSE file in the root directory of this source tree.
 
 import argparse
-import textwrap
 import sys
 
-from constants import GAME_NAME, WORDS_FILENAME
+from constants import (DEFAULT_BOOK_DEPTH,
+                       GAME_NAME,
+                       MAX_BOARDS,
+                       STRATEGY_NAMES,
+                       UPSTREAM_GAME_URL,
+                       WORDS_FILENAME)
 from version   import __version__
-from words     import _UPSTREAM_GAME_URL
 
 class Arguments:
 
@@ -36,7 +39,9 @@ class Arguments:
             # retain newlines in original text, while also wrapping each line
             #  (textwrap.wrap() is what removes newlines from text, so instead
             #   of calling it on entire text, we do text.splitlines() first and
-            #   then textwrap.wrap() on each line individually)
+            #   then textwrap.wrap() on each line individually; imported here
+            #   since it's only needed to print usage information)
+            import textwrap
             return [wrapped_line
                     for line in text.splitlines()
                     for wrapped_line in (textwrap.wrap(line, width)
@@ -85,8 +90,13 @@ class Arguments:
         # add arguments
         parser.add_argument('-h', '--help',        action='help',              help= 'Print this usage information, then exit.')
         parser.add_argument('-V', '--version',     action='store_true',        help= 'Print version, then exit.')
+        parser.add_argument('-w', '--words-file',  metavar='FILE',
+                                                   default=WORDS_FILENAME,     help=f'Use word lists from FILE instead of "{WORDS_FILENAME}", for'
+                                                                                     ' example lists of longer words (all words in FILE must'
+                                                                                     ' have the same length, of up to 15 letters).  With -D,'
+                                                                                     ' download to FILE instead.')
         group = parser.add_mutually_exclusive_group()
-        group.add_argument( '-D', '--download',    action='store_true',        help=f'Download word lists from {_UPSTREAM_GAME_URL} to'
+        group.add_argument( '-D', '--download',    action='store_true',        help=f'Download word lists from {UPSTREAM_GAME_URL} to'
                                                                                     f' "{WORDS_FILENAME}" (obfuscated so that you cannot'
                                                                                      ' accidentally spoil answers if you open it),'
                                                                                      ' overwriting any existing file with that name.')
@@ -99,10 +109,75 @@ class Arguments:
                                                                                                        #  sort answer list before printing.
         group.add_argument(       '--word-stats',  action='store_true',        help=argparse.SUPPRESS) # Print some rudimentary statistical analysis
                                                                                                        #  of words in stored answer list.
+        group.add_argument(       '--simulate',    metavar='STRATEGY',
+                                                   nargs='+',
+                                                   choices=STRATEGY_NAMES,     help=argparse.SUPPRESS) # Play every answer with each specified
+                                                                                                       #  strategy, without graphics, across all
+                                                                                                       #  CPU cores, then print results.
+        group.add_argument(       '--analyze-history',
+                                                   action='store_true',        help=argparse.SUPPRESS) # Replay every completed daily game saved for
+                                                                                                       #  stored word lists, across all CPU cores,
+                                                                                                       #  then print how each went.
+        group.add_argument(       '--invert-share-grid',
+                                                   metavar='DAY',
+                                                   nargs='?',
+                                                   const='',                   help=argparse.SUPPRESS) # Read a share grid from standard input, then
+                                                                                                       #  print which answers (out of every answer,
+                                                                                                       #  or just DAY's) and guesses could have
+                                                                                                       #  produced it, across all CPU cores.
+        group.add_argument(       '--benchmark-scoring',
+                                                   action='store_true',        help=argparse.SUPPRESS) # Print how long scoring a guess takes per
+                                                                                                       #  letter, for word lengths 5 to 15, then
+                                                                                                       #  some far longer (not playable) ones.
+        group.add_argument(       '--build-opening-book',
+                                                   metavar='DEPTH',
+                                                   nargs='?',
+                                                   type=int,
+                                                   const=DEFAULT_BOOK_DEPTH,   help=argparse.SUPPRESS) # Precompute solver's guesses for first DEPTH
+                                                                                                       #  turns (default 2) for stored word lists,
+                                                                                                       #  in both normal and hard mode.
+        group.add_argument(       '--difficulty',  metavar='DAY',
+                                                   nargs='?',
+                                                   const=cls.PLAY_DAILY_TODAY, help=argparse.SUPPRESS) # Print how hard today's (or DAY's) answer is
+                                                                                                       #  compared to other days, without spoiling
+                                                                                                       #  it, working out every day's difficulty
+                                                                                                       #  across all CPU cores if not yet cached.
+        group.add_argument(       '--serve-upstream-fixture',
+                                                   metavar='PORT',
+                                                   nargs='?',
+                                                   type=int,
+                                                   const=0,                    help=argparse.SUPPRESS) # Serve stored word lists from a local stand-in
+                                                                                                       #  for upstream (on PORT, or any free port)
+                                                                                                       #  until interrupted, to download them from
+                                                                                                       #  offline with -D and --upstream-url.
         group.add_argument( '-d', '--play-daily',  metavar='DAY',
                                                    nargs='?',
                                                    default=False,
                                                    const=cls.PLAY_DAILY_TODAY, help= 'Play daily version of game.  Each day has a new answer.  Optionally specify which day\'s game to play.')
+        group.add_argument( '-b', '--boards',      metavar='N',
+                                                   type=int,
+                                                   choices=range(1, MAX_BOARDS+1),
+                                                   default=1,                  help=f'Play N boards at once (up to {MAX_BOARDS}), each with its own answer,'
+                                                                                     ' by making each guess on every board not yet won.  You'
+                                                                                     ' get N-1 more guesses than with a single board.')
+        group.add_argument( '-a', '--adversarial', action='store_true',        help= 'Play against an adversary instead of a fixed answer.  After each guess, it'
+                                                                                     ' shows whichever letter statuses leave the most possible'
+                                                                                     ' answers (out of every valid guess), so the answer is'
+                                                                                     ' only settled when you leave it no choice.')
+        parser.add_argument(      '--upstream-url',
+                                                   metavar='URL',
+                                                   default=UPSTREAM_GAME_URL,  help=argparse.SUPPRESS) # Download word lists from URL instead (see
+                                                                                                       #  --serve-upstream-fixture).
+        parser.add_argument(      '--profile-startup',
+                                                   metavar='MS',
+                                                   nargs='?',
+                                                   type=int,
+                                                   default=False,
+                                                   const=True,                 help=argparse.SUPPRESS) # Start game as usual, but quit as soon as it's
+                                                                                                       #  first painted (without saving anything),
+                                                                                                       #  then print how long each phase of starting
+                                                                                                       #  it took, and exit with status 1 if in total
+                                                                                                       #  that was over MS milliseconds.
 
         return parser
 
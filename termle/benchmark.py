@@ -0,0 +1,91 @@
+# Copyright (c) 2022, cemysce
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import random
+import time
+
+from collections import Counter
+
+from gamecore import LetterStatus, score_guess
+
+# letters that benchmark words are made of, few enough that words repeat
+#  letters (which is what makes scoring quadratic if done naively)
+_LETTERS = 'etaoinshrdlu'
+
+def _quadratic_score_guess(guess_word, answer):
+    # how guesses used to be scored, counting letters over again for every
+    #  position, kept only for comparison
+    correct_letters = [(guess_word[i]
+                        if guess_word[i] == answer[i] else
+                        None)
+                       for i in range(len(answer))]
+    misplaced_letter_counts = Counter()
+    guess_letter_statuses = len(answer)*[None]
+    for i in range(len(answer)):
+        if guess_word[i] == answer[i]:
+            guess_letter_statuses[i] = LetterStatus.RIGHT
+        elif answer.count(guess_word[i]) > (  misplaced_letter_counts[guess_word[i]]
+                                            + correct_letters.count(guess_word[i])):
+            guess_letter_statuses[i] = LetterStatus.MISPLACED
+            misplaced_letter_counts[guess_word[i]]+=1
+        else:
+            guess_letter_statuses[i] = LetterStatus.WRONG
+    return guess_letter_statuses
+
+# each timing is the best of this many runs, to filter out noise from
+#  whatever else the machine is doing
+_REPEATS = 3
+
+def _time_per_letter(score_function, pairs, word_length):
+    best_elapsed = None
+    for _ in range(_REPEATS):
+        start_time = time.perf_counter()
+        for args in pairs:
+            score_function(*args)
+        elapsed = time.perf_counter() - start_time
+        if best_elapsed is None or elapsed < best_elapsed:
+            best_elapsed = elapsed
+    return best_elapsed / (len(pairs)*word_length)
+
+# longest words that can be played (see -w)
+_MAX_PLAYABLE_WORD_LENGTH = 15
+
+# Word lengths benchmarked: every playable one, then some far longer ones.
+#  Counting letters is so cheap next to the rest of scoring a letter that up
+#  to playable lengths the old scoring only costs a constant factor more per
+#  letter, and its quadratic cost only shows as word length grows well past
+#  them.
+_WORD_LENGTHS = (*range(5, _MAX_PLAYABLE_WORD_LENGTH+1), 50, 200, 1000)
+
+def benchmark_scoring(word_lengths=_WORD_LENGTHS, num_letters=30000, seed=0):
+    # Returns {word length: (score_guess() seconds per letter, same for the
+    #  old quadratic scoring)}, scoring the same random (guess, answer)
+    #  pairs both ways, with answer letter counts precomputed as GameCore
+    #  does.  There are as many pairs of each length as add up to about
+    #  num_letters letters, so that longer words don't take longer overall
+    #  (other than for the old scoring growing quadratically).
+    rng = random.Random(seed)
+    results = {}
+    for word_length in word_lengths:
+        pairs = [(''.join(rng.choices(_LETTERS, k=word_length)),
+                  ''.join(rng.choices(_LETTERS, k=word_length)))
+                 for _ in range(max(1, num_letters//word_length))]
+        for (guess, answer) in pairs:
+            assert score_guess(guess, answer) == _quadratic_score_guess(guess, answer)
+        pairs_with_counts = [(guess, answer, Counter(answer))
+                             for (guess, answer) in pairs]
+        results[word_length] = (_time_per_letter(score_guess, pairs_with_counts, word_length),
+                                _time_per_letter(_quadratic_score_guess, pairs, word_length))
+    return results
+
+def print_scoring_benchmark():
+    print('Scoring cost per letter (ns):')
+    print('  Length  Linear  Quadratic')
+    for word_length,(linear, quadratic) in benchmark_scoring().items():
+        print(f'  {word_length:6}  {linear*1e9:6.0f}  {quadratic*1e9:9.0f}', end='')
+        if word_length > _MAX_PLAYABLE_WORD_LENGTH:
+            print('  (longer than playable)', end='')
+        print()
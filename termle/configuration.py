@@ -13,6 +13,7 @@ class Configuration:
     __DEFAULT_HARD_MODE          = False
     __DEFAULT_DARK_MODE          = False
     __DEFAULT_HIGH_CONTRAST_MODE = False
+    __DEFAULT_COMPLETIONS        = False
 
     def __init__(self, file_path):
 
@@ -22,6 +23,7 @@ class Configuration:
         self.hard_mode          = None
         self.dark_mode          = None
         self.high_contrast_mode = None
+        self.completions        = None
 
         if os.path.exists(self.__FILE_PATH):
             self.__read_file()
@@ -30,6 +32,7 @@ class Configuration:
             self.hard_mode          = self.__DEFAULT_HARD_MODE
             self.dark_mode          = self.__DEFAULT_DARK_MODE
             self.high_contrast_mode = self.__DEFAULT_HIGH_CONTRAST_MODE
+            self.completions        = self.__DEFAULT_COMPLETIONS
 
     def __read_file(self):
         with open(self.__FILE_PATH, 'r') as f:
@@ -38,12 +41,14 @@ class Configuration:
         self.hard_mode          = config['hard_mode']          if 'hard_mode'          in config else self.__DEFAULT_HARD_MODE
         self.dark_mode          = config['dark_mode']          if 'dark_mode'          in config else self.__DEFAULT_DARK_MODE
         self.high_contrast_mode = config['high_contrast_mode'] if 'high_contrast_mode' in config else self.__DEFAULT_HIGH_CONTRAST_MODE
+        self.completions        = config['completions']        if 'completions'        in config else self.__DEFAULT_COMPLETIONS
 
     def save(self):
         with open(self.__FILE_PATH, 'w') as f:
             json.dump({'max_guesses':        self.max_guesses,
                        'hard_mode':          self.hard_mode,
                        'dark_mode':          self.dark_mode,
-                       'high_contrast_mode': self.high_contrast_mode},
+                       'high_contrast_mode': self.high_contrast_mode,
+                       'completions':        self.completions},
                       f,
                       indent=4)
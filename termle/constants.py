@@ -11,6 +11,16 @@ GAME_NAME            = 'Termle'
 GAME_NAME_STYLIZED   = ('\u2576\u252c\u2574' ' \u256d\u2500\u2574' ' \u256d\u2500\u256e' ' \u256d\u252c\u256e' ' \u2577  '           ' \u256d\u2500\u2574', #╶┬╴ ╭─╴ ╭─╮ ╭┬╮ ╷   ╭─╴
                              ' \u2502 '      ' \u251c\u2574 '      ' \u251c\u252c\u256f' ' \u2502\u2575\u2502' ' \u2502  '           ' \u251c\u2574 ',      # │  ├╴  ├┬╯ │╵│ │   ├╴
                              ' \u2575 '      ' \u2570\u2500\u2574' ' \u2575\u2570\u2574' ' \u2575 '   '\u2575' ' \u2570\u2500\u2574' ' \u2570\u2500\u2574') # ╵  ╰─╴ ╵╰╴ ╵ ╵ ╰─╴ ╰─╴
+#UPSTREAM_GAME_URL   = 'https://www.powerlanguage.co.uk/wordle' :'(
+UPSTREAM_GAME_URL    = 'https://www.nytimes.com/games/wordle' # where word lists are downloaded from (see -D)
+MAX_BOARDS           = 32 # most boards played at once (see -b)
+DEFAULT_BOOK_DEPTH   = 2 # number of turns covered by an opening book unless otherwise specified (see --build-opening-book)
+STRATEGY_NAMES       = ('first-candidate', 'random-candidate', 'max-entropy') # in order of simulation.STRATEGIES (see --simulate)
 CONFIG_FILENAME      = f'{GAME_NAME.lower()}-config.json'
 DAILY_STATE_FILENAME = f'{GAME_NAME.lower()}-daily-state.json'
 WORDS_FILENAME       = f'{GAME_NAME.lower()}-words.json'
+WORDS_DIGEST_SUFFIX  = '.digest.json' # appended to any JSON word lists file's name, for its cached hash digest (see Words.hash_digest())
+WORDS_HTTP_SUFFIX    = '.http.json' # appended to downloaded word lists file's name, for upstream's validators (see Words.__download_lists_and_write_file())
+PATTERNS_FILENAME    = f'{GAME_NAME.lower()}-patterns-{{digest}}.npy' # formatted with Words.hash_digest()
+BOOK_FILENAME        = f'{GAME_NAME.lower()}-book-{{digest}}-{{mode}}.json' # formatted with Words.hash_digest() and "normal" or "hard"
+DIFFICULTY_FILENAME  = f'{GAME_NAME.lower()}-difficulty-{{digest}}.json' # formatted with Words.hash_digest()
@@ -0,0 +1,164 @@
+# Copyright (c) 2022, cemysce
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import json
+import os
+import random
+
+from collections import Counter, namedtuple
+
+from constants import DIFFICULTY_FILENAME
+from gamecore  import GameCore
+from words     import Words
+
+# How hard one answer is, by how many guesses the reference strategy is
+#  expected to take to get it, how many answers are left on average after its
+#  first guess (i.e. the size of the answer's bucket, so a bigger one is
+#  harder), and how rare its letters are (on average over its distinct
+#  letters, the fraction of answers without that letter).
+AnswerDifficulty = namedtuple('AnswerDifficulty', ('expected_guesses',
+                                                   'first_bucket_size',
+                                                   'letter_rarity'))
+
+# Strategy whose guesses difficulty goes by, played this many times per
+#  answer (each with its own seed), since it guesses at random.  Always
+#  guessing a word that could still be the answer is roughly how people play,
+#  and needs no NumPy, so the index is the same wherever it's built.
+_REFERENCE_STRATEGY = 'random-candidate'
+_PLAYS_PER_ANSWER   = 8
+
+# number of answers handed to a worker process at a time
+_ANSWERS_PER_TASK = 32
+
+# per-process state, set up once by _init_worker() rather than being sent
+#  along with every task
+_worker_lexicon = None
+
+def _init_worker(words_file_path):
+    global _worker_lexicon
+    _worker_lexicon = Words(words_file_path).lexicon()
+
+def _play_answers(answers):
+    # Returns (expected guesses, first bucket size) for each answer, averaged
+    #  over plays.  Each play's random number generator is seeded the same
+    #  for every answer, so every answer gets the same first guesses (which
+    #  also makes them fairer to compare), and answers are played one play at
+    #  a time, so that each first guess is only scored against every answer
+    #  once (see Lexicon.matching_answers()).
+    # (imported here, since daily games import this module to look up a
+    #  cached index, which shouldn't import simulating's dependencies too)
+    from simulation import STRATEGIES
+    strategy = STRATEGIES[_REFERENCE_STRATEGY]
+    total_guesses            = len(answers)*[0]
+    total_first_bucket_sizes = len(answers)*[0]
+    for play in range(_PLAYS_PER_ANSWER):
+        for a_index,answer in enumerate(answers):
+            rng = random.Random(f'difficulty:{play}')
+            # (every guess is a candidate, and so rules itself out if wrong,
+            #  so the game is always won within this many guesses)
+            game_core = GameCore(answer,
+                                 _worker_lexicon,
+                                 len(_worker_lexicon.ANSWERS),
+                                 False)
+            while not game_core.is_won():
+                for l in strategy(game_core, rng):
+                    game_core.append_letter_to_pending_guess(l)
+                game_core.submit_pending_guess()
+                if len(game_core.guesses) == 1:
+                    total_first_bucket_sizes[a_index] += game_core.remaining_answer_count()
+            total_guesses[a_index] += len(game_core.guesses)
+    return [(guesses/_PLAYS_PER_ANSWER, first_bucket_size/_PLAYS_PER_ANSWER)
+            for guesses,first_bucket_size in zip(total_guesses,
+                                                 total_first_bucket_sizes)]
+
+class DifficultyIndex:
+
+    # Difficulty of every day's answer, worked out once for the word lists
+    #  (across all CPU cores) and cached in a file named after their hash
+    #  digest like PatternMatrix's, so that a day's difficulty can be shown
+    #  instantly.  Only ever describes a day's difficulty relative to other
+    #  days, never its answer.
+
+    @classmethod
+    def build(cls, words_file_path, num_processes=None):
+        # (imported here, since daily games look up a cached index, but only
+        #  building one needs it)
+        import multiprocessing
+
+        words = Words(words_file_path)
+        answers = sorted(set(words.all_answers()))
+        letter_answer_counts = Counter(l
+                                       for answer in answers
+                                       for l in set(answer))
+        tasks = [answers[i:i+_ANSWERS_PER_TASK]
+                 for i in range(0, len(answers), _ANSWERS_PER_TASK)]
+        with multiprocessing.Pool(num_processes or os.cpu_count(),
+                                  _init_worker,
+                                  (words_file_path,)) as pool:
+            plays = [play
+                     for results in pool.imap(_play_answers, tasks)
+                     for play in results]
+        answer_difficulties = {}
+        for answer,(expected_guesses, first_bucket_size) in zip(answers, plays):
+            letter_rarity = (sum(1 - letter_answer_counts[l]/len(answers)
+                                 for l in set(answer))
+                             / len(set(answer)))
+            answer_difficulties[answer] = AnswerDifficulty(expected_guesses,
+                                                           first_bucket_size,
+                                                           letter_rarity)
+        return cls(words.hash_digest(),
+                   [answer_difficulties[answer] for answer in words.all_answers()])
+
+    @classmethod
+    def build_cache(cls,
+                    words_file_path,
+                    num_processes=None,
+                    file_path_format=DIFFICULTY_FILENAME):
+        # (written to a temporary file then renamed into place, like
+        #  OpeningBook.build_cache())
+        index = cls.build(words_file_path, num_processes)
+        file_path = file_path_format.format(digest=index.DIGEST)
+        temp_file_path = f'{file_path}.{os.getpid()}.tmp'
+        with open(temp_file_path, 'w') as f:
+            json.dump({'digest': index.DIGEST,
+                       'days':   [list(day) for day in index.__days]},
+                      f,
+                      separators=(',', ':'))
+        os.replace(temp_file_path, file_path)
+        return index
+
+    @classmethod
+    def from_cache(cls, words, file_path_format=DIFFICULTY_FILENAME):
+        # returns None if no index has been built for the current word lists
+        file_path = file_path_format.format(digest=words.hash_digest())
+        if not os.path.exists(file_path):
+            return None
+        with open(file_path, 'r') as f:
+            index = json.load(f)
+        if (   index.get('digest') != words.hash_digest()
+            or len(index.get('days', ())) != len(words.all_answers())):
+            return None
+        return cls(index['digest'],
+                   [AnswerDifficulty(*day) for day in index['days']])
+
+    def __init__(self, digest, days):
+        self.DIGEST = digest
+        self.__days = days # AnswerDifficulty for each entry of answer series, in order
+
+    def day(self, day_offset):
+        return self.__days[day_offset % len(self.__days)]
+
+    def percentile(self, day_offset):
+        # percentage of days in answer series that are easier (i.e. the
+        #  reference strategy expects to take fewer guesses)
+        expected_guesses = self.day(day_offset).expected_guesses
+        return round(100 * sum(day.expected_guesses < expected_guesses
+                               for day in self.__days)
+                         / len(self.__days))
+
+    def describe(self, day_offset):
+        return (f'Harder than {self.percentile(day_offset)}% of days'
+                f' ({self.day(day_offset).expected_guesses:.1f} guesses expected)')
@@ -4,10 +4,12 @@
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
 
+import copy
 import enum
-import itertools
 
-from collections import Counter
+from collections import Counter, namedtuple
+
+from lexicon import Lexicon
 
 class LetterStatus(enum.Enum):
     # This is deliberately defined in order from most right to most wrong,
@@ -26,8 +28,140 @@ class GuessResult(enum.Enum):
     INVALID                                               = 'invalid'
     INVALID_TOO_SHORT                                     = 'invalid_short'
 
+# Each letter status as a base-3 digit, so that all of a guess's letter
+#  statuses can be packed into a single integer "pattern code".  The first
+#  letter is the most significant digit, so for example an entirely right
+#  5-letter guess is 22222 in base 3 (i.e. 3**5-1).
+PATTERN_CODE_DIGITS = {LetterStatus.WRONG:     0,
+                       LetterStatus.MISPLACED: 1,
+                       LetterStatus.RIGHT:     2}
+
+def pattern_code(letter_statuses):
+    code = 0
+    for s in letter_statuses:
+        code = code*3 + PATTERN_CODE_DIGITS[s]
+    return code
+
+def letter_statuses_from_pattern_code(code, word_length):
+    statuses_by_digit = {d: s for s,d in PATTERN_CODE_DIGITS.items()}
+    letter_statuses = word_length*[None]
+    for i in reversed(range(word_length)):
+        (code, digit) = divmod(code, 3)
+        letter_statuses[i] = statuses_by_digit[digit]
+    return letter_statuses
+
+_WRONG_DIGIT              = PATTERN_CODE_DIGITS[LetterStatus.WRONG]
+_MISPLACED_DIGIT          = PATTERN_CODE_DIGITS[LetterStatus.MISPLACED]
+_RIGHT_DIGIT              = PATTERN_CODE_DIGITS[LetterStatus.RIGHT]
+_LETTER_STATUSES_BY_DIGIT = tuple(sorted(PATTERN_CODE_DIGITS, key=PATTERN_CODE_DIGITS.get))
+
+def score_guess_digits(guess_word, answer, answer_letter_counts=None):
+    # A guess letter is misplaced only while the answer has more of that letter
+    #  than are accounted for by right letters (anywhere in the guess) plus
+    #  earlier misplaced letters.  So starting from the answer's letter counts
+    #  (precomputed by caller if scoring many guesses against the same
+    #  answer), take away every right letter, then each misplaced letter as
+    #  it's found, which is linear in word length.
+    # Gives each letter status as its pattern code digit, which unlike a
+    #  LetterStatus is quick to hash and compare, for scoring in bulk.
+    if answer_letter_counts is None:
+        answer_letter_counts = Counter(answer)
+    unaccounted_letter_counts = dict(answer_letter_counts)
+    for g,a in zip(guess_word, answer):
+        if g == a:
+            unaccounted_letter_counts[g] -= 1
+    guess_digits = len(answer)*[_WRONG_DIGIT]
+    for i,(g,a) in enumerate(zip(guess_word, answer)):
+        if g == a:
+            guess_digits[i] = _RIGHT_DIGIT
+        elif unaccounted_letter_counts.get(g, 0) > 0:
+            guess_digits[i] = _MISPLACED_DIGIT
+            unaccounted_letter_counts[g] -= 1
+    return guess_digits
+
+def score_guess(guess_word, answer, answer_letter_counts=None):
+    return [_LETTER_STATUSES_BY_DIGIT[d]
+            for d in score_guess_digits(guess_word, answer, answer_letter_counts)]
+
+# a submitted guess (immutable, so it can be shared between forked games)
+Guess = namedtuple('Guess', ('word', 'letter_statuses'))
+
+# All game state resulting from guesses, each one immutable and linked to the
+#  state before its latest guess, so game states can be snapshotted, forked
+#  and undone without copying anything.
+GameState = namedtuple('GameState', ('parent',
+                                     'guesses',
+                                     'remaining_candidates',
+                                     'best_letter_statuses',
+                                     'hard_mode_constraints'))
+
+class HardModeConstraints:
+
+    def __init__(self):
+        self.__right_letters     = {}        # position -> letter
+        self.__min_letter_counts = Counter() # letter -> min occurrences
+
+    def with_guess(self, guess_word, letter_statuses):
+        # Right letters are pinned to their positions, and every revealed
+        #  letter (right or misplaced) must be reused at least as many times
+        #  as it was revealed in any single guess.
+        # (returns new constraints, leaving these ones unchanged)
+        constraints = HardModeConstraints()
+        constraints.__right_letters     = self.__right_letters.copy()
+        constraints.__min_letter_counts = self.__min_letter_counts.copy()
+        revealed_letter_counts = Counter()
+        for i,(l,s) in enumerate(zip(guess_word, letter_statuses)):
+            if s == LetterStatus.RIGHT:
+                constraints.__right_letters[i] = l
+            if s != LetterStatus.WRONG:
+                revealed_letter_counts[l] += 1
+        for l,count in revealed_letter_counts.items():
+            constraints.__min_letter_counts[l] = max(constraints.__min_letter_counts[l],
+                                                     count)
+        return constraints
+
+    def check(self, guess_word):
+        # Prefer reporting a missing right letter (along with its position)
+        #  over a missing misplaced letter (along with how many times it must
+        #  be used, since a guess can use it, just not enough times), and each
+        #  of those in order of position/first appearance.
+        for i,l in sorted(self.__right_letters.items()):
+            if guess_word[i] != l:
+                return (GuessResult.INVALID_HARD_MODE_MISSING_PREV_GUESS_CORRECT_LETTER,
+                        l,
+                        i)
+        for l,count in self.__min_letter_counts.items():
+            if guess_word.count(l) < count:
+                return (GuessResult.INVALID_HARD_MODE_MISSING_PREV_GUESS_MISPLACED_LETTER,
+                        l,
+                        count)
+        return None
+
+    def filter(self, guess_index):
+        return guess_index.matching(self.__right_letters,
+                                    self.__min_letter_counts)
+
+    def filter_bits(self, guess_index):
+        return guess_index.matching_bits(self.__right_letters,
+                                         self.__min_letter_counts)
+
+    # (equal constraints allow exactly the same guesses, however they came
+    #  about, so searches over guess sequences can treat them as one)
+    def __key(self):
+        return (frozenset(self.__right_letters.items()),
+                frozenset(self.__min_letter_counts.items()))
+
+    def __eq__(self, other):
+        return isinstance(other, HardModeConstraints) and self.__key() == other.__key()
+
+    def __hash__(self):
+        return hash(self.__key())
+
 class GameCore:
 
+    # lower rank is more right (see comment in LetterStatus definition)
+    __LETTER_STATUS_RANKS = {s: r for r,s in enumerate(LetterStatus)}
+
     def __init__(self,
                  answer,
                  valid_guesses,
@@ -35,10 +169,27 @@ class GameCore:
                  hard_mode,
                  play_stats=None,
                  init_guesses=[],
-                 init_pending_guess_letters=[]):
+                 init_pending_guess_letters=[],
+                 candidate_answers=None,
+                 adversary=None):
+
+        # Valid guesses are either a Lexicon (already validated and shared by
+        #  reference, in which case it also provides the candidate answers),
+        #  or any iterable of words, which are validated into a new Lexicon
+        #  along with any specified candidate answers.
+        if isinstance(valid_guesses, Lexicon):
+            assert candidate_answers is None
+            lexicon = valid_guesses
+        else:
+            lexicon = Lexicon(candidate_answers or [], valid_guesses)
+
+        # There's either an answer or an adversary (see Adversary) which
+        #  picks letter statuses for each guess from the candidate answers
+        #  (for which it must be using the same Lexicon), in place of one.
+        assert (answer is None) != (adversary is None)
 
         # calculate word length
-        word_length = len(answer)
+        word_length = lexicon.WORD_LENGTH if answer is None else len(answer)
 
         # assert that word length meets minimum requirement
         assert word_length > 0
@@ -46,10 +197,10 @@ class GameCore:
         # assert that all characters are alphabetic
         #  and that all words have same length as answer
         #  and that each pending guess letter is exactly 1 character
-        assert answer.isalpha()
+        assert answer is None or answer.isalpha()
+        assert lexicon.WORD_LENGTH == word_length
         assert all(guess.isalpha() and len(guess) == word_length
-                   for guess in itertools.chain(valid_guesses,
-                                                init_guesses))
+                   for guess in init_guesses)
         assert all(l.isalpha() and len(l) == 1
                    for l in init_pending_guess_letters)
 
@@ -60,33 +211,87 @@ class GameCore:
                 <= max_guesses)
 
         # normalize all characters to lowercase
-        answer_lower = answer.lower()
-        valid_guesses_lower = {valid_guess.lower()
-                               for valid_guess in valid_guesses}
+        answer_lower = None if answer is None else answer.lower()
         init_guesses_lower = [init_guess.lower()
                               for init_guess in init_guesses]
         init_pending_guess_letters_lower = [l.lower()
                                             for l in init_pending_guess_letters]
 
-        # assert that answer is within list of valid guesses
-        #  and is not among any of initial guesses (other than last guess)
-        assert answer_lower in valid_guesses_lower
-        assert answer_lower not in init_guesses[:-1]
+        # assert that answer is within list of valid guesses (and of candidate
+        #  answers, if any) and is not among any of initial guesses (other
+        #  than last guess)
+        #  (an answer among the candidate answers is always a valid guess, so
+        #  then there's no need to look it up among the valid guesses, which
+        #  the lexicon may not even have loaded yet)
+        if answer is not None:
+            assert (lexicon.is_answer(answer_lower)
+                    if lexicon.ANSWERS else
+                    lexicon.is_valid_guess(answer_lower))
+            assert answer_lower not in init_guesses[:-1]
 
         # game parameters
-        self.__ANSWER        = answer_lower
-        self.__VALID_GUESSES = valid_guesses_lower
-        self.WORD_LENGTH     = word_length
-        self.MAX_GUESSES     = max_guesses
-        self.HARD_MODE       = hard_mode
+        self.__ANSWER    = answer_lower
+        self.__ADVERSARY = adversary
+        self.__LEXICON   = lexicon
+        self.WORD_LENGTH = word_length
+        self.MAX_GUESSES = max_guesses
+        self.HARD_MODE   = hard_mode
+
+        # answer's letter counts, for scoring guesses (see score_guess())
+        self.__ANSWER_LETTER_COUNTS = None if answer is None else Counter(answer_lower)
+
+        # candidate answers (i.e. all answers that could have been chosen)
+        #  are tracked as a bitset over their indices, narrowed by each guess
+        self.__CANDIDATE_ANSWERS = lexicon.ANSWERS or None
 
         # game state
         self.play_stats            = play_stats
-        self.guesses               = []
+        self.guesses               = None # set along with game state, below
         self.pending_guess_letters = init_pending_guess_letters_lower
+        self.__state               = None
+        self.__set_state(GameState(parent=None,
+                                   guesses=(),
+                                   remaining_candidates=(None
+                                                         if self.__CANDIDATE_ANSWERS is None else
+                                                         (1 << len(self.__CANDIDATE_ANSWERS)) - 1),
+                                   best_letter_statuses={}, # most right status of each guessed letter
+                                   hard_mode_constraints=HardModeConstraints()))
         for guess_word in init_guesses_lower:
             self.__ingest_guess(guess_word)
 
+    def __set_state(self, state):
+        self.__state = state
+        self.guesses = state.guesses
+
+    def snapshot(self):
+        return (self.__state, tuple(self.pending_guess_letters))
+
+    def restore(self, snapshot):
+        (state, pending_guess_letters) = snapshot
+        self.__set_state(state)
+        self.pending_guess_letters = list(pending_guess_letters)
+
+    def fork(self):
+        # Game parameters (including word lists) and game state are shared
+        #  with the new game, since neither is ever modified in place, so
+        #  only pending guess letters need copying.  The new game never
+        #  registers wins or losses in this game's play stats.
+        forked = copy.copy(self)
+        forked.play_stats            = None
+        forked.pending_guess_letters = self.pending_guess_letters[:] # shallow copy the list (each element is immutable so no need to deep copy)
+        return forked
+
+    def undo(self):
+        # undo last pending guess letter if any, otherwise undo last guess,
+        #  but only if not tracking play stats (which would already count
+        #  the guess if it completed the game)
+        if self.pending_guess_letters:
+            return self.remove_last_letter_from_pending_guess()
+        if self.__state.parent is None or self.play_stats is not None:
+            return False
+        self.__set_state(self.__state.parent)
+        return True
+
     def change_max_guesses(self, max_guesses):
         if max_guesses < len(self.guesses)+1:
             return False
@@ -102,16 +307,12 @@ class GameCore:
         self.HARD_MODE = hard_mode
         return True
 
+    def boards(self):
+        # (a single board, see MultiGameCore)
+        return (self,)
+
     def letter_status(self, l):
-        l = l.lower()
-        statuses = {guess['letter_statuses'][i]
-                    for guess in self.guesses
-                    for i in range(self.WORD_LENGTH)
-                    if guess['word'][i]==l}
-        for s in LetterStatus:
-            if s in statuses:
-                return s
-        return None
+        return self.__state.best_letter_statuses.get(l.lower())
 
     def is_started(self):
         return len(self.guesses)>0
@@ -119,7 +320,7 @@ class GameCore:
     def is_won(self):
         return (    len(self.guesses) > 0
                 and all(s == LetterStatus.RIGHT
-                        for s in self.guesses[-1]['letter_statuses']))
+                        for s in self.guesses[-1].letter_statuses))
 
     def is_lost(self):
         return len(self.guesses) == self.MAX_GUESSES and not self.is_won()
@@ -145,56 +346,121 @@ class GameCore:
         self.pending_guess_letters.pop()
         return True
 
+    def pending_guess_is_prefix(self):
+        # whether pending guess letters can still be the start of a valid
+        #  guess, so that a dead end can be shown as soon as it's typed rather
+        #  than only once the guess is submitted
+        return self.__LEXICON.prefix_index().is_prefix(''.join(self.pending_guess_letters))
+
+    def pending_guess_completions(self, limit):
+        # up to limit valid guesses starting with pending guess letters, those
+        #  that could still be the answer first
+        return self.__LEXICON.prefix_index().completions(''.join(self.pending_guess_letters),
+                                                         limit,
+                                                         self.could_be_answer)
+
     def __ingest_guess(self, guess_word):
-        latest_guess_correct_letters = [(guess_word[i]
-                                         if guess_word[i] == self.__ANSWER[i] else
-                                         None)
-                                        for i in range(self.WORD_LENGTH)]
-        latest_guess_misplaced_letter_counts = Counter()
-        guess_letter_statuses = self.WORD_LENGTH*[None]
-        for i in range(self.WORD_LENGTH):
-            if guess_word[i] == self.__ANSWER[i]:
-                guess_letter_statuses[i] = LetterStatus.RIGHT
-            elif self.__ANSWER.count(guess_word[i]) > (  latest_guess_misplaced_letter_counts[guess_word[i]]
-                                                       + latest_guess_correct_letters.count(guess_word[i])):
-                guess_letter_statuses[i] = LetterStatus.MISPLACED
-                latest_guess_misplaced_letter_counts[guess_word[i]]+=1
-            else:
-                guess_letter_statuses[i] = LetterStatus.WRONG
-        self.guesses.append({'word':            guess_word,
-                             'letter_statuses': guess_letter_statuses})
+        if self.__ADVERSARY is None:
+            guess_letter_statuses = score_guess(guess_word,
+                                                self.__ANSWER,
+                                                self.__ANSWER_LETTER_COUNTS)
+            adversary_candidates  = None
+        else:
+            (guess_letter_statuses,
+             adversary_candidates) = self.__ADVERSARY.respond(guess_word,
+                                                              self.__state.remaining_candidates)
+        guess = Guess(guess_word, tuple(guess_letter_statuses))
+
+        # accumulate constraints that hard mode places on subsequent guesses
+        hard_mode_constraints = self.__state.hard_mode_constraints.with_guess(guess_word,
+                                                                              guess_letter_statuses)
+
+        # keep each letter's most right status so far, for letter_status()
+        best_letter_statuses = self.__state.best_letter_statuses.copy()
+        for l,s in zip(guess_word, guess_letter_statuses):
+            best = best_letter_statuses.get(l)
+            if best is None or self.__LETTER_STATUS_RANKS[s] < self.__LETTER_STATUS_RANKS[best]:
+                best_letter_statuses[l] = s
+
+        # narrow down remaining candidate answers to those which would have
+        #  given this guess the same letter statuses (see
+        #  Lexicon.matching_answers()), unless the adversary already has
+        remaining_candidates = self.__state.remaining_candidates
+        if adversary_candidates is not None:
+            remaining_candidates = adversary_candidates
+        elif self.__CANDIDATE_ANSWERS is not None:
+            candidate_letter_counts = self.__LEXICON.answer_letter_counts()
+            def candidate_digits(guess_word, i):
+                return tuple(score_guess_digits(guess_word,
+                                                self.__CANDIDATE_ANSWERS[i],
+                                                candidate_letter_counts[i]))
+            remaining_candidates = self.__LEXICON.matching_answers(guess_word,
+                                                                   tuple(PATTERN_CODE_DIGITS[s]
+                                                                         for s in guess_letter_statuses),
+                                                                   remaining_candidates,
+                                                                   candidate_digits)
+
+        self.__set_state(GameState(parent=self.__state,
+                                   guesses=self.__state.guesses + (guess,),
+                                   remaining_candidates=remaining_candidates,
+                                   best_letter_statuses=best_letter_statuses,
+                                   hard_mode_constraints=hard_mode_constraints))
+
+    def __candidate_indices(self):
+        remaining_candidates = self.__state.remaining_candidates
+        while remaining_candidates:
+            lowest_bit = remaining_candidates & -remaining_candidates
+            yield lowest_bit.bit_length() - 1
+            remaining_candidates ^= lowest_bit
+
+    def remaining_answer_count(self):
+        if self.__CANDIDATE_ANSWERS is None:
+            return None
+        return bin(self.__state.remaining_candidates).count('1')
+
+    def could_be_answer(self, word):
+        # (a single bit test, rather than a search of remaining answers)
+        if self.__CANDIDATE_ANSWERS is None:
+            return False
+        i = self.__LEXICON.answer_index(word)
+        return i is not None and bool(self.__state.remaining_candidates >> i & 1)
+
+    def remaining_answers(self):
+        if self.__CANDIDATE_ANSWERS is None:
+            return None
+        return [self.__CANDIDATE_ANSWERS[i] for i in self.__candidate_indices()]
+
+    def hard_mode_legal_guesses(self):
+        # all valid guesses that hard mode would currently accept (whether or
+        #  not hard mode is actually enabled)
+        return self.__state.hard_mode_constraints.filter(self.__LEXICON.guess_index())
 
     def answer(self):
         if self.is_completed():
+            if self.__ADVERSARY is not None:
+                # (whatever the adversary was left with, if it had to settle)
+                return self.remaining_answers()[0]
             return self.__ANSWER
         return None
 
+    def check_guess(self, guess_word):
+        # returns same as submit_pending_guess() would if guess is invalid,
+        #  otherwise None
+        if len(guess_word) < self.WORD_LENGTH:
+            return (GuessResult.INVALID_TOO_SHORT, None, None)
+        if not self.__LEXICON.is_valid_guess(guess_word):
+            return (GuessResult.INVALID, None, None)
+        if self.HARD_MODE:
+            return self.__state.hard_mode_constraints.check(guess_word)
+        return None
+
     def submit_pending_guess(self):
         guess_word = ''.join(self.pending_guess_letters)
 
         # check for cases of invalidity
-        if len(guess_word) < self.WORD_LENGTH:
-            return (GuessResult.INVALID_TOO_SHORT, None, None)
-        if guess_word not in self.__VALID_GUESSES:
-            return (GuessResult.INVALID, None, None)
-        if self.HARD_MODE and len(self.guesses)>0:
-            # first check if any previous correct letters are not in same spot in new guess:
-            for i,(l,s) in enumerate(zip(self.guesses[-1]['word'],
-                                         self.guesses[-1]['letter_statuses'])):
-                if s == LetterStatus.RIGHT and guess_word[i] != l:
-                    return (GuessResult.INVALID_HARD_MODE_MISSING_PREV_GUESS_CORRECT_LETTER,
-                            l,
-                            i)
-            # *then* check if any previous misplaced letters are not in new guess:
-            #  (yes it's the same loop parameters as above, but we need to
-            #   prefer the missing correct letter status over the missing
-            #   misplaced letter status)
-            for i,(l,s) in enumerate(zip(self.guesses[-1]['word'],
-                                         self.guesses[-1]['letter_statuses'])):
-                if s == LetterStatus.MISPLACED and l not in guess_word:
-                    return (GuessResult.INVALID_HARD_MODE_MISSING_PREV_GUESS_MISPLACED_LETTER,
-                            l,
-                            None)
+        invalidity = self.check_guess(guess_word)
+        if invalidity is not None:
+            return invalidity
 
         # update internal state
         self.pending_guess_letters.clear()
@@ -74,6 +74,8 @@ class Colors:
                    f'border_{LetterStatus.MISPLACED.value}': (LetterStatus.MISPLACED.value, 'background'),
                    f'border_{LetterStatus.RIGHT.value}':     (LetterStatus.RIGHT.value,     'background'),
                     'letter_unsubmitted':                    ('letter_unsubmitted',         'background'),
+                    'border_dead':                           ('border_blank',               'background'),
+                    'letter_dead':                           ('subtext',                    'background'),
                     'unguessed':                             ('letter_unsubmitted',         'unguessed'),
                    f'letter_{LetterStatus.WRONG.value}':     ('letter_submitted',           LetterStatus.WRONG.value),
                    f'letter_{LetterStatus.MISPLACED.value}': ('letter_submitted',           LetterStatus.MISPLACED.value),
@@ -16,11 +16,20 @@ from .panels.main import MainPanel
 
 class Graphics:
 
-    def __init__(self, game_core, config, game_num_str=None):
+    def __init__(self,
+                 game_core,
+                 config,
+                 game_num_str=None,
+                 hinter=None,
+                 difficulty=None,
+                 startup_profile=None):
 
-        self.__game_core    = game_core
-        self.__config       = config
-        self.__game_num_str = game_num_str
+        self.__game_core       = game_core
+        self.__config          = config
+        self.__game_num_str    = game_num_str
+        self.__hinter          = hinter
+        self.__difficulty      = difficulty
+        self.__startup_profile = startup_profile
 
         # values to be initialized later
         self.__stdscr = None
@@ -47,7 +56,10 @@ class Graphics:
                                self.__colors,
                                self.__game_core,
                                self.__config,
-                               self.__game_num_str)
+                               self.__game_num_str,
+                               self.__hinter,
+                               self.__difficulty,
+                               self.__startup_profile)
         main_panel.run(height=0,
                        width=0,
                        start_y=0,
@@ -0,0 +1,202 @@
+# Copyright (c) 2022, cemysce
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import curses
+
+from ..           import glyphs
+from ..exceptions import WindowResized
+from ..modalpanel import ModalPanel
+
+class AnalysisPanel(ModalPanel):
+
+    __ARROW = '\u2192' # →
+
+    __POLL_MSEC = 100 # delay in milliseconds between checks for analysis being ready
+
+    def __init__(self,
+                 stdscr,
+                 colors,
+                 game_core,
+                 hinter):
+        super().__init__(stdscr, colors)
+        self.__closing                    = None
+        self.__game_core                  = game_core
+        self.__hinter                     = hinter
+        self.__min_required_screen_height = None
+        self.__min_required_screen_width  = None
+
+    def __init_size_calculations(self):
+
+        top_padding_height = 1
+
+        self.__close_button_y = 0 + top_padding_height
+        self.__close_button_height = 1
+        self.__close_button_width = 1
+        close_button_right_gap = 2
+
+        self.__heading = 'ANALYSIS'
+        self.__heading_y = self.__close_button_y + self.__close_button_height
+        heading_height = 1
+        heading_width = len(self.__heading)
+
+        post_heading_gap_height = 1
+
+        # column widths are known before the analysis is, since they only
+        #  depend on the number of guesses, word length and number of answers
+        #  (which is however many remained before the first guess)
+        first_turn = self.__game_core.fork()
+        while first_turn.undo():
+            pass
+        num_answers_len = len(str(first_turn.remaining_answer_count() or 0))
+        word_length = self.__game_core.WORD_LENGTH
+        self.__column_headings = ('#', 'GUESS', 'ANSWERS LEFT', 'BEST GUESS')
+        self.__column_widths = tuple(max(len(heading), content_width)
+                                     for heading,content_width
+                                      in zip(self.__column_headings,
+                                             (len(str(self.__game_core.MAX_GUESSES)),
+                                              word_length,
+                                              2*num_answers_len + 2 + len(self.__ARROW),
+                                              word_length + 2 + len(self.__ARROW) + num_answers_len)))
+        self.__num_answers_len = num_answers_len
+        inter_column_gap_width = 2
+        self.__inter_column_gap = inter_column_gap_width*' '
+        table_width = sum(self.__column_widths) + inter_column_gap_width*(len(self.__column_widths)-1)
+
+        self.__column_headings_y = self.__heading_y + heading_height + post_heading_gap_height
+        column_headings_height = 1
+        self.__rows_start_y = self.__column_headings_y + column_headings_height
+        rows_height = max(1, len(self.__game_core.guesses))
+
+        self.__pending_str = 'Analyzing...'
+
+        bottom_padding_height = top_padding_height
+
+        left_right_padding_width = 3
+
+        total_height = self.__rows_start_y + rows_height + bottom_padding_height
+        total_width = (  max(heading_width, table_width, len(self.__pending_str))
+                       + 2*left_right_padding_width)
+
+        self.__close_button_x = total_width - close_button_right_gap - self.__close_button_width
+        self.__heading_x = (total_width-heading_width)//2
+        self.__table_start_x = (total_width-table_width)//2
+        self.__pending_x = (total_width-len(self.__pending_str))//2
+
+        return (total_height, total_width)
+
+    def __close(self):
+        self.__closing = True
+
+    def __draw_close_button(self):
+        self._win.addstr(self.__close_button_y,
+                         self.__close_button_x,
+                         glyphs.X_BUTTON, # 🞩
+                         self._colors.attr('header_button'))
+        self._input.add_to_click_map(self.__close_button_y,
+                                     self.__close_button_x,
+                                     self.__close_button_height,
+                                     self.__close_button_width,
+                                     self.__close)
+
+    def __draw_heading(self):
+        self._win.addstr(self.__heading_y,
+                         self.__heading_x,
+                         self.__heading,
+                         curses.A_BOLD|self._colors.attr('text_default'))
+        self._win.addstr(self.__column_headings_y,
+                         self.__table_start_x,
+                         self.__inter_column_gap.join(heading.ljust(width)
+                                                      for heading,width
+                                                       in zip(self.__column_headings,
+                                                              self.__column_widths)),
+                         self._colors.attr('subtext'))
+
+    def __draw_rows(self):
+        analyses = self.__hinter.analysis(self.__game_core)
+        if analyses is None:
+            self._win.addstr(self.__rows_start_y,
+                             self.__pending_x,
+                             self.__pending_str,
+                             self._colors.attr('text_default'))
+            return
+        self._win.addstr(self.__rows_start_y,
+                         self.__pending_x,
+                         len(self.__pending_str)*' ',
+                         self._colors.attr('background'))
+        n = self.__num_answers_len
+        for y_offset,analysis in enumerate(analyses):
+            if analysis.best_guess is None:
+                best = ''
+            elif analysis.best_remaining_after is None:
+                best = analysis.best_guess.upper()
+            else:
+                best = f'{analysis.best_guess.upper()} {self.__ARROW} {analysis.best_remaining_after}'
+            columns = (str(y_offset+1),
+                       analysis.word.upper(),
+                       f'{analysis.remaining_before:>{n}} {self.__ARROW} {analysis.remaining_after}',
+                       best)
+            self._win.addstr(self.__rows_start_y+y_offset,
+                             self.__table_start_x,
+                             self.__inter_column_gap.join(column.ljust(width)
+                                                          for column,width
+                                                           in zip(columns,
+                                                                  self.__column_widths)),
+                             (curses.A_BOLD
+                              if analysis.word == analysis.best_guess else
+                              0)|self._colors.attr('text_default'))
+
+    def __poll(self):
+        if self.__hinter.analysis(self.__game_core) is not None:
+            self._input.set_blocking()
+            self.__draw_rows()
+        elif not self.__hinter.is_analysis_pending(self.__game_core):
+            # (hinter may have been busy with a hint when first requested)
+            self.__hinter.request_analysis(self.__game_core)
+
+    def _run(self):
+
+        # set background
+        self._win.bkgd(self._colors.attr('background'))
+
+        self.__draw_close_button()
+        self.__draw_heading()
+        self.__draw_rows()
+        self._input.add_default_to_click_map(self.__close)
+
+        # some init
+        self.__closing = False
+
+        # event loop (analysis is worked out in the background, so keep
+        #  checking for it, while still letting player close the panel)
+        if self.__hinter.analysis(self.__game_core) is None:
+            self.__hinter.request_analysis(self.__game_core)
+            self._input.set_non_blocking(self.__POLL_MSEC, self.__poll)
+        while not self.__closing:
+            k = self._input.get(self.__min_required_screen_height,
+                                self.__min_required_screen_width)
+            if k == '~': break
+
+    def run(self,
+            parent_min_required_total_height,
+            parent_min_required_total_width):
+        (panel_height, panel_width) = self.__init_size_calculations()
+        (screen_rows, screen_cols) = self._stdscr.getmaxyx()
+
+        self.__min_required_screen_height = max(panel_height, parent_min_required_total_height)
+        self.__min_required_screen_width  = max(panel_width,  parent_min_required_total_width)
+
+        if screen_rows < self.__min_required_screen_height or screen_cols < self.__min_required_screen_width:
+            raise WindowResized(screen_rows,
+                                screen_cols,
+                                self.__min_required_screen_height,
+                                self.__min_required_screen_width,
+                                self.__class__.__name__)
+        start_y = (screen_rows-panel_height)//2
+        start_x = (screen_cols-panel_width)//2
+        super().run(panel_height,
+                    panel_width,
+                    start_y,
+                    start_x)
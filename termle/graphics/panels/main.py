@@ -9,18 +9,19 @@ import _curses
 import curses.panel
 import math
 
-from constants       import GAME_NAME_STYLIZED
-from gamecore        import LetterStatus, GuessResult
-from shareablestatus import ShareableStatus
+from constants import GAME_NAME_STYLIZED
+from gamecore  import LetterStatus, GuessResult
 
 from ..           import glyphs
 from ..exceptions import WindowResized
 from ..modalpanel import ModalPanel
 
-from .help      import HelpPanel
-from .playstats import PlayStatsPanel
-from .settings  import SettingsPanel
-from .toast     import Toast
+from .toast import Toast
+
+# NOTE: The other panels (and what only they use, e.g. ShareableStatus, which
+#        needs subprocess) are imported when first opened rather than up
+#        front, since the game often starts without ever opening them, and
+#        importing them would only delay its first paint.
 
 class MainPanel(ModalPanel):
 
@@ -41,6 +42,10 @@ class MainPanel(ModalPanel):
     #       - 'blank' ───────────────▷ all characters:    'border_blank'
     #       - 'unsubmitted' ────────┬▷ letter character:  'letter_unsubmitted'
     #                               └▷ border characters: 'border_unsubmitted'
+    #       - 'dead' ───────────────┬▷ letter character:  'letter_dead'
+    #          (drawn with the      └▷ border characters: 'border_dead'
+    #           'unsubmitted' tile, for pending letters that can't become a
+    #           valid guess)
     #       - 'blink' ───────────────▷ all characters:    'border_unsubmitted'
     #       - LetterStatus.*.value ─┬▷ if all border chars are spaces:
     #                               │   │(see (*) for explanation)
@@ -74,6 +79,12 @@ class MainPanel(ModalPanel):
                     LetterStatus.WRONG.value:     (' A ',               ), #  A  ⎫ When rendered, these will look
                     LetterStatus.MISPLACED.value: (' A ',               ), #  A  ⎬  similar to █A█ but with letter
                     LetterStatus.RIGHT.value:     (' A ',               )} #  A  ⎭  filled in.  See (*) below.
+    __TILE_TINY = {'blank':                      ('_',     ), # _
+                   'unsubmitted':                ('A',     ), # A
+                   'blink':                      ('\u2500',), # ─
+                   LetterStatus.WRONG.value:     ('A',     ), # A ⎫ Only used for multiple boards, if small
+                   LetterStatus.MISPLACED.value: ('A',     ), # A ⎬  tiles don't fit.  Letter bg color
+                   LetterStatus.RIGHT.value:     ('A',     )} # A ⎭  alone shows letter status.
     # Some other borders considered, for reference:
     #   Width 1:
     #     '\u2395'             ⎕
@@ -96,9 +107,22 @@ class MainPanel(ModalPanel):
     __TILES_NORMAL_GAP_Y = 0 # blank lines between rows of normal tiles
     __TILES_SMALL_GAP_X  = 1 # spaces between horizontally adjacent small tiles
     __TILES_SMALL_GAP_Y  = 1 # blank lines between rows of small tiles
+    __TILES_TINY_GAP_X   = 1 # spaces between horizontally adjacent tiny tiles
+    __TILES_TINY_GAP_Y   = 0 # blank lines between rows of tiny tiles
+    #
+    __BOARDS_GAP_X = 3 # spaces between horizontally adjacent boards (if multiple)
+    __BOARDS_GAP_Y = 1 # blank lines between rows of boards (if multiple)
     #
     __TILE_FLIP_DELAY_MSEC = 400 # delay in milliseconds between each tile flip
     #
+    __UNDO_KEY     = '\x15' # Ctrl+U (not Ctrl+Z, which would suspend the program)
+    __HINT_KEY     = '\t'   # Tab (while game is in progress)
+    __ANALYSIS_KEY = '\t'   # Tab (once game is over)
+    #
+    __HINT_POLL_MSEC = 100 # delay in milliseconds between checks for a hint being ready
+    #
+    __MAX_COMPLETIONS = 5 # most word completions to show while typing (if enabled in settings)
+    #
     __KB_KEY_STD_WIDTH     = 3                    # ideally an odd number
     __KB_KEY_SPECIAL_WIDTH = __KB_KEY_STD_WIDTH+2 # ideally an odd number
     __KB_ROW_HEIGHT        = 1                    # ideally an odd number
@@ -140,7 +164,8 @@ class MainPanel(ModalPanel):
                                           ('M',                  'm',             __KB_KEY_STD_WIDTH),
                                           (glyphs.BACKSPACE_KEY, 'KEY_BACKSPACE', __KB_KEY_SPECIAL_WIDTH)]}]
     #
-    __ORDINALS = ('1st', '2nd', '3rd', '4th', '5th')
+    __ORDINALS = ('1st', '2nd', '3rd', '4th', '5th', '6th', '7th', '8th',
+                  '9th', '10th', '11th', '12th', '13th', '14th', '15th')
     __CONGRATULATORY_TOASTS = ['Genius',
                                'Magnificent',
                                'Impressive',
@@ -153,13 +178,20 @@ class MainPanel(ModalPanel):
                  colors,
                  game_core,
                  config,
-                 game_num_str=None):
+                 game_num_str=None,
+                 hinter=None,
+                 difficulty=None,
+                 startup_profile=None):
 
         super().__init__(stdscr, colors)
 
         self.__game_core                               = game_core
+        self.__boards                                  = game_core.boards()
         self.__config                                  = config
         self.__game_num_str                            = game_num_str
+        self.__hinter                                  = hinter
+        self.__difficulty                              = difficulty # description of daily answer's difficulty, if known (see DifficultyIndex)
+        self.__startup_profile                         = startup_profile # if only profiling startup (see StartupProfile)
         self.__header_start_y                          = None
         self.__header_start_x                          = None
         self.__header_height                           = None
@@ -170,6 +202,7 @@ class MainPanel(ModalPanel):
         self.__active_tile_def                         = None
         self.__tiles_y                                 = None
         self.__tiles_x                                 = None
+        self.__boards_yx                               = None
         self.__use_letter_status_color_for_entire_tile = None
         self.__kb_start_y                              = None
         self.__kb_start_x                              = None
@@ -247,11 +280,57 @@ class MainPanel(ModalPanel):
         assert tile_normal_width         >= tile_small_width
         assert tiles_normal_total_height >= tiles_small_total_height
         assert tiles_normal_total_width  >= tiles_small_total_width
+        tile_specs = [(self.__TILE_NORMAL,
+                       self.__TILES_NORMAL_GAP_Y,
+                       self.__TILES_NORMAL_GAP_X,
+                       tile_normal_height,
+                       tile_normal_width,
+                       tiles_normal_total_height,
+                       tiles_normal_total_width),
+                      (self.__TILE_SMALL,
+                       self.__TILES_SMALL_GAP_Y,
+                       self.__TILES_SMALL_GAP_X,
+                       tile_small_height,
+                       tile_small_width,
+                       tiles_small_total_height,
+                       tiles_small_total_width)]
+        if len(self.__boards) > 1:
+            # (multiple boards won't often fit with even small tiles)
+            (tile_tiny_height,
+             tile_tiny_width,
+             tiles_tiny_total_height,
+             tiles_tiny_total_width) = tile_calculations_and_assertions(self.__TILE_TINY,
+                                                                        self.__TILES_TINY_GAP_Y,
+                                                                        self.__TILES_TINY_GAP_X)
+            assert tiles_small_total_height >= tiles_tiny_total_height
+            assert tiles_small_total_width  >= tiles_tiny_total_width
+            tile_specs.append((self.__TILE_TINY,
+                               self.__TILES_TINY_GAP_Y,
+                               self.__TILES_TINY_GAP_X,
+                               tile_tiny_height,
+                               tile_tiny_width,
+                               tiles_tiny_total_height,
+                               tiles_tiny_total_width))
+
+        def board_arrangements(tiles_total_height, tiles_total_width):
+            # each distinct way of arranging boards in rows, with fewest rows
+            #  first, as (boards per row, total height, total width)
+            arrangements = []
+            for num_board_rows in range(1, len(self.__boards)+1):
+                boards_per_row = math.ceil(len(self.__boards)/num_board_rows)
+                if math.ceil(len(self.__boards)/boards_per_row) != num_board_rows:
+                    continue # (same as arrangement with fewer rows)
+                arrangements.append((boards_per_row,
+                                     tiles_total_height * num_board_rows + self.__BOARDS_GAP_Y * (num_board_rows-1),
+                                     tiles_total_width  * boards_per_row + self.__BOARDS_GAP_X * (boards_per_row-1)))
+            return arrangements
 
         # lists of ordinals and congratulatory toasts must match game
         #  parameters
         assert len(self.__ORDINALS) >= self.__game_core.WORD_LENGTH
-        assert len(self.__CONGRATULATORY_TOASTS) >= self.__game_core.MAX_GUESSES
+        #  (each board takes at least one guess, so multiple boards get as
+        #   many more guesses, and toasts go by how many more were needed)
+        assert len(self.__CONGRATULATORY_TOASTS) >= self.__game_core.MAX_GUESSES - (len(self.__boards)-1)
 
         # precalculate everything needed for rendering
         #
@@ -288,59 +367,71 @@ class MainPanel(ModalPanel):
              tile_height,
              tile_width,
              tiles_total_height,
-             tiles_total_width) in ((self.__TILE_NORMAL,
-                                     self.__TILES_NORMAL_GAP_Y,
-                                     self.__TILES_NORMAL_GAP_X,
-                                     tile_normal_height,
-                                     tile_normal_width,
-                                     tiles_normal_total_height,
-                                     tiles_normal_total_width),
-                                    (self.__TILE_SMALL,
-                                     self.__TILES_SMALL_GAP_Y,
-                                     self.__TILES_SMALL_GAP_X,
-                                     tile_small_height,
-                                     tile_small_width,
-                                     tiles_small_total_height,
-                                     tiles_small_total_width)):
-            # skip to next tile definition if this one won't fit:
-            if (   avail_height_for_tiles < tiles_total_height
-                or avail_width_for_tiles < tiles_total_width):
+             tiles_total_width,
+             boards_per_row,
+             boards_total_height,
+             boards_total_width) in ((*tile_spec, *arrangement)
+                                     for tile_spec in tile_specs
+                                     for arrangement in board_arrangements(*tile_spec[-2:])):
+            # skip to next tile definition (or board arrangement) if this one
+            #  won't fit:
+            if (   avail_height_for_tiles < boards_total_height
+                or avail_width_for_tiles < boards_total_width):
                 continue
 
             # record selected tile definition:
             self.__active_tile_def = tile_def
 
-            # y coordinates:
-            tiles_start_y  = (  self.__header_start_y
-                              + self.__header_height
-                              + (avail_height_for_tiles-tiles_total_height)//2)
-            self.__tiles_y = [  tiles_start_y
-                              + (tile_height+tiles_gap_y) * g
+            # y coordinates (relative to each board):
+            self.__tiles_y = [(tile_height+tiles_gap_y) * g
                               for g in range(self.__game_core.MAX_GUESSES)]
 
-            # x coordinates:
-            if self.__game_core.WORD_LENGTH%2 == 0:
-                # gap between middle two tiles (i.e. tile_index==-1 (left of center)
-                #  and tile_index==0 (right of center)) should be centered
-                offset_from_center_for_tile_index_0 = tiles_gap_x//2+1
-            else:
-                # middle tile (i.e. tile_index==0) should be centered
-                offset_from_center_for_tile_index_0 = -(tile_width//2)
-            self.__tiles_x = [  cols//2
-                              + offset_from_center_for_tile_index_0
-                              + (tile_width+tiles_gap_x) * tile_index
-                              for tile_index in range(-(self.__game_core.WORD_LENGTH//2),
-                                                      math.ceil(self.__game_core.WORD_LENGTH/2))]
+            # x coordinates (relative to each board):
+            self.__tiles_x = [(tile_width+tiles_gap_x) * i
+                              for i in range(self.__game_core.WORD_LENGTH)]
+
+            # each board's coordinates, boards being centered as a whole, and
+            #  any last row of fewer boards being centered within that:
+            #  (the middle tile, or the gap between the middle two tiles, of a
+            #   single board ends up centered)
+            boards_start_y = (  self.__header_start_y
+                              + self.__header_height
+                              + (avail_height_for_tiles-boards_total_height)//2)
+            boards_start_x = cols//2 - boards_total_width//2
+            self.__boards_yx = []
+            for b in range(len(self.__boards)):
+                (board_row, board_column) = divmod(b, boards_per_row)
+                boards_in_row = min(boards_per_row,
+                                    len(self.__boards) - board_row*boards_per_row)
+                self.__boards_yx.append((  boards_start_y
+                                         + (tiles_total_height+self.__BOARDS_GAP_Y) * board_row,
+                                           boards_start_x
+                                         + (tiles_total_width+self.__BOARDS_GAP_X) * (boards_per_row-boards_in_row) // 2
+                                         + (tiles_total_width+self.__BOARDS_GAP_X) * board_column))
 
             break
         #
         # calculate min. required terminal size, notify player to resize if unmet
+        #  (with smallest tiles, in whichever board arrangement is closest to
+        #   fitting)
+        (min_boards_total_height,
+         min_boards_total_width) = min(((arrangement[1], arrangement[2])
+                                        for arrangement in board_arrangements(*tile_specs[-1][-2:])),
+                                       key=lambda height_width: (  max(0,   self.__header_start_y
+                                                                          + self.__header_height
+                                                                          + height_width[0]
+                                                                          + kb_height
+                                                                          - rows)
+                                                                 + max(0,   max(self.__game_title_width,
+                                                                                height_width[1],
+                                                                                kb_width)
+                                                                          - cols)))
         self.__min_required_total_height = (  self.__header_start_y
                                             + self.__header_height
-                                            + tiles_small_total_height
+                                            + min_boards_total_height
                                             + kb_height)
         self.__min_required_total_width  = max(self.__game_title_width,
-                                               tiles_small_total_width,
+                                               min_boards_total_width,
                                                kb_width)
         if (   rows < self.__min_required_total_height
             or cols < self.__min_required_total_width):
@@ -354,9 +445,9 @@ class MainPanel(ModalPanel):
         assert self.__active_tile_def is not None
         #
         # overall:
-        self.__leftmost_x = min(self.__tiles_x[0], self.__kb_start_x)
+        self.__leftmost_x = min(boards_start_x, self.__kb_start_x)
         self.__widest     = max(self.__game_title_width,
-                                tiles_total_width,
+                                boards_total_width,
                                 kb_width)
         #
         # header:
@@ -409,13 +500,13 @@ class MainPanel(ModalPanel):
         assert self.__header_start_y                             >= 0
         assert self.__header_start_x                             >= 0
         assert self.__game_title_start_x                         >= 0
-        assert self.__tiles_x[0]                                 >= 0
-        assert self.__kb_start_y                                 >= self.__tiles_y[-1]+tile_height
+        assert boards_start_x                                    >= 0
+        assert self.__kb_start_y                                 >= boards_start_y+boards_total_height
         assert self.__kb_start_x                                 >= 0
         #
         assert self.__kb_start_y+kb_height                       <= rows
         assert self.__kb_start_x+kb_width                        <= cols
-        assert self.__tiles_x[-1]+tile_width                     <= cols
+        assert boards_start_x+boards_total_width                 <= cols
         assert self.__game_title_start_x+self.__game_title_width <= cols
         assert self.__header_start_x+self.__header_width         <= cols
 
@@ -432,6 +523,31 @@ class MainPanel(ModalPanel):
                          self.__header_width*glyphs.HORIZONTAL_LINE_SEGMENT,
                          self._colors.attr('separator_line'))
 
+        # hint (if one has been requested), otherwise word completions (if
+        #  enabled and any letters typed), centered over header line
+        hint_text = None
+        if self.__hinter is not None and not self.__game_core.is_completed():
+            hint = self.__hinter.hint(self.__game_core)
+            if hint is not None:
+                hint_text = f' Try {hint.upper()} '
+            elif self.__hinter.is_pending(self.__game_core):
+                hint_text = ' Thinking... '
+        if (    hint_text is None
+            and self.__config.completions
+            and self.__game_core.pending_guess_letters
+            and not self.__game_core.is_completed()):
+            completions = self.__game_core.pending_guess_completions(self.__MAX_COMPLETIONS)
+            while completions: # (as many as fit)
+                hint_text = f' {" ".join(completions).upper()} '
+                if len(hint_text) <= self.__header_width:
+                    break
+                completions.pop()
+        if hint_text is not None and len(hint_text) <= self.__header_width:
+            self._win.addstr(self.__header_start_y+len(self.__game_title_lines),
+                             self.__header_start_x + (self.__header_width-len(hint_text))//2,
+                             hint_text,
+                             curses.A_BOLD|self._colors.attr('text_default'))
+
         buttons_y = len(self.__game_title_lines)//2
 
         # help button
@@ -477,7 +593,7 @@ class MainPanel(ModalPanel):
                                      self.__settings_panel)
 
     def __draw_tile(self, y, x, mode, letter=' '):
-        if mode == 'unsubmitted':
+        if mode in ('unsubmitted', 'dead'):
             letter_attr = self._colors.attr(f'letter_{mode}')
             border_attr = self._colors.attr(f'border_{mode}')
         elif mode in {s.value for s in LetterStatus}:
@@ -488,7 +604,7 @@ class MainPanel(ModalPanel):
         else:
             letter_attr = None
             border_attr = self._colors.attr(f'border_{mode}')
-        for y_offset,line in enumerate(self.__active_tile_def[mode]):
+        for y_offset,line in enumerate(self.__active_tile_def['unsubmitted' if mode == 'dead' else mode]):
             border_segments = line.split(self.__TILE_LETTER_PLACEHOLDER, 1)
             self._win.addstr(y+y_offset,
                              x,
@@ -504,23 +620,55 @@ class MainPanel(ModalPanel):
                                  border_segments[1],
                                  border_attr)
 
-    def __draw_guess(self, index, guess, tile_flip_delay_msec=0): # will refresh between each letter if delay>0, else caller must refresh (note that things like w.getch() and w.getkey() seem to automatically do w.refresh() on window w (getkey does so *before* waiting for the key))
+    def __draw_board_tile(self, b, g, i, mode, letter=' '):
+        (board_y, board_x) = self.__boards_yx[b]
+        self.__draw_tile(board_y+self.__tiles_y[g],
+                         board_x+self.__tiles_x[i],
+                         mode,
+                         letter)
+
+    def __draw_pending_tile(self, g, i, mode, letter=' '):
+        # same tile on every board that's still being played
+        for b,board in enumerate(self.__boards):
+            if not board.is_won():
+                self.__draw_board_tile(b, g, i, mode, letter)
+
+    def __draw_pending_guess(self, g):
+        # All pending guess letters' tiles, since they're all drawn as dead
+        #  while they can't become a valid guess, up to the first blank one,
+        #  and any word completions in header to go with them.
+        letters = self.__game_core.pending_guess_letters
+        mode = 'unsubmitted' if self.__game_core.pending_guess_is_prefix() else 'dead'
+        for i,l in enumerate(letters):
+            self.__draw_pending_tile(g, i, mode, l.upper())
+        if len(letters) < self.__game_core.WORD_LENGTH:
+            self.__draw_pending_tile(g, len(letters), 'blank')
+        if self.__config.completions:
+            self.__draw_header()
+
+    def __draw_guess(self, index, tile_flip_delay_msec=0): # will refresh between each letter if delay>0, else caller must refresh (note that things like w.getch() and w.getkey() seem to automatically do w.refresh() on window w (getkey does so *before* waiting for the key))
+        # (on every board that the guess was made on, flipping each letter's
+        #  tiles on all of those boards at once)
         fancy_auto_mode = tile_flip_delay_msec>0
         do_animation = fancy_auto_mode and 'blink' in self.__active_tile_def
         delay_msec = tile_flip_delay_msec//(2 if do_animation else 1)
-        for i,(letter,letter_status) in enumerate(zip(guess['word'].upper(), guess['letter_statuses'])):
+        board_guesses = [(b, board.guesses[index])
+                         for b,board in enumerate(self.__boards)
+                         if index < len(board.guesses)]
+        for i in range(self.__game_core.WORD_LENGTH):
             if fancy_auto_mode and i>0:
                 curses.napms(delay_msec)
             if do_animation:
-                self.__draw_tile(self.__tiles_y[index],
-                                 self.__tiles_x[i],
-                                 'blink')
+                for b,guess in board_guesses:
+                    self.__draw_board_tile(b, index, i, 'blink')
                 self._win.refresh()
                 curses.napms(delay_msec)
-            self.__draw_tile(self.__tiles_y[index],
-                             self.__tiles_x[i],
-                             letter_status.value,
-                             letter)
+            for b,guess in board_guesses:
+                self.__draw_board_tile(b,
+                                       index,
+                                       i,
+                                       guess.letter_statuses[i].value,
+                                       guess.word[i].upper())
             if fancy_auto_mode:
                 self._win.refresh()
 
@@ -569,34 +717,64 @@ class MainPanel(ModalPanel):
     def __full_draw(self):
         self._win.bkgd(self._colors.attr('background'))
         self.__draw_header()
+        pending_mode = ('dead'
+                        if (    self.__game_core.pending_guess_letters
+                            and not self.__game_core.pending_guess_is_prefix()) else
+                        'unsubmitted')
         for g in range(self.__game_core.MAX_GUESSES):
-            if g < len(self.__game_core.guesses):
-                self.__draw_guess(g, self.__game_core.guesses[g])
-            else:
+            self.__draw_guess(g)
+            for b,board in enumerate(self.__boards):
+                if g < len(board.guesses):
+                    continue
                 for i in range(self.__game_core.WORD_LENGTH):
-                    if (    g == len(self.__game_core.guesses)
+                    if (    g == len(board.guesses)
+                        and not board.is_won()
                         and i < len(self.__game_core.pending_guess_letters)):
-                        self.__draw_tile(self.__tiles_y[g],
-                                         self.__tiles_x[i],
-                                         'unsubmitted',
-                                         self.__game_core.pending_guess_letters[i].upper())
+                        self.__draw_board_tile(b,
+                                               g,
+                                               i,
+                                               pending_mode,
+                                               self.__game_core.pending_guess_letters[i].upper())
                     else:
-                        self.__draw_tile(self.__tiles_y[g],
-                                         self.__tiles_x[i],
-                                         'blank')
+                        self.__draw_board_tile(b, g, i, 'blank')
         self.__draw_keyboard()
 
+    def __request_hint(self):
+        # hint is worked out in the background, with input switched to
+        #  non-blocking meanwhile so that it can be shown as soon as it's ready
+        #  without holding up the player
+        self.__hinter.request(self.__game_core)
+        self.__draw_header()
+        if self.__hinter.hint(self.__game_core) is None:
+            self._input.set_non_blocking(self.__HINT_POLL_MSEC, self.__poll_hint)
+
+    def __poll_hint(self):
+        if self.__hinter.is_pending(self.__game_core):
+            return
+        if (    self.__hinter.hint(self.__game_core) is None
+            and not self.__game_core.is_completed()):
+            # hint was for earlier guesses (player moved on while it was being
+            #  worked out), so start over for the current guesses
+            self.__hinter.request(self.__game_core)
+            if self.__hinter.is_pending(self.__game_core):
+                return
+        self._input.set_blocking()
+        self.__draw_header()
+
     def __help_panel(self):
         pass
 
     def __play_stats_panel(self):
+        from shareablestatus import ShareableStatus
+        from .playstats      import PlayStatsPanel
         shareable_status = ShareableStatus(self.__game_core,
                                            self.__game_num_str,
                                            self.__config)
         play_stats_panel = PlayStatsPanel(self._stdscr,
                                           self._colors,
                                           self.__game_core,
-                                          shareable_status)
+                                          shareable_status,
+                                          self.__difficulty)
         self._colors.dim()
         self.__full_draw()
         play_stats_panel.run(parent_min_required_total_height = self.__min_required_total_height,
@@ -604,7 +782,21 @@ class MainPanel(ModalPanel):
         self._colors.undim()
         self.__full_draw()
 
+    def __analysis_panel(self):
+        from .analysis import AnalysisPanel
+        analysis_panel = AnalysisPanel(self._stdscr,
+                                       self._colors,
+                                       self.__game_core,
+                                       self.__hinter)
+        self._colors.dim()
+        self.__full_draw()
+        analysis_panel.run(parent_min_required_total_height = self.__min_required_total_height,
+                           parent_min_required_total_width  = self.__min_required_total_width)
+        self._colors.undim()
+        self.__full_draw()
+
     def __settings_panel(self):
+        from .settings import SettingsPanel
         settings_panel = SettingsPanel(self._stdscr,
                                        self._colors,
                                        self.__config,
@@ -624,96 +816,131 @@ class MainPanel(ModalPanel):
         # set background and perform initial drawing
         self.__full_draw()
 
+        # if only profiling startup, that's it once initial drawing is on
+        #  screen
+        if self.__startup_profile is not None:
+            self._win.refresh()
+            self.__startup_profile.mark('first paint')
+            return
+
         if jump_to_panel:
-            panels = {panel_class.__name__: panel_launcher
-                      for (panel_class, panel_launcher)
-                       in ((HelpPanel,      self.__help_panel),
-                           (PlayStatsPanel, self.__play_stats_panel),
-                           (SettingsPanel,  self.__settings_panel))}
+            # (by class name, since panel classes are only imported once
+            #  opened)
+            panels = {'HelpPanel':      self.__help_panel,
+                      'PlayStatsPanel': self.__play_stats_panel,
+                      'AnalysisPanel':  self.__analysis_panel,
+                      'SettingsPanel':  self.__settings_panel}
             if jump_to_panel in panels:
                 panels[jump_to_panel]()
 
-        if not self.__game_core.is_completed():
-            # event loops
-            #   outermost loop (for loop) is "guess loop"
-            #   nested loop (while loop) is "letter loop"
-            #   innermost loop (while loop) is "input loop"
-            for g in range(len(self.__game_core.guesses),
-                           self.__game_core.MAX_GUESSES):
-                # BODY OF GUESS LOOP: BEGIN
-                guess_result = None
-                i = len(self.__game_core.pending_guess_letters)
-                while i < self.__game_core.WORD_LENGTH+1: # +1 for an extra iteration to handle player hitting enter or backspace after typing entire word
-                    # BODY OF LETTER LOOP: BEGIN
-                    k = self._input.get(self.__min_required_total_height,
-                                        self.__min_required_total_width)
-                    if k == '~':
-                        return
-                    if k == 'KEY_BACKSPACE' and i > 0:
-                        i -= 1
-                        self.__draw_tile(self.__tiles_y[g],
-                                         self.__tiles_x[i],
-                                         'blank')
-                        self.__game_core.remove_last_letter_from_pending_guess()
-                    elif k and len(k) == 1 and k.isalpha() and i < self.__game_core.WORD_LENGTH:
-                        l = k.upper()
-                        if self.__game_core.append_letter_to_pending_guess(l):
-                            self.__draw_tile(self.__tiles_y[g],
-                                             self.__tiles_x[i],
-                                             'unsubmitted',
-                                             l)
-                            i += 1
-                    elif k == '\n':
-                        (guess_result,
-                         first_offending_letter,
-                         first_offending_position) = self.__game_core.submit_pending_guess()
-                        if guess_result in (GuessResult.WRONG,
-                                            GuessResult.WRONG_AND_GAME_OVER,
-                                            GuessResult.RIGHT):
-                            self.__draw_guess(g, self.__game_core.guesses[-1], self.__TILE_FLIP_DELAY_MSEC)
-                            self.__draw_keyboard()
-                            curses.flushinp() # drop any keystrokes made by player during __draw_guess()'s "animation"
-                            i += 1
-                        elif guess_result in (GuessResult.INVALID_TOO_SHORT,
-                                              GuessResult.INVALID,
-                                              GuessResult.INVALID_HARD_MODE_MISSING_PREV_GUESS_MISPLACED_LETTER,
-                                              GuessResult.INVALID_HARD_MODE_MISSING_PREV_GUESS_CORRECT_LETTER):
-                            if guess_result == GuessResult.INVALID_TOO_SHORT:
-                                toast_text = 'Not enough letters'
-                            elif guess_result == GuessResult.INVALID:
-                                toast_text = 'Not in word list'
-                            elif guess_result == GuessResult.INVALID_HARD_MODE_MISSING_PREV_GUESS_MISPLACED_LETTER:
-                                toast_text = f'Guess must contain {first_offending_letter.upper()}'
-                            elif guess_result == GuessResult.INVALID_HARD_MODE_MISSING_PREV_GUESS_CORRECT_LETTER:
-                                toast_text = (f'{self.__ORDINALS[first_offending_position]}'
-                                              f' letter must be {first_offending_letter.upper()}')
-                            else:
-                                toast_text = None
-                            if toast_text:
-                                toast = Toast(self._stdscr, self._colors)
-                                toast.run(toast_text)
-                    # BODY OF LETTER LOOP: END
-                if guess_result == GuessResult.RIGHT:
-                    break
-                # BODY OF GUESS LOOP: END
-
-            if guess_result == GuessResult.WRONG_AND_GAME_OVER:
-                answer = self.__game_core.answer()
-                if not answer:
-                    pass
-                else:
-                    toast = Toast(self._stdscr, self._colors)
-                    toast.run(answer.upper())
-                if self.__game_core.play_stats is not None:
-                    self.__play_stats_panel()
-            elif guess_result == GuessResult.RIGHT:
-                toast = Toast(self._stdscr, self._colors)
-                toast.run(self.__CONGRATULATORY_TOASTS[len(self.__game_core.guesses)-1])
-                if self.__game_core.play_stats is not None:
-                    self.__play_stats_panel()
-
-        # end state event loop (game is over, but player can still interact)
+        # outermost loop only repeats if a guess is undone, in which case the
+        #  game restarts from whatever state it was undone to
         while True:
-            k = self._input.get(self.__min_required_total_height,
-                                self.__min_required_total_width)
-            if k == '~': return
+            guess_undone = False
+
+            if not self.__game_core.is_completed():
+                # event loops
+                #   outermost loop (for loop) is "guess loop"
+                #   nested loop (while loop) is "letter loop"
+                #   innermost loop (while loop) is "input loop"
+                for g in range(len(self.__game_core.guesses),
+                               self.__game_core.MAX_GUESSES):
+                    # BODY OF GUESS LOOP: BEGIN
+                    guess_result = None
+                    i = len(self.__game_core.pending_guess_letters)
+                    while i < self.__game_core.WORD_LENGTH+1: # +1 for an extra iteration to handle player hitting enter or backspace after typing entire word
+                        # BODY OF LETTER LOOP: BEGIN
+                        k = self._input.get(self.__min_required_total_height,
+                                            self.__min_required_total_width)
+                        if k == '~':
+                            return
+                        if k in ('KEY_BACKSPACE', self.__UNDO_KEY) and i > 0:
+                            i -= 1
+                            self.__game_core.remove_last_letter_from_pending_guess()
+                            self.__draw_pending_guess(g)
+                        elif k == self.__UNDO_KEY:
+                            if self.__game_core.undo():
+                                guess_undone = True
+                                break
+                        elif k == self.__HINT_KEY and self.__hinter is not None:
+                            self.__request_hint()
+                        elif k and len(k) == 1 and k.isalpha() and i < self.__game_core.WORD_LENGTH:
+                            l = k.upper()
+                            if self.__game_core.append_letter_to_pending_guess(l):
+                                self.__draw_pending_guess(g)
+                                i += 1
+                        elif k == '\n':
+                            (guess_result,
+                             first_offending_letter,
+                             first_offending_position_or_count) = self.__game_core.submit_pending_guess()
+                            if guess_result in (GuessResult.WRONG,
+                                                GuessResult.WRONG_AND_GAME_OVER,
+                                                GuessResult.RIGHT):
+                                self.__draw_guess(g, self.__TILE_FLIP_DELAY_MSEC)
+                                self.__draw_keyboard()
+                                self.__draw_header() # clears any hint for previous guess
+                                curses.flushinp() # drop any keystrokes made by player during __draw_guess()'s "animation"
+                                i += 1
+                            elif guess_result in (GuessResult.INVALID_TOO_SHORT,
+                                                  GuessResult.INVALID,
+                                                  GuessResult.INVALID_HARD_MODE_MISSING_PREV_GUESS_MISPLACED_LETTER,
+                                                  GuessResult.INVALID_HARD_MODE_MISSING_PREV_GUESS_CORRECT_LETTER):
+                                if guess_result == GuessResult.INVALID_TOO_SHORT:
+                                    toast_text = 'Not enough letters'
+                                elif guess_result == GuessResult.INVALID:
+                                    toast_text = 'Not in word list'
+                                elif guess_result == GuessResult.INVALID_HARD_MODE_MISSING_PREV_GUESS_MISPLACED_LETTER:
+                                    toast_text = (f'Guess must contain {first_offending_letter.upper()}'
+                                                  if first_offending_position_or_count == 1 else
+                                                  f'Guess must contain {first_offending_position_or_count}'
+                                                  f' {first_offending_letter.upper()}s')
+                                elif guess_result == GuessResult.INVALID_HARD_MODE_MISSING_PREV_GUESS_CORRECT_LETTER:
+                                    toast_text = (f'{self.__ORDINALS[first_offending_position_or_count]}'
+                                                  f' letter must be {first_offending_letter.upper()}')
+                                else:
+                                    toast_text = None
+                                if toast_text:
+                                    toast = Toast(self._stdscr, self._colors)
+                                    toast.run(toast_text)
+                        # BODY OF LETTER LOOP: END
+                    if guess_result == GuessResult.RIGHT or guess_undone:
+                        break
+                    # BODY OF GUESS LOOP: END
+
+                if guess_undone:
+                    self.__full_draw()
+                    continue
+
+                # start analyzing game in the background right away, so that
+                #  it's likely done by the time it's shown
+                if self.__hinter is not None and self.__game_core.is_completed():
+                    self.__hinter.request_analysis(self.__game_core)
+
+                if guess_result == GuessResult.WRONG_AND_GAME_OVER:
+                    answer = self.__game_core.answer()
+                    if not answer:
+                        pass
+                    else:
+                        toast = Toast(self._stdscr, self._colors)
+                        toast.run(answer.upper())
+                    if self.__game_core.play_stats is not None:
+                        self.__play_stats_panel()
+                elif guess_result == GuessResult.RIGHT:
+                    toast = Toast(self._stdscr, self._colors)
+                    toast.run(self.__CONGRATULATORY_TOASTS[len(self.__game_core.guesses)-len(self.__boards)])
+                    if self.__game_core.play_stats is not None:
+                        self.__play_stats_panel()
+                if self.__hinter is not None and self.__game_core.is_completed():
+                    self.__analysis_panel()
+
+            # end state event loop (game is over, but player can still
+            #  interact, and can undo last guess if not tracking play stats)
+            while not guess_undone:
+                k = self._input.get(self.__min_required_total_height,
+                                    self.__min_required_total_width)
+                if k == '~': return
+                if k == self.__UNDO_KEY and self.__game_core.undo():
+                    guess_undone = True
+                elif k == self.__ANALYSIS_KEY and self.__hinter is not None:
+                    self.__analysis_panel()
+            self.__full_draw()
@@ -32,11 +32,13 @@ class PlayStatsPanel(ModalPanel):
                  stdscr,
                  colors,
                  game_core,
-                 shareable_status=None):
+                 shareable_status=None,
+                 difficulty=None):
         super().__init__(stdscr, colors)
         self.__closing                    = None
         self.__game_core                  = game_core
         self.__shareable_status           = shareable_status
+        self.__difficulty                 = difficulty
         self.__min_required_screen_height = None
         self.__min_required_screen_width  = None
         self.__stat_played_lines          = None
@@ -97,8 +99,17 @@ class PlayStatsPanel(ModalPanel):
 
         post_stats_gap_height = 1
 
+        if self.__difficulty is not None:
+            self.__difficulty_y = self.__stats_start_y + stats_height + post_stats_gap_height
+            difficulty_height = 1
+            difficulty_width = len(self.__difficulty)
+        else:
+            self.__difficulty_y = self.__stats_start_y + stats_height
+            difficulty_height = 0
+            difficulty_width = 0
+
         self.__distribution_heading = 'GUESS DISTRIBUTION'
-        self.__distribution_heading_y = self.__stats_start_y + stats_height + post_stats_gap_height
+        self.__distribution_heading_y = self.__difficulty_y + difficulty_height + post_stats_gap_height
         distribution_heading_height = 1
         distribution_heading_width = len(self.__distribution_heading)
 
@@ -152,6 +163,7 @@ class PlayStatsPanel(ModalPanel):
             total_height = self.__timer_share_divider_line_start_y + self.__timer_share_divider_line_height + bottom_padding_height
             total_width = (  max(stats_heading_width,
                                  stats_width,
+                                 difficulty_width,
                                  distribution_heading_width,
                                  max(timer_section_width, self.__share_button_width)*2+2*timer_share_divider_line_gap_left_right)
                            + 2*left_right_padding_width)
@@ -159,6 +171,7 @@ class PlayStatsPanel(ModalPanel):
             total_height = self.__distribution_start_y + distribution_height + bottom_padding_height
             total_width = (  max(stats_heading_width,
                                  stats_width,
+                                 difficulty_width,
                                  distribution_heading_width)
                            + 2*left_right_padding_width)
 
@@ -171,6 +184,8 @@ class PlayStatsPanel(ModalPanel):
         self.__stat_thisstreak_start_x = self.__stat_winpct_start_x     + self.__stat_winpct_width     + inter_stat_gap_width
         self.__stat_maxstreak_start_x  = self.__stat_thisstreak_start_x + self.__stat_thisstreak_width + inter_stat_gap_width
 
+        self.__difficulty_x = (total_width-difficulty_width)//2
+
         self.__distribution_heading_x = (total_width-distribution_heading_width)//2
 
         if self.__game_core.play_stats.any_completed():
@@ -231,6 +246,12 @@ class PlayStatsPanel(ModalPanel):
         self.__draw_stat(self.__stat_thisstreak_start_x, self.__stat_thisstreak_lines)
         self.__draw_stat(self.__stat_maxstreak_start_x,  self.__stat_maxstreak_lines)
 
+    def __draw_difficulty(self):
+        self._win.addstr(self.__difficulty_y,
+                         self.__difficulty_x,
+                         self.__difficulty,
+                         self._colors.attr('subtext'))
+
     def __draw_guess_bar(self, y, guess_num, is_today, max_guesses_len, bar_middle_width, count):
         self._win.addstr(y,
                          self.__distribution_start_x,
@@ -347,6 +368,8 @@ class PlayStatsPanel(ModalPanel):
 
         self.__draw_close_button()
         self.__draw_stats()
+        if self.__difficulty is not None:
+            self.__draw_difficulty()
         self.__draw_guess_distribution()
         if self.__game_core.play_stats.any_completed() and self.__game_core.is_completed():
             self.__draw_timer_heading()
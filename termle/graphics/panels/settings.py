@@ -134,6 +134,16 @@ class SettingsPanel(ModalPanel):
         self.__config.high_contrast_mode = not self.__config.high_contrast_mode
         raise ColorsChanged(self.__class__.__name__)
 
+    def __toggle_completions(self):
+        self.__config.completions = not self.__config.completions
+        next_row_for_drawing__oldval = self.__next_row_for_drawing
+        self.__next_row_for_drawing = self.__row_for_completions_toggle
+        self.__draw_toggle(self.__config.completions,
+                           self.__toggle_completions,
+                           'Word Completions',
+                           'Suggest words while typing')
+        self.__next_row_for_drawing = next_row_for_drawing__oldval
+
     def _run(self,
              parent_min_required_total_height,
              parent_min_required_total_width):
@@ -155,6 +165,9 @@ class SettingsPanel(ModalPanel):
         self.__draw_separator()
         self.__draw_toggle(self.__config.high_contrast_mode, self.__toggle_high_contrast_mode, 'Color Blind Mode', 'High contrast colors')
         self.__draw_separator()
+        self.__row_for_completions_toggle = self.__next_row_for_drawing
+        self.__draw_toggle(self.__config.completions,        self.__toggle_completions,        'Word Completions', 'Suggest words while typing')
+        self.__draw_separator()
         self.__draw_footer()
 
         # event loop
@@ -0,0 +1,122 @@
+# Copyright (c) 2022, cemysce
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import threading
+
+from analysis    import analyze_game
+from gamecore    import pattern_code, score_guess
+from openingbook import OpeningBook
+
+# Without NumPy (and past the opening book), hints fall back to picking
+#  whichever remaining answer splits the other remaining answers into the most
+#  groups by pattern code, only considering up to this many of each, so that
+#  the pure-Python scoring stays quick.
+_MAX_FALLBACK_WORDS = 100
+
+class Hinter:
+
+    # Works out a suggested next guess (or an analysis of a finished game) in
+    #  a background thread, so that the UI can keep handling input meanwhile
+    #  and just poll for the result.  The thread works on a fork of the game
+    #  (see GameCore.fork()), and a result only applies to the guesses (and
+    #  hard mode setting) it was worked out for.
+
+    def __init__(self, words):
+        self.__WORDS              = words
+        self.__solver             = None # created on first use
+        self.__solver_unavailable = False
+        self.__books              = {} # hard mode -> OpeningBook (or None)
+        self.__thread             = None
+        self.__pending            = None # (kind of work, game key) the thread is working on
+        self.__results            = {}   # kind of work -> (game key, result)
+
+    def __fallback_best_guess(self, game_core):
+        book = self.__books.get(game_core.HARD_MODE)
+        if book is None and game_core.HARD_MODE not in self.__books:
+            book = OpeningBook.from_cache(self.__WORDS, game_core.HARD_MODE)
+            self.__books[game_core.HARD_MODE] = book
+        if book is not None:
+            guess = book.best_guess(game_core)
+            if guess is not None:
+                return guess
+        remaining_answers = game_core.remaining_answers()[:_MAX_FALLBACK_WORDS]
+        return max(remaining_answers,
+                   key=lambda guess: len({pattern_code(score_guess(guess, answer))
+                                          for answer in remaining_answers}),
+                   default=None)
+
+    def best_guess(self, game_core):
+        # (blocks; normally only called from the background thread)
+        if self.__solver is None and not self.__solver_unavailable:
+            try:
+                # imported here so that NumPy is only needed if hints are
+                #  used, and even then is optional
+                from solver import Solver
+            except ImportError:
+                self.__solver_unavailable = True
+            else:
+                # single process, since this runs alongside the UI
+                self.__solver = Solver(self.__WORDS, num_processes=1)
+        if self.__solver is not None:
+            return self.__solver.best_guess(game_core)
+        return self.__fallback_best_guess(game_core)
+
+    def __analyze_game(self, game_core):
+        return analyze_game(game_core, self.best_guess)
+
+    @staticmethod
+    def __game_key(game_core):
+        # everything that work done on a game depends on
+        return (game_core.HARD_MODE, game_core.guesses)
+
+    def __work(self, kind, work_function, game_core):
+        self.__results[kind] = (self.__game_key(game_core), work_function(game_core))
+
+    def __request(self, kind, work_function, game_core):
+        # starts work for the game as it currently is, unless already done or
+        #  underway; if busy with something else, caller can request again
+        #  later
+        if self.__result(kind, game_core) is not None or self.is_busy():
+            return
+        self.__pending = (kind, self.__game_key(game_core))
+        self.__thread = threading.Thread(target=self.__work,
+                                         args=(kind, work_function, game_core.fork()),
+                                         daemon=True)
+        self.__thread.start()
+
+    def __result(self, kind, game_core):
+        result = self.__results.get(kind)
+        if result is None or result[0] != self.__game_key(game_core):
+            return None
+        return result[1]
+
+    def is_busy(self):
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def __is_pending(self, kind, game_core):
+        return self.is_busy() and self.__pending == (kind, self.__game_key(game_core))
+
+    def request(self, game_core):
+        self.__request('hint', self.best_guess, game_core)
+
+    def is_pending(self, game_core):
+        return self.__is_pending('hint', game_core)
+
+    def hint(self, game_core):
+        # returns suggested guess, or None if not (yet) worked out for the
+        #  game as it currently is
+        return self.__result('hint', game_core)
+
+    def request_analysis(self, game_core):
+        self.__request('analysis', self.__analyze_game, game_core)
+
+    def is_analysis_pending(self, game_core):
+        return self.__is_pending('analysis', game_core)
+
+    def analysis(self, game_core):
+        # returns list of GuessAnalysis (see analysis module), or None if not
+        #  (yet) worked out for the game as it currently is
+        return self.__result('analysis', game_core)
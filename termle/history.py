@@ -0,0 +1,167 @@
+# Copyright (c) 2022, cemysce
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import multiprocessing
+import os
+import time
+
+from collections import namedtuple
+from math        import log2
+
+from analysis   import expected_information
+from gamecore   import GameCore, GuessResult
+from savedstate import DailyStateManager
+from words      import Words
+
+# How one saved daily game went.  Luck is the total of how many more bits of
+#  information each guess actually gave than it was expected to (so positive
+#  means the pattern codes were kinder than average).  Skill is how much
+#  information each guess was expected to give, as a fraction of the best
+#  guess's (in normal mode, since whether hard mode was on isn't saved),
+#  averaged over the game's guesses, or None if that can't be worked out.
+DayAnalysis = namedtuple('DayAnalysis', ('day_offset',
+                                         'answer',
+                                         'max_guesses',
+                                         'won',
+                                         'remaining_after',
+                                         'luck',
+                                         'skill'))
+
+# number of days handed to a worker process at a time
+_DAYS_PER_TASK = 16
+
+# per-process state, set up once by _init_worker() rather than being sent
+#  along with every task
+_worker_words   = None
+_worker_lexicon = None
+_worker_solver  = None
+
+def _init_worker(words_file_path):
+    global _worker_words, _worker_lexicon, _worker_solver
+    _worker_words   = Words(words_file_path)
+    _worker_lexicon = _worker_words.lexicon()
+    try:
+        # imported here so that NumPy is optional (without it, skill can't be
+        #  worked out)
+        from solver import Solver
+    except ImportError:
+        _worker_solver = None
+    else:
+        _worker_solver = Solver(_worker_words, num_processes=1)
+
+def _analyze_day(day_offset, max_guesses, guesses):
+    (_, _, answer) = _worker_words.daily_answer(str(day_offset))
+    if answer is None:
+        return None
+    game_core = GameCore(answer, _worker_lexicon, max_guesses, False)
+    remaining_after = []
+    luck = 0.0
+    skill_fractions = []
+    for word in guesses:
+        remaining_before = game_core.remaining_answer_count()
+        if _worker_solver is not None:
+            expected = _worker_solver.information(game_core, word)
+            (_, best_expected) = _worker_solver.rank(game_core, limit=1)[0]
+            if best_expected > 0:
+                skill_fractions.append(expected/best_expected)
+        else:
+            expected = expected_information(word, game_core.remaining_answers())
+        for l in word:
+            game_core.append_letter_to_pending_guess(l)
+        (guess_result, _, _) = game_core.submit_pending_guess()
+        if guess_result not in (GuessResult.RIGHT,
+                                GuessResult.WRONG,
+                                GuessResult.WRONG_AND_GAME_OVER):
+            return None
+        remaining_after.append(game_core.remaining_answer_count())
+        luck += log2(remaining_before/remaining_after[-1]) - expected
+    return DayAnalysis(day_offset,
+                       answer,
+                       max_guesses,
+                       game_core.is_won(),
+                       remaining_after,
+                       luck,
+                       (sum(skill_fractions)/len(skill_fractions)
+                        if skill_fractions else
+                        None))
+
+def _analyze_days(task):
+    return [_analyze_day(*day) for day in task]
+
+class HistoryAnalysis:
+
+    # Replays every completed daily game saved for the current word lists
+    #  against that day's answer, across all CPU cores.
+
+    def __init__(self,
+                 words_file_path,
+                 daily_state_file_path,
+                 num_processes=None):
+        self.__WORDS_FILE_PATH       = words_file_path
+        self.__DAILY_STATE_FILE_PATH = daily_state_file_path
+        self.__NUM_PROCESSES         = num_processes or os.cpu_count()
+        self.__results               = [] # DayAnalysis for each day, in order
+        self.__elapsed               = None
+
+    def run(self):
+        words = Words(self.__WORDS_FILE_PATH)
+        days = sorted((day_offset, max_guesses, guesses)
+                      for (max_guesses,
+                           day_offset,
+                           guesses,
+                           is_completed) in DailyStateManager.saved_days(self.__DAILY_STATE_FILE_PATH,
+                                                                         words.hash_digest())
+                      if is_completed)
+        try:
+            # make sure pattern matrix is cached before starting workers, so
+            #  that they all just map it instead of each computing it
+            from patterns import PatternMatrix
+        except ImportError:
+            pass
+        else:
+            PatternMatrix.from_cache(words)
+        start_time = time.perf_counter()
+        tasks = [days[i:i+_DAYS_PER_TASK]
+                 for i in range(0, len(days), _DAYS_PER_TASK)]
+        with multiprocessing.Pool(self.__NUM_PROCESSES,
+                                  _init_worker,
+                                  (self.__WORDS_FILE_PATH,)) as pool:
+            self.__results = [day_analysis
+                              for results in pool.imap(_analyze_days, tasks)
+                              for day_analysis in results
+                              if day_analysis is not None]
+        self.__elapsed = time.perf_counter() - start_time
+        return self.__results
+
+    def print_results(self):
+        if not self.__results:
+            print('No completed daily games saved for current word lists')
+            return
+        day_print_width = len(str(self.__results[-1].day_offset))
+        for day in self.__results:
+            skill = '' if day.skill is None else f'  skill {round(day.skill*100):3}%'
+            print(f'#{day.day_offset:<{day_print_width}}'
+                  f'  {day.answer.upper()}'
+                  f'  {len(day.remaining_after) if day.won else "X"}/{day.max_guesses}'
+                  f'  luck {day.luck:+6.2f}'
+                  f'{skill}'
+                  f'  left {" ".join(str(r) for r in day.remaining_after)}')
+
+        num_days = len(self.__results)
+        print(f'{num_days} days in {self.__elapsed:.2f}s'
+              f' ({self.__NUM_PROCESSES} processes)')
+        print(f'  Won {sum(day.won for day in self.__results)}/{num_days}')
+        print(f'  Average luck: {sum(day.luck for day in self.__results)/num_days:+.2f} bits')
+        skills = [day.skill for day in self.__results if day.skill is not None]
+        if skills:
+            print(f'  Average skill: {round(sum(skills)/len(skills)*100)}%')
+        print('  Average answers left after guess:')
+        for k in range(max(len(day.remaining_after) for day in self.__results)):
+            remaining = [day.remaining_after[k]
+                         for day in self.__results
+                         if len(day.remaining_after) > k]
+            print(f'  {k+1}: {sum(remaining)/len(remaining):8.2f}'
+                  f' ({len(remaining)} days)')
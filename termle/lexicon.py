@@ -0,0 +1,218 @@
+# Copyright (c) 2022, cemysce
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import bisect
+import itertools
+import threading
+
+from collections import Counter, OrderedDict
+
+import packedwords
+
+class Lexicon:
+
+    # Validated, immutable word lists (answers, and all valid guesses), built
+    #  once and then shared by reference between any number of games, which
+    #  therefore don't each need to validate and copy the word lists.
+
+    # number of most recent guesses to remember answers grouped by score for
+    #  (see matching_answers())
+    __MAX_GROUPINGS = 16
+
+    def __init__(self, answers, valid_guesses):
+        answers       = tuple(a.lower() for a in answers)
+        valid_guesses = [g.lower() for g in valid_guesses]
+
+        # assert that all words are (ASCII) alphabetic and have same length,
+        #  and that all answers are themselves valid guesses
+        word_lengths = {len(w) for w in itertools.chain(answers, valid_guesses)}
+        assert len(word_lengths) == 1
+        assert all(w.isascii() and w.isalpha()
+                   for w in itertools.chain(answers, valid_guesses))
+
+        self.__init(word_lengths.pop(),
+                    answers,
+                    (packedwords.pack(a) for a in answers),
+                    lambda: (packedwords.pack(g) for g in valid_guesses))
+
+    @classmethod
+    def from_packed(cls, word_length, packed_answers, get_packed_valid_guesses):
+        # For word lists that are already validated and packed (see Words),
+        #  with the valid guesses (usually many more words than the answers)
+        #  gotten from get_packed_valid_guesses() only once they're first
+        #  needed, e.g. once a guess is submitted, so that they needn't even
+        #  be decoded before a game starts.
+        lexicon = cls.__new__(cls)
+        lexicon.__init(word_length,
+                       tuple(packedwords.unpack(a) for a in packed_answers),
+                       packed_answers,
+                       get_packed_valid_guesses)
+        return lexicon
+
+    def __init(self, word_length, answers, packed_answers, get_packed_valid_guesses):
+        self.WORD_LENGTH    = word_length
+        self.ANSWERS        = answers
+        self.PACKED_ANSWERS = frozenset(packed_answers)
+
+        self.__get_packed_valid_guesses = get_packed_valid_guesses
+        self.__packed_valid_guesses     = None # built on first use
+        self.__guess_index              = None # built on first use
+        self.__prefix_index             = None # built on first use
+        self.__answer_letter_counts     = None # built on first use
+        self.__answer_indices           = None # built on first use
+        self.__groupings                = OrderedDict() # guess word -> [bitset of answers grouped, {score: bitset of answers}], most recently used last
+        self.__groupings_lock           = threading.Lock() # (games may be played in other threads, e.g. by Hinter)
+
+    def is_answer(self, word):
+        return packedwords.pack(word) in self.PACKED_ANSWERS
+
+    def is_valid_guess(self, word):
+        return packedwords.pack(word) in self.packed_valid_guesses()
+
+    def packed_valid_guesses(self):
+        if self.__packed_valid_guesses is None:
+            packed_valid_guesses = frozenset(self.__get_packed_valid_guesses())
+            assert self.PACKED_ANSWERS <= packed_valid_guesses
+            self.__packed_valid_guesses = packed_valid_guesses
+        return self.__packed_valid_guesses
+
+    def answer_letter_counts(self):
+        # each answer's letter counts (in same order as answers), so that
+        #  scoring guesses against answers needn't recount them every time
+        if self.__answer_letter_counts is None:
+            self.__answer_letter_counts = tuple(Counter(a) for a in self.ANSWERS)
+        return self.__answer_letter_counts
+
+    def answer_index(self, word):
+        # index of the word among answers (i.e. its bit in bitsets of
+        #  answers), or None if it isn't an answer
+        if self.__answer_indices is None:
+            self.__answer_indices = {a: i for i,a in enumerate(self.ANSWERS)}
+        return self.__answer_indices.get(word)
+
+    def matching_answers(self, guess_word, guess_score, answers, answer_score):
+        # Returns those of the specified answers (a bitset over answer
+        #  indices) against which the guess gets the specified score (any
+        #  hashable value, e.g. letter statuses), using
+        #  answer_score(guess_word, answer index) to score it.
+        # Answers are grouped by score as they're scored, with the groups
+        #  remembered for the most recent guesses, so that games
+        #  sharing this lexicon which make the same guess (such as the boards
+        #  of a multi-board game, which all make every guess) only score it
+        #  against each answer once between them, and otherwise just AND
+        #  together bitsets.
+        with self.__groupings_lock:
+            grouping = self.__groupings.get(guess_word)
+            if grouping is None:
+                grouping = self.__groupings[guess_word] = [0, {}]
+                if len(self.__groupings) > self.__MAX_GROUPINGS:
+                    self.__groupings.popitem(last=False)
+            else:
+                self.__groupings.move_to_end(guess_word)
+            (grouped, groups) = grouping
+            ungrouped = answers & ~grouped
+            while ungrouped:
+                lowest_bit = ungrouped & -ungrouped
+                score = answer_score(guess_word, lowest_bit.bit_length() - 1)
+                groups[score] = groups.get(score, 0) | lowest_bit
+                ungrouped ^= lowest_bit
+            grouping[0] = grouped | answers
+            return answers & groups.get(guess_score, 0)
+
+    def guess_index(self):
+        if self.__guess_index is None:
+            self.__guess_index = GuessIndex(packedwords.unpack(g)
+                                            for g in self.packed_valid_guesses())
+        return self.__guess_index
+
+    def prefix_index(self):
+        if self.__prefix_index is None:
+            self.__prefix_index = PrefixIndex(packedwords.unpack(g)
+                                              for g in self.packed_valid_guesses())
+        return self.__prefix_index
+
+class PrefixIndex:
+
+    # Every prefix of a fixed (sorted) list of words, so that whether some
+    #  letters can still be the start of a word is a single set lookup
+    #  however many words there are, and the words they can be the start of
+    #  are a contiguous run of the sorted list, found by bisecting it.  This
+    #  answers the same questions as a trie, but takes a single set
+    #  comprehension to build rather than a node per prefix.
+
+    # sorts right after 'z', so every word starting with some prefix sorts
+    #  before the prefix followed by this
+    __AFTER_LAST_LETTER = chr(ord('z')+1)
+
+    def __init__(self, words):
+        self.WORDS = sorted(words)
+        self.__prefixes = frozenset(w[:k]
+                                    for w in self.WORDS
+                                    for k in range(len(w)+1))
+
+    def is_prefix(self, letters):
+        return letters in self.__prefixes
+
+    def completions(self, letters, limit, is_preferred=lambda w: False):
+        # Up to limit words starting with the letters, any preferred words
+        #  (e.g. those which could still be the answer) first, otherwise in
+        #  sorted order.  Only words starting with the letters are checked
+        #  for being preferred, so that few are however many words there are.
+        if letters not in self.__prefixes:
+            return []
+        words = self.WORDS[bisect.bisect_left(self.WORDS, letters)
+                           :bisect.bisect_left(self.WORDS, letters+self.__AFTER_LAST_LETTER)]
+        preferred = [is_preferred(w) for w in words]
+        return (  [w for w,p in zip(words, preferred) if p]
+                + [w for w,p in zip(words, preferred) if not p])[:limit]
+
+class GuessIndex:
+
+    # Bitsets over a fixed (sorted) list of words, so that every word meeting
+    #  some set of hard mode constraints can be found by AND-ing together one
+    #  bitset per constraint, rather than checking each word individually.
+
+    def __init__(self, words):
+        self.WORDS = sorted(words)
+        position_letter_bits = {}
+        letter_count_bits    = {}
+        num_bytes = (len(self.WORDS)+7) // 8
+        for w_index,w in enumerate(self.WORDS):
+            (byte_index, bit) = divmod(w_index, 8)
+            for key in enumerate(w):
+                if key not in position_letter_bits:
+                    position_letter_bits[key] = bytearray(num_bytes)
+                position_letter_bits[key][byte_index] |= 1 << bit
+            for l,count in Counter(w).items():
+                for key in ((l, c) for c in range(1, count+1)):
+                    if key not in letter_count_bits:
+                        letter_count_bits[key] = bytearray(num_bytes)
+                    letter_count_bits[key][byte_index] |= 1 << bit
+        self.__position_letter_masks = {key: int.from_bytes(bits, 'little')
+                                        for key,bits in position_letter_bits.items()}
+        self.__letter_count_masks    = {key: int.from_bytes(bits, 'little')
+                                        for key,bits in letter_count_bits.items()}
+        self.__all_mask = (1 << len(self.WORDS)) - 1
+
+    def matching_bits(self, right_letters, min_letter_counts):
+        # (as a bitset over words, for when the matching words are only to be
+        #  combined with other bitsets)
+        mask = self.__all_mask
+        for key in right_letters.items():
+            mask &= self.__position_letter_masks.get(key, 0)
+        for key in min_letter_counts.items():
+            if key[1] > 0:
+                mask &= self.__letter_count_masks.get(key, 0)
+        return mask
+
+    def matching(self, right_letters, min_letter_counts):
+        mask = self.matching_bits(right_letters, min_letter_counts)
+        matches = []
+        while mask:
+            lowest_bit = mask & -mask
+            matches.append(self.WORDS[lowest_bit.bit_length() - 1])
+            mask ^= lowest_bit
+        return matches
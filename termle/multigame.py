@@ -0,0 +1,184 @@
+# Copyright (c) 2022, cemysce
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+from constants import MAX_BOARDS
+from gamecore  import GameCore, GuessResult, LetterStatus
+
+class MultiGameCore:
+
+    # Several boards, each a GameCore with its own answer, played at once, so
+    #  that each guess is made on every board not yet won.  Pending guess
+    #  letters are shared between boards, so typing costs the same however
+    #  many boards there are.  All boards share one Lexicon, so a guess is
+    #  scored against each candidate answer only once however many boards
+    #  still have that answer as a candidate, each board then narrowing down
+    #  its candidates with a single AND (see Lexicon.matching_answers()),
+    #  which is what makes the first guess (when every board has every answer
+    #  as a candidate) cost about the same as on a single board.
+    #
+    # Provides the same interface as GameCore, as far as MainPanel uses it,
+    #  except that guesses are just words (each board has its own scored
+    #  guesses), and there's no tracking of play stats.
+
+    # lower rank is more right (see comment in LetterStatus definition)
+    __LETTER_STATUS_RANKS = {s: r for r,s in enumerate(LetterStatus)}
+
+    def __init__(self,
+                 answers,
+                 lexicon,
+                 max_guesses,
+                 hard_mode):
+
+        # assert that there are a supported number of boards, each with a
+        #  different answer
+        assert 0 < len(answers) <= MAX_BOARDS
+        assert len({a.lower() for a in answers}) == len(answers)
+
+        # game parameters
+        self.__LEXICON   = lexicon
+        self.__BOARDS    = tuple(GameCore(a, lexicon, max_guesses, hard_mode)
+                                 for a in answers)
+        self.WORD_LENGTH = lexicon.WORD_LENGTH
+        self.MAX_GUESSES = max_guesses
+        self.HARD_MODE   = hard_mode
+
+        # game state
+        self.play_stats            = None
+        self.guesses               = () # words guessed (each made on every board not yet won at the time)
+        self.pending_guess_letters = []
+        self.__letter_statuses     = None # letter -> status for keyboard, worked out on first use after each guess
+
+    def boards(self):
+        return self.__BOARDS
+
+    def __unwon_boards(self):
+        return [board for board in self.__BOARDS if not board.is_won()]
+
+    def undo(self):
+        # undo last pending guess letter if any, otherwise undo last guess on
+        #  every board it was made on
+        if self.pending_guess_letters:
+            return self.remove_last_letter_from_pending_guess()
+        if not self.guesses:
+            return False
+        for board in self.__BOARDS:
+            if len(board.guesses) == len(self.guesses):
+                board.undo()
+        self.guesses           = self.guesses[:-1]
+        self.__letter_statuses = None
+        return True
+
+    def change_max_guesses(self, max_guesses):
+        if max_guesses < len(self.guesses)+1:
+            return False
+        for board in self.__BOARDS:
+            board.change_max_guesses(max_guesses)
+        self.MAX_GUESSES = max_guesses
+        return True
+
+    def toggle_hard_mode(self, hard_mode=None):
+        if hard_mode is None:
+            hard_mode = not self.HARD_MODE
+        if hard_mode and self.in_progress():
+            # not permitted to enable hard mode if game already in progress
+            return False
+        for board in self.__BOARDS:
+            board.toggle_hard_mode(hard_mode)
+        self.HARD_MODE = hard_mode
+        return True
+
+    def letter_status(self, l):
+        # A letter's most right status on any board not yet won (boards
+        #  already won no longer matter, unless all of them are), worked out
+        #  for all guessed letters at once, once per guess, rather than for
+        #  every key every time the keyboard is drawn.
+        if self.__letter_statuses is None:
+            boards = self.__unwon_boards() or self.__BOARDS
+            self.__letter_statuses = {}
+            for guessed_l in {guessed_l for word in self.guesses for guessed_l in word}:
+                statuses = [s
+                            for s in (board.letter_status(guessed_l) for board in boards)
+                            if s is not None]
+                if statuses:
+                    self.__letter_statuses[guessed_l] = min(statuses,
+                                                            key=self.__LETTER_STATUS_RANKS.get)
+        return self.__letter_statuses.get(l.lower())
+
+    def is_started(self):
+        return len(self.guesses)>0
+
+    def is_won(self):
+        return all(board.is_won() for board in self.__BOARDS)
+
+    def is_lost(self):
+        return len(self.guesses) == self.MAX_GUESSES and not self.is_won()
+
+    def is_completed(self):
+        return len(self.guesses) == self.MAX_GUESSES or self.is_won()
+
+    def in_progress(self):
+        return self.is_started() and not self.is_completed()
+
+    def append_letter_to_pending_guess(self, l):
+        if (   self.is_completed()
+            or len(l) != 1
+            or not l.isalpha()
+            or len(self.pending_guess_letters) == self.WORD_LENGTH):
+            return False
+        self.pending_guess_letters.append(l.lower())
+        return True
+
+    def remove_last_letter_from_pending_guess(self):
+        if len(self.pending_guess_letters) == 0:
+            return False
+        self.pending_guess_letters.pop()
+        return True
+
+    def pending_guess_is_prefix(self):
+        return self.__LEXICON.prefix_index().is_prefix(''.join(self.pending_guess_letters))
+
+    def pending_guess_completions(self, limit):
+        # (those that could still be the answer on any board not yet won
+        #  first)
+        unwon_boards = self.__unwon_boards()
+        return self.__LEXICON.prefix_index().completions(''.join(self.pending_guess_letters),
+                                                         limit,
+                                                         lambda w: any(board.could_be_answer(w)
+                                                                       for board in unwon_boards))
+
+    def answer(self):
+        # answers of boards not won (or of all boards, if all were won), space
+        #  separated
+        if self.is_completed():
+            return ' '.join(board.answer()
+                            for board in (self.__unwon_boards() or self.__BOARDS))
+        return None
+
+    def submit_pending_guess(self):
+        guess_word = ''.join(self.pending_guess_letters)
+        unwon_boards = self.__unwon_boards()
+
+        # check for cases of invalidity, on every board that the guess would
+        #  be made on (which can only differ in hard mode constraints)
+        for board in unwon_boards:
+            invalidity = board.check_guess(guess_word)
+            if invalidity is not None:
+                return invalidity
+
+        # update internal state
+        self.pending_guess_letters.clear()
+        for board in unwon_boards:
+            board.pending_guess_letters = list(guess_word)
+            board.submit_pending_guess()
+        self.guesses           = self.guesses + (guess_word,)
+        self.__letter_statuses = None
+
+        # return valid guess result (only right once every board is won)
+        if self.is_won():
+            return (GuessResult.RIGHT, None, None)
+        if len(self.guesses) < self.MAX_GUESSES:
+            return (GuessResult.WRONG, None, None)
+        return (GuessResult.WRONG_AND_GAME_OVER, None, None)
@@ -0,0 +1,115 @@
+# Copyright (c) 2022, cemysce
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import json
+import os
+
+from constants import BOOK_FILENAME, DEFAULT_BOOK_DEPTH
+from gamecore  import (GameCore,
+                       Guess,
+                       LetterStatus,
+                       letter_statuses_from_pattern_code,
+                       pattern_code)
+
+class OpeningBook:
+
+    # The solver's choice of guess for the first few turns, which depends only
+    #  on the word lists, hard mode, and the pattern codes of earlier guesses,
+    #  precomputed as a decision tree so that looking up the next guess takes
+    #  one dictionary lookup per earlier guess (and doesn't need NumPy).  Each
+    #  node is a list of the guess to make, then (unless the node is a leaf) a
+    #  dict from each pattern code (as a string, since it's stored as JSON) it
+    #  could get to the node for the following turn.
+
+    @staticmethod
+    def __mode_name(hard_mode):
+        return 'hard' if hard_mode else 'normal'
+
+    @classmethod
+    def __build_node(cls, solver, guesses, hard_mode, depth, all_right_code):
+        (guess, _) = solver.rank(guesses, hard_mode, limit=1)[0]
+        node = [guess]
+        if depth > 1:
+            children = {}
+            for code in solver.possible_pattern_codes(guesses, guess):
+                if code == all_right_code:
+                    continue
+                letter_statuses = tuple(letter_statuses_from_pattern_code(code,
+                                                                          len(guess)))
+                children[str(code)] = cls.__build_node(solver,
+                                                       guesses + (Guess(guess,
+                                                                        letter_statuses),),
+                                                       hard_mode,
+                                                       depth-1,
+                                                       all_right_code)
+            node.append(children)
+        return node
+
+    @classmethod
+    def build(cls, solver, words, hard_mode, depth=DEFAULT_BOOK_DEPTH):
+        word_length = words.lexicon().WORD_LENGTH
+        all_right_code = pattern_code(word_length*[LetterStatus.RIGHT])
+        tree = cls.__build_node(solver, (), hard_mode, depth, all_right_code)
+        return cls(words.hash_digest(), hard_mode, depth, tree)
+
+    @classmethod
+    def build_cache(cls,
+                    solver,
+                    words,
+                    hard_mode,
+                    depth=DEFAULT_BOOK_DEPTH,
+                    file_path_format=BOOK_FILENAME):
+        # like PatternMatrix.from_cache(), the file is named after the word
+        #  lists' hash digest
+        book = cls.build(solver, words, hard_mode, depth)
+        mode = cls.__mode_name(hard_mode)
+        file_path = file_path_format.format(digest=words.hash_digest(), mode=mode)
+        temp_file_path = f'{file_path}.{os.getpid()}.tmp'
+        with open(temp_file_path, 'w') as f:
+            json.dump({'digest':    book.DIGEST,
+                       'hard_mode': book.HARD_MODE,
+                       'depth':     book.DEPTH,
+                       'tree':      book.__tree},
+                      f,
+                      separators=(',', ':'))
+        os.replace(temp_file_path, file_path)
+        return book
+
+    @classmethod
+    def from_cache(cls, words, hard_mode, file_path_format=BOOK_FILENAME):
+        # returns None if no book has been built for the current word lists
+        file_path = file_path_format.format(digest=words.hash_digest(),
+                                            mode=cls.__mode_name(hard_mode))
+        if not os.path.exists(file_path):
+            return None
+        with open(file_path, 'r') as f:
+            book = json.load(f)
+        if (   book.get('digest')    != words.hash_digest()
+            or book.get('hard_mode') != bool(hard_mode)):
+            return None
+        return cls(book['digest'], book['hard_mode'], book['depth'], book['tree'])
+
+    def __init__(self, digest, hard_mode, depth, tree):
+        self.DIGEST    = digest
+        self.HARD_MODE = bool(hard_mode)
+        self.DEPTH     = depth
+        self.__tree    = tree
+
+    def best_guess(self, game_core_or_guesses):
+        # returns None once the game has left the book (i.e. it's past the
+        #  book's depth, or an earlier guess differs from the book's)
+        if isinstance(game_core_or_guesses, GameCore):
+            guesses = game_core_or_guesses.guesses
+        else:
+            guesses = game_core_or_guesses
+        node = self.__tree
+        for guess in guesses:
+            if len(node) < 2 or guess.word != node[0]:
+                return None
+            node = node[1].get(str(pattern_code(guess.letter_statuses)))
+            if node is None:
+                return None
+        return node[0]
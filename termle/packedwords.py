@@ -0,0 +1,48 @@
+# Copyright (c) 2022, cemysce
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import array
+
+# Words are packed into integers, 5 bits per letter (a=1, ..., z=26) with the
+#  first letter most significant.  Since no letter is packed as 0, a packed
+#  word's length is implied by its value, and packed words of equal length
+#  sort in the same order as the words themselves.
+BITS_PER_LETTER = 5
+_LETTER_MASK    = (1 << BITS_PER_LETTER) - 1
+
+# Packing is the same as parsing the word as a base-32 number once each letter
+#  is swapped for the base-32 digit of its value, which int() does natively.
+_BASE32_DIGITS            = '0123456789abcdefghijklmnopqrstuv'
+_LETTERS_TO_BASE32_DIGITS = str.maketrans('abcdefghijklmnopqrstuvwxyz',
+                                          _BASE32_DIGITS[1:27])
+
+def pack(word):
+    # returns None for anything that isn't entirely ASCII letters, so that
+    #  such words simply never match any packed word
+    if not (word.isascii() and word.isalpha()):
+        return None
+    return int(word.lower().translate(_LETTERS_TO_BASE32_DIGITS), 32)
+
+def unpack(packed):
+    letters = []
+    while packed:
+        letters.append(chr(ord('a') - 1 + (packed & _LETTER_MASK)))
+        packed >>= BITS_PER_LETTER
+    return ''.join(reversed(letters))
+
+def pack_all(words):
+    packed_words = [pack(w) for w in words]
+    assert all(p is not None for p in packed_words)
+    return as_compact_sequence(packed_words)
+
+def as_compact_sequence(packed_words):
+    # Stored as an array of 64-bit unsigned integers (8 bytes per word, and
+    #  usable as a NumPy array without conversion) if the words are short
+    #  enough to fit, otherwise as a list of arbitrarily large integers.
+    packed_words = list(packed_words)
+    if all(p.bit_length() <= 64 for p in packed_words):
+        return array.array('Q', packed_words)
+    return packed_words
@@ -0,0 +1,181 @@
+# Copyright (c) 2022, cemysce
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import os
+
+import numpy as np
+
+import packedwords
+
+from constants import PATTERNS_FILENAME
+from gamecore  import PATTERN_CODE_DIGITS, LetterStatus
+
+# number of guesses scored against all answers at once, chosen so that each
+#  intermediate (guesses x answers) array stays small enough to fit in cache
+_GUESSES_PER_CHUNK = 256
+
+def pattern_code_dtype(word_length):
+    return np.min_scalar_type(3**word_length - 1)
+
+def encode_words(words):
+    # each word becomes a row of letter indices (a=0, ..., z=25), unless
+    #  already encoded that way
+    if isinstance(words, np.ndarray):
+        return words
+    words = list(words)
+    if not words:
+        return np.zeros((0, 0), dtype=np.uint8)
+    encoded = np.frombuffer(''.join(words).lower().encode('ascii'),
+                            dtype=np.uint8)
+    return (encoded - ord('a')).reshape(len(words), -1)
+
+def encode_packed_words(packed_words, word_length):
+    # same as encode_words(), but from packed words (see packedwords module),
+    #  which when stored in an array are used as is without being copied
+    packed_words = np.asarray(packed_words, dtype=np.uint64)
+    shifts = packedwords.BITS_PER_LETTER * np.arange(word_length-1, -1, -1,
+                                                     dtype=np.uint64)
+    letter_mask = np.uint64((1 << packedwords.BITS_PER_LETTER) - 1)
+    return ((packed_words[:, None] >> shifts) & letter_mask).astype(np.uint8) - 1
+
+def score_batch(guesses, answers):
+    # Scores every guess against every answer (each either a list of words or
+    #  an array from encode_words()/encode_packed_words()), returning a
+    #  (len(guesses) x len(answers)) array of pattern codes (see
+    #  gamecore.pattern_code()).  Gives the same letter statuses as
+    #  GameCore.__ingest_guess(), i.e. a guess letter is misplaced only while
+    #  the answer has more of that letter than are accounted for by right
+    #  letters (anywhere in the guess) plus earlier misplaced letters.
+    encoded_guesses = encode_words(guesses)
+    encoded_answers = encode_words(answers)
+    (num_guesses, word_length) = encoded_guesses.shape
+    num_answers = encoded_answers.shape[0]
+    if num_guesses and num_answers:
+        assert encoded_answers.shape[1] == word_length
+
+    # per-answer letter counts, as a (len(answers) x 26) array
+    answer_letter_counts = np.zeros((num_answers, 26), dtype=np.int8)
+    for i in range(word_length):
+        np.add.at(answer_letter_counts,
+                  (np.arange(num_answers), encoded_answers[:, i]),
+                  1)
+
+    digit_right     = PATTERN_CODE_DIGITS[LetterStatus.RIGHT]
+    digit_misplaced = PATTERN_CODE_DIGITS[LetterStatus.MISPLACED]
+    digit_wrong     = PATTERN_CODE_DIGITS[LetterStatus.WRONG]
+    dtype = pattern_code_dtype(word_length)
+    codes = np.empty((num_guesses, num_answers), dtype=dtype)
+    for start in range(0, num_guesses, _GUESSES_PER_CHUNK):
+        chunk = encoded_guesses[start:start+_GUESSES_PER_CHUNK]
+        right = [chunk[:, i, None] == encoded_answers[None, :, i]
+                 for i in range(word_length)]
+        chunk_codes = np.zeros((chunk.shape[0], num_answers), dtype=dtype)
+        for i in range(word_length):
+            letter = chunk[:, i]
+
+            # How many of this letter are still unaccounted for in the answer
+            #  by the time position i is reached.  Every earlier occurrence in
+            #  the guess is either right or (if any remain) misplaced, so they
+            #  all count, whereas later occurrences only count if right.
+            available = answer_letter_counts[:, letter].T.copy()
+            available -= (chunk[:, :i] == letter[:, None]).sum(axis=1,
+                                                                dtype=np.int8)[:, None]
+            for j in range(i, word_length):
+                available -= (chunk[:, j] == letter)[:, None] & right[j]
+
+            misplaced = ~right[i] & (available > 0)
+            chunk_codes *= 3
+            chunk_codes += np.where(right[i],
+                                    digit_right,
+                                    np.where(misplaced,
+                                             digit_misplaced,
+                                             digit_wrong)).astype(dtype)
+        codes[start:start+chunk.shape[0]] = chunk_codes
+    return codes
+
+def split_by_pattern_code(guess, encoded_words, bitset):
+    # Splits the words in the bitset (over the rows of encoded_words, from
+    #  encode_words()/encode_packed_words()) into buckets by the guess's
+    #  pattern code against each, scoring the guess against all of them at
+    #  once, and returns {pattern code: bitset of bucket's words}.
+    num_words = encoded_words.shape[0]
+    indices = np.flatnonzero(np.unpackbits(np.frombuffer(bitset.to_bytes((num_words+7)//8, 'little'),
+                                                         dtype=np.uint8),
+                                           count=num_words,
+                                           bitorder='little'))
+    codes = score_batch(encode_words([guess]), encoded_words[indices])[0]
+    order = np.argsort(codes, kind='stable')
+    (bucket_codes, bucket_starts) = np.unique(codes[order], return_index=True)
+    buckets = {}
+    for code,bucket_indices in zip(bucket_codes,
+                                   np.split(indices[order], bucket_starts[1:])):
+        in_bucket = np.zeros(num_words, dtype=bool)
+        in_bucket[bucket_indices] = True
+        buckets[int(code)] = int.from_bytes(np.packbits(in_bucket, bitorder='little').tobytes(),
+                                            'little')
+    return buckets
+
+class PatternMatrix:
+
+    def __init__(self, guesses, answers, matrix=None):
+        self.GUESSES = list(guesses)
+        self.ANSWERS = list(answers)
+        self.__guess_indices  = {g: i for i,g in enumerate(self.GUESSES)}
+        self.__answer_indices = {a: i for i,a in enumerate(self.ANSWERS)}
+        if matrix is None:
+            matrix = score_batch(self.GUESSES, self.ANSWERS)
+        assert matrix.shape == (len(self.GUESSES), len(self.ANSWERS))
+        self.matrix = matrix
+
+    @classmethod
+    def from_words(cls, words):
+        return cls(sorted(words.valid_guesses()), words.all_answers())
+
+    @classmethod
+    def from_cache(cls, words, file_path_format=PATTERNS_FILENAME):
+        # The cache file is named after the word lists' hash digest, so a
+        #  file for the current word lists can be memory-mapped as is (no
+        #  copy, no recompute), alongside files for any other word lists
+        #  (which are removed when they become stale, see termle.py).
+        guesses = sorted(words.valid_guesses())
+        answers = words.all_answers()
+        file_path = file_path_format.format(digest=words.hash_digest())
+        matrix = None
+        if os.path.exists(file_path):
+            matrix = np.load(file_path, mmap_mode='r')
+            if matrix.shape != (len(guesses), len(answers)):
+                matrix = None
+        if matrix is None:
+            word_length = len(answers[0])
+            if word_length*packedwords.BITS_PER_LETTER <= 64:
+                matrix = score_batch(encode_packed_words(words.packed_valid_guesses(),
+                                                         word_length),
+                                     encode_packed_words(words.packed_answers(),
+                                                         word_length))
+            else:
+                # packed words too long to fit in 64 bits
+                matrix = score_batch(guesses, answers)
+            # write to a temporary file then rename it into place, so that
+            #  other processes never map a partially written file
+            temp_file_path = f'{file_path}.{os.getpid()}.tmp'
+            with open(temp_file_path, 'wb') as f:
+                np.save(f, matrix)
+            os.replace(temp_file_path, file_path)
+            matrix = np.load(file_path, mmap_mode='r')
+        return cls(guesses, answers, matrix)
+
+    def guess_index(self, guess):
+        return self.__guess_indices[guess.lower()]
+
+    def answer_index(self, answer):
+        return self.__answer_indices[answer.lower()]
+
+    def pattern(self, guess, answer):
+        return int(self.matrix[self.guess_index(guess),
+                               self.answer_index(answer)])
+
+    def patterns_for_guess(self, guess):
+        return self.matrix[self.guess_index(guess)]
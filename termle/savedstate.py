@@ -9,6 +9,8 @@ import os
 
 from collections import defaultdict
 
+import packedwords
+
 from playstats import PlayStats
 
 class DailyStateManager:
@@ -27,6 +29,29 @@ class DailyStateManager:
         self.__DAY_KEY        = f'day:{day_offset}'
         self.__PREV_DAY_KEY   = f'day:{day_offset-1}'
 
+    @staticmethod
+    def saved_days(file_path, word_lists_hash_digest):
+        # Every day saved for the specified word lists (across all max guesses
+        #  settings), as (max guesses, day offset, guesses, is completed)
+        #  tuples in no particular order.
+        if not os.path.exists(file_path):
+            return
+        with open(file_path, 'r') as f:
+            all_data = json.load(f)
+        state_key_prefix = f'wldig:{word_lists_hash_digest}_maxg:'
+        for state_key,data_for_state_key in all_data.items():
+            if not state_key.startswith(state_key_prefix):
+                continue
+            max_guesses = int(state_key[len(state_key_prefix):])
+            for day_key,data_for_day_key in data_for_state_key.items():
+                if not day_key.startswith('day:'):
+                    continue
+                yield (max_guesses,
+                       int(day_key[len('day:'):]),
+                       [g if type(g) is str else packedwords.unpack(g)
+                        for g in data_for_day_key['guesses']],
+                       data_for_day_key['is_completed'])
+
     def get(self):
 
         # return default initial state if no saved state file
@@ -60,8 +85,11 @@ class DailyStateManager:
 
         if data_for_specified_state_and_day_keys is None:
             return (play_stats, [], [])
+        # guesses are saved packed (see packedwords module), but files saved
+        #  by older versions have them as plain strings
         return (play_stats,
-                data_for_specified_state_and_day_keys['guesses'],
+                [g if type(g) is str else packedwords.unpack(g)
+                 for g in data_for_specified_state_and_day_keys['guesses']],
                 data_for_specified_state_and_day_keys['pending_guess_letters'])
 
     def save(self, play_stats, guesses, pending_guess_letters, is_completed):
@@ -74,7 +102,8 @@ class DailyStateManager:
                 all_data.update(json.load(f))
                 f.seek(0)
             all_data[self.__STATE_KEY][self.__PLAY_STATS_KEY] = play_stats.as_json_dict()
-            all_data[self.__STATE_KEY][self.__DAY_KEY] = {'guesses':               guesses,
+            all_data[self.__STATE_KEY][self.__DAY_KEY] = {'guesses':               [packedwords.pack(g)
+                                                                                    for g in guesses],
                                                           'pending_guess_letters': pending_guess_letters,
                                                           'is_completed':          is_completed}
             json.dump(all_data, f, indent=4, sort_keys=True)
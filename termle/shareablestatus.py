@@ -4,6 +4,7 @@
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
 
+import re
 import subprocess
 
 import clipboard
@@ -17,6 +18,12 @@ class ShareableStatus:
                        LetterStatus.WRONG.value:     ['\u2b1c',     '\u2b1b',     '\u2b1c',     '\u2b1b'],     # ⬜⬛⬜⬛
                        LetterStatus.MISPLACED.value: ['\U0001f7e8', '\U0001f7e8', '\U0001f7e6', '\U0001f7e6'], # 🟨🟨🟦🟦
                        LetterStatus.RIGHT.value:     ['\U0001f7e9', '\U0001f7e9', '\U0001f7e7', '\U0001f7e7']} # 🟩🟩🟧🟧
+    __GLYPH_STATUSES = {glyph: LetterStatus(s)
+                        for s,glyphs in __STATUS_GLYPHS.items()
+                        for glyph in glyphs}
+
+    # e.g. "4/6*" in title line, the asterisk meaning hard mode
+    __SCORE_PATTERN = re.compile(r'(?:\d+|X|\?)/\d+(\*?)')
 
     def __init__(self, game_core, game_num_str, config):
         style_index = int(config.dark_mode)+2*int(config.high_contrast_mode)
@@ -33,9 +40,29 @@ class ShareableStatus:
         text_segments.append('\n')
         for guess in game_core.guesses:
             text_segments.append('\n')
-            for s in guess['letter_statuses']:
+            for s in guess.letter_statuses:
                 text_segments.append(self.__STATUS_GLYPHS[s.value][style_index])
         self.__text = ''.join(text_segments)
 
+    @classmethod
+    def parse(cls, text):
+        # The reverse of what's copied to the clipboard (in any style, and
+        #  with or without its title line), returning whether hard mode was
+        #  on and each guess's letter statuses, or None if there are no rows
+        #  of glyphs (or they differ in length).
+        hard_mode = False
+        rows = []
+        for line in text.splitlines():
+            line = line.strip().replace('\ufe0f', '') # (variation selectors, which some apps add when pasting)
+            if line and all(c in cls.__GLYPH_STATUSES for c in line):
+                rows.append([cls.__GLYPH_STATUSES[c] for c in line])
+            elif not rows:
+                score_match = cls.__SCORE_PATTERN.search(line)
+                if score_match:
+                    hard_mode = bool(score_match.group(1))
+        if not rows or len({len(row) for row in rows}) != 1:
+            return None
+        return (hard_mode, rows)
+
     def copy_to_clipboard(self):
         return clipboard.put(self.__text)
@@ -0,0 +1,247 @@
+# Copyright (c) 2022, cemysce
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import multiprocessing
+import os
+import time
+
+from collections import Counter, namedtuple
+from math        import prod
+
+from gamecore        import (HardModeConstraints,
+                             LetterStatus,
+                             letter_statuses_from_pattern_code,
+                             pattern_code,
+                             score_guess_digits)
+from shareablestatus import ShareableStatus
+from words           import Words
+
+# An answer that could have produced a share grid, with how many valid
+#  guesses could have been made at each row (not taking hard mode into
+#  account), and one sequence of guesses that would have produced the grid
+#  (taking hard mode into account, or None if the search gave up before
+#  finding one or ruling every sequence out, in which case whether the answer
+#  is possible is unknown).
+GridAnswer = namedtuple('GridAnswer', ('answer',
+                                       'guesses_per_row',
+                                       'example_guesses'))
+
+# number of answers handed to a worker process at a time
+_ANSWERS_PER_TASK = 32
+
+# most guesses tried, per answer, when searching for a sequence of guesses
+#  that obeys hard mode, before giving up
+_MAX_HARD_MODE_SEARCH_GUESSES = 100000
+
+# per-process state, set up once by _init_worker() rather than being sent
+#  along with every task
+_worker_guesses = None
+_worker_matrix  = None
+_worker_lexicon = None
+
+def _init_worker(words_file_path):
+    global _worker_guesses, _worker_matrix, _worker_lexicon
+    words = Words(words_file_path)
+    _worker_lexicon = words.lexicon()
+    try:
+        # imported here so that NumPy is optional (without it, every guess is
+        #  scored against each answer in pure Python, which is much slower)
+        from patterns import PatternMatrix
+    except ImportError:
+        _worker_guesses = sorted(words.valid_guesses())
+        _worker_matrix  = None
+    else:
+        _worker_matrix  = PatternMatrix.from_cache(words)
+        _worker_guesses = _worker_matrix.GUESSES
+
+def _guesses_by_code(answer, codes):
+    # Reverse index from each of the specified pattern codes to the indices
+    #  of the guesses that get it against the answer.  With a pattern matrix
+    #  that's one comparison per code against the answer's column.
+    if _worker_matrix is not None:
+        column = _worker_matrix.matrix[:, _worker_matrix.answer_index(answer)]
+        return {code: (column == code).nonzero()[0].tolist()
+                for code in codes}
+    answer_letter_counts = Counter(answer)
+    guesses_by_code = {code: [] for code in codes}
+    for g_index,g in enumerate(_worker_guesses):
+        code = 0
+        for d in score_guess_digits(g, answer, answer_letter_counts):
+            code = code*3 + d
+        if code in guesses_by_code:
+            guesses_by_code[code].append(g_index)
+    return guesses_by_code
+
+def _bits(indices):
+    # bitset with the specified bits set
+    bits = bytearray((max(indices, default=-1)+8) // 8)
+    for i in indices:
+        bits[i // 8] |= 1 << (i % 8)
+    return int.from_bytes(bits, 'little')
+
+def _hard_mode_sequence(rows_guesses, rows_letter_statuses):
+    # Depth-first search for one guess per row, each obeying hard mode
+    #  constraints from the guesses before it.  Returns (the guesses, or None
+    #  if not found, and whether the search was exhaustive).
+    # Each row only tries those of its guesses that the constraints so far
+    #  allow (a single AND of bitsets, see GuessIndex), and of those only one
+    #  for each distinct set of constraints they lead to (i.e. for each
+    #  combination of letters where the row's statuses reveal them), with
+    #  sets of constraints that already led nowhere from a row never tried
+    #  from it again.  So a grid that no sequence obeying hard mode could have
+    #  produced is ruled out after trying a handful of guesses per row, rather
+    #  than every combination of them.
+    # (guess indices are the same as the guess index's, since both are over
+    #  all valid guesses, sorted)
+    guess_index = _worker_lexicon.guess_index()
+    rows_bits = [_bits(guesses) for guesses in rows_guesses]
+    rows_revealed_positions = [[i
+                                for i,s in enumerate(letter_statuses)
+                                if s != LetterStatus.WRONG]
+                               for letter_statuses in rows_letter_statuses]
+    guesses_left = _MAX_HARD_MODE_SEARCH_GUESSES
+    dead_ends = set() # (row, constraints) from which no sequence was found
+    def search(r, constraints):
+        nonlocal guesses_left
+        if r == len(rows_guesses):
+            return []
+        if (r, constraints) in dead_ends:
+            return None
+        allowed = rows_bits[r] & constraints.filter_bits(guess_index)
+        tried = set() # revealed letters of guesses already tried at this row
+        while allowed:
+            if guesses_left == 0:
+                return None
+            guesses_left -= 1
+            lowest_bit = allowed & -allowed
+            allowed ^= lowest_bit
+            guess = _worker_guesses[lowest_bit.bit_length() - 1]
+            revealed = tuple(guess[i] for i in rows_revealed_positions[r])
+            if revealed in tried:
+                continue
+            tried.add(revealed)
+            rest = search(r+1, constraints.with_guess(guess,
+                                                      rows_letter_statuses[r]))
+            if rest is not None:
+                return [guess] + rest
+        dead_ends.add((r, constraints))
+        return None
+    sequence = search(0, HardModeConstraints())
+    return (sequence, sequence is not None or guesses_left > 0)
+
+def _invert_for_answer(answer, row_codes, hard_mode):
+    # (rows are gone through in order, giving up on the answer as soon as
+    #  there's a row that no guess could have produced)
+    guesses_by_code = _guesses_by_code(answer, set(row_codes))
+    rows_guesses = []
+    for code in row_codes:
+        if not guesses_by_code[code]:
+            return None
+        rows_guesses.append(guesses_by_code[code])
+    if not hard_mode:
+        example_guesses = [_worker_guesses[guesses[0]] for guesses in rows_guesses]
+    else:
+        (example_guesses,
+         exhaustive) = _hard_mode_sequence(rows_guesses,
+                                           [letter_statuses_from_pattern_code(code, len(answer))
+                                            for code in row_codes])
+        if example_guesses is None and exhaustive:
+            return None
+    return GridAnswer(answer,
+                      [len(guesses) for guesses in rows_guesses],
+                      example_guesses)
+
+def _invert_for_answers(task):
+    (answers, row_codes, hard_mode) = task
+    return [_invert_for_answer(answer, row_codes, hard_mode)
+            for answer in answers]
+
+class ShareGridInversion:
+
+    # Works out which answers (and guesses) could have produced a share grid
+    #  (see ShareableStatus), out of every answer or just a specific day's,
+    #  across all CPU cores.
+
+    def __init__(self,
+                 words_file_path,
+                 share_text,
+                 day_spec=None,
+                 num_processes=None):
+        self.__WORDS_FILE_PATH = words_file_path
+        self.__SHARE_TEXT      = share_text
+        self.__DAY_SPEC        = day_spec
+        self.__NUM_PROCESSES   = num_processes or os.cpu_count()
+        self.__error           = None
+        self.__results         = [] # GridAnswer for each answer that could have produced grid, most guess sequences first
+        self.__unknown         = [] # GridAnswer for each answer the hard mode search gave up on, likewise
+        self.__num_answers     = 0
+        self.__num_processes   = None # (fewer than specified if there aren't enough answers to need them)
+        self.__elapsed         = None
+
+    def run(self):
+        parsed = ShareableStatus.parse(self.__SHARE_TEXT)
+        if parsed is None:
+            self.__error = 'No share grid found'
+            return self.__results
+        (hard_mode, rows) = parsed
+        words = Words(self.__WORDS_FILE_PATH)
+        if self.__DAY_SPEC:
+            (_, _, answer) = words.daily_answer(self.__DAY_SPEC)
+            if answer is None:
+                self.__error = f'No answer for day {self.__DAY_SPEC}'
+                return self.__results
+            answers = [answer]
+        else:
+            answers = sorted(set(words.all_answers()))
+        if len(rows[0]) != len(answers[0]):
+            self.__error = f'Share grid is not for {len(answers[0])}-letter words'
+            return self.__results
+        try:
+            # make sure pattern matrix is cached before starting workers, so
+            #  that they all just map it instead of each computing it
+            from patterns import PatternMatrix
+        except ImportError:
+            pass
+        else:
+            PatternMatrix.from_cache(words)
+        row_codes = [pattern_code(row) for row in rows]
+        start_time = time.perf_counter()
+        tasks = [(answers[i:i+_ANSWERS_PER_TASK], row_codes, hard_mode)
+                 for i in range(0, len(answers), _ANSWERS_PER_TASK)]
+        self.__num_processes = min(self.__NUM_PROCESSES, len(tasks))
+        with multiprocessing.Pool(self.__num_processes,
+                                  _init_worker,
+                                  (self.__WORDS_FILE_PATH,)) as pool:
+            for results in pool.imap(_invert_for_answers, tasks):
+                for grid_answer in results:
+                    if grid_answer is None:
+                        continue
+                    if grid_answer.example_guesses is None:
+                        self.__unknown.append(grid_answer)
+                    else:
+                        self.__results.append(grid_answer)
+        for grid_answers in (self.__results, self.__unknown):
+            grid_answers.sort(key=lambda grid_answer: -prod(grid_answer.guesses_per_row))
+        self.__num_answers = len(answers)
+        self.__elapsed     = time.perf_counter() - start_time
+        return self.__results
+
+    def print_results(self):
+        if self.__error is not None:
+            print(self.__error)
+            return
+        for grid_answer in self.__results + self.__unknown:
+            example = ('unknown (hard mode search gave up)'
+                       if grid_answer.example_guesses is None else
+                       'e.g. ' + ' '.join(grid_answer.example_guesses).upper())
+            print(f'{grid_answer.answer.upper()}'
+                  f'  guesses per row {" ".join(str(n) for n in grid_answer.guesses_per_row)}'
+                  f'  {example}')
+        print(f'{len(self.__results)}/{self.__num_answers} answers possible', end='')
+        if self.__unknown:
+            print(f' ({len(self.__unknown)} unknown)', end='')
+        print(f' in {self.__elapsed:.2f}s'
+              f' ({self.__num_processes} processes)')
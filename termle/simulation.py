@@ -0,0 +1,139 @@
+# Copyright (c) 2022, cemysce
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import multiprocessing
+import os
+import random
+import time
+
+from constants import STRATEGY_NAMES
+from gamecore  import GameCore, GuessResult
+from playstats import PlayStats
+from words     import Words
+
+# Strategies choose the next guess for an in-progress game, given its
+#  GameCore and a random number generator seeded specifically for that game
+#  (so that results are reproducible regardless of how games are distributed
+#  across processes).  They must be module-level functions so that worker
+#  processes can find them by name.
+
+def _first_candidate(game_core, rng):
+    return game_core.remaining_answers()[0]
+
+def _random_candidate(game_core, rng):
+    return rng.choice(game_core.remaining_answers())
+
+def _max_entropy(game_core, rng):
+    global _worker_solver
+    if _worker_solver is None:
+        # imported here so that NumPy is only needed if this strategy is used
+        from solver import Solver
+        _worker_solver = Solver(_worker_words, num_processes=1)
+    return _worker_solver.best_guess(game_core)
+
+STRATEGIES = {'first-candidate':  _first_candidate,
+              'random-candidate': _random_candidate,
+              'max-entropy':      _max_entropy}
+assert tuple(STRATEGIES) == STRATEGY_NAMES
+
+# number of games handed to a worker process at a time
+_GAMES_PER_TASK = 64
+
+# per-process state, set up once by _init_worker() (or on first use) rather
+#  than being sent along with every task
+_worker_words   = None
+_worker_lexicon = None
+_worker_solver  = None
+
+def _init_worker(words_file_path):
+    global _worker_words, _worker_lexicon
+    _worker_words   = Words(words_file_path)
+    _worker_lexicon = _worker_words.lexicon()
+
+def _play_games(task):
+    # returns number of guesses each game was won in (None if lost)
+    (strategy_name, answers, max_guesses, hard_mode) = task
+    strategy = STRATEGIES[strategy_name]
+    results = []
+    for answer in answers:
+        rng = random.Random(f'{strategy_name}:{answer}')
+        game_core = GameCore(answer, _worker_lexicon, max_guesses, hard_mode)
+        while not game_core.is_completed():
+            for l in strategy(game_core, rng):
+                game_core.append_letter_to_pending_guess(l)
+            (guess_result, _, _) = game_core.submit_pending_guess()
+            assert guess_result in (GuessResult.RIGHT,
+                                    GuessResult.WRONG,
+                                    GuessResult.WRONG_AND_GAME_OVER)
+        results.append(len(game_core.guesses) if game_core.is_won() else None)
+    return results
+
+class Simulation:
+
+    def __init__(self,
+                 words_file_path,
+                 strategy_names,
+                 max_guesses,
+                 hard_mode,
+                 num_processes=None):
+        if any(name not in STRATEGIES for name in strategy_names):
+            raise
+        self.__WORDS_FILE_PATH = words_file_path
+        self.__STRATEGY_NAMES  = list(strategy_names)
+        self.__MAX_GUESSES     = max_guesses
+        self.__HARD_MODE       = hard_mode
+        self.__NUM_PROCESSES   = num_processes or os.cpu_count()
+        self.__results         = {} # strategy name -> (play stats, elapsed seconds)
+
+    def run(self):
+        # every strategy plays every answer once
+        words = Words(self.__WORDS_FILE_PATH)
+        answers = words.all_answers()
+        if 'max-entropy' in self.__STRATEGY_NAMES:
+            # make sure pattern matrix is cached before starting workers, so
+            #  that they all just map it instead of each computing it
+            #  (imported here so that NumPy is only needed if this strategy is
+            #  used)
+            from patterns import PatternMatrix
+            PatternMatrix.from_cache(words)
+        with multiprocessing.Pool(self.__NUM_PROCESSES,
+                                  _init_worker,
+                                  (self.__WORDS_FILE_PATH,)) as pool:
+            for strategy_name in self.__STRATEGY_NAMES:
+                tasks = [(strategy_name,
+                          answers[i:i+_GAMES_PER_TASK],
+                          self.__MAX_GUESSES,
+                          self.__HARD_MODE)
+                         for i in range(0, len(answers), _GAMES_PER_TASK)]
+                play_stats = PlayStats(self.__MAX_GUESSES)
+                start_time = time.perf_counter()
+                for results in pool.imap_unordered(_play_games, tasks):
+                    for num_guesses in results:
+                        if num_guesses is None:
+                            play_stats.register_loss()
+                        else:
+                            play_stats.register_win(num_guesses)
+                elapsed = time.perf_counter() - start_time
+                self.__results[strategy_name] = (play_stats, elapsed)
+        return self.__results
+
+    def print_results(self):
+        for strategy_name,(play_stats,elapsed) in self.__results.items():
+            num_games = play_stats.num_completed()
+            print(f'Strategy "{strategy_name}":')
+            print(f'  {num_games} games in {elapsed:.2f}s'
+                  f' ({num_games/elapsed:.1f} games/sec,'
+                  f' {self.__NUM_PROCESSES} processes)')
+            print(f'  Won {play_stats.num_won()}/{num_games}'
+                  f' ({play_stats.percent_won()}%)')
+            distribution = play_stats.guess_distribution()
+            count_print_width = len(str(max(distribution.values())))
+            total_guesses = sum(g*count for g,count in distribution.items())
+            if play_stats.num_won() > 0:
+                print(f'  Average guesses per win:'
+                      f' {total_guesses/play_stats.num_won():.3f}')
+            for g,count in distribution.items():
+                print(f'  {g}: {count:{count_print_width}}')
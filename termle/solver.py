@@ -0,0 +1,210 @@
+# Copyright (c) 2022, cemysce
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import multiprocessing
+import os
+
+import numpy as np
+
+from constants import PATTERNS_FILENAME
+from gamecore    import GameCore, HardModeConstraints, pattern_code
+from openingbook import OpeningBook
+from patterns    import PatternMatrix
+
+# number of (guess, answer) pattern codes tallied at once, chosen so that
+#  the intermediate arrays stay reasonably small
+_CELLS_PER_CHUNK = 1 << 21
+
+# below this many answers per possible pattern code, counting bucket sizes by
+#  sorting each guess's pattern codes is quicker than tallying every bucket
+_MAX_ANSWERS_PER_PATTERN_FOR_SORTING = 1/6
+
+# below this many (guess, answer) pairs, farming out work to other processes
+#  costs more than it saves
+_MIN_CELLS_FOR_PARALLEL = 1 << 23
+
+def _entropies(matrix, guess_indices, answer_indices, num_patterns):
+    # Expected information (in bits) gained by each guess, if the answer is
+    #  equally likely to be any of the specified answers.  For a guess whose
+    #  pattern codes split n answers into buckets of sizes c, that's
+    #  log2(n) - sum(c*log2(c))/n, with c*log2(c) looked up from a table.
+    num_answers = len(answer_indices)
+    sizes = np.arange(num_answers+1, dtype=np.float64)
+    c_log2_c = np.zeros(num_answers+1)
+    c_log2_c[1:] = sizes[1:] * np.log2(sizes[1:])
+    entropies = np.empty(len(guess_indices))
+    rows_per_chunk = max(1, _CELLS_PER_CHUNK // max(1, num_answers))
+    for start in range(0, len(guess_indices), rows_per_chunk):
+        rows = guess_indices[start:start+rows_per_chunk]
+        # only the needed cells are read, rather than entire rows of all
+        #  answers (which matters once few answers remain), and consecutive
+        #  guesses (the usual case) as a slice, which is cheaper to gather from
+        if rows[-1]-rows[0] == len(rows)-1:
+            codes = np.asarray(matrix[rows[0]:rows[-1]+1]).take(answer_indices, axis=1)
+        else:
+            codes = matrix[np.ix_(rows, answer_indices)]
+        if num_answers < num_patterns*_MAX_ANSWERS_PER_PATTERN_FOR_SORTING:
+            # Fewer answers than possible pattern codes, so rather than
+            #  tallying every (mostly empty) bucket, sort each guess's codes
+            #  and find each code's position k within its run of equal codes,
+            #  since a bucket of size c is then the sum of its positions'
+            #  k*log2(k) - (k-1)*log2(k-1).
+            codes = np.sort(codes, axis=1)
+            positions = np.broadcast_to(np.arange(num_answers), codes.shape)
+            run_starts = np.zeros(codes.shape, dtype=np.int64)
+            run_starts[:, 1:] = np.where(codes[:, 1:] != codes[:, :-1],
+                                         positions[:, 1:],
+                                         0)
+            np.maximum.accumulate(run_starts, axis=1, out=run_starts)
+            sum_c_log2_c = np.diff(c_log2_c)[positions - run_starts].sum(axis=1)
+        else:
+            codes = codes.astype(np.int64)
+            codes += (np.arange(len(rows)) * num_patterns)[:, None]
+            bucket_sizes = np.bincount(codes.ravel(),
+                                       minlength=len(rows)*num_patterns)
+            sum_c_log2_c = c_log2_c[bucket_sizes].reshape(len(rows), num_patterns).sum(axis=1)
+        entropies[start:start+len(rows)] = np.log2(num_answers) - sum_c_log2_c/num_answers
+    return entropies
+
+# per-process state for worker processes, set up once by _init_worker()
+_worker_matrix = None
+
+def _init_worker(patterns_file_path):
+    global _worker_matrix
+    _worker_matrix = np.load(patterns_file_path, mmap_mode='r')
+
+def _worker_entropies(task):
+    return _entropies(_worker_matrix, *task)
+
+class Solver:
+
+    def __init__(self, words, num_processes=None):
+        self.__WORDS         = words
+        self.__PATTERNS      = PatternMatrix.from_cache(words)
+        self.__PATTERNS_FILE = PATTERNS_FILENAME.format(digest=words.hash_digest())
+        self.__LEXICON       = words.lexicon()
+        self.__NUM_PATTERNS  = 3**self.__LEXICON.WORD_LENGTH
+        self.__ANSWER_GUESS_INDICES = np.array([self.__PATTERNS.guess_index(a)
+                                                for a in self.__PATTERNS.ANSWERS],
+                                               dtype=np.int64)
+        self.__NUM_PROCESSES = num_processes or os.cpu_count()
+        self.__pool          = None # created on first use
+        self.__opening_rankings = {} # hard mode -> ranking before any guess
+        self.__opening_books    = {} # hard mode -> OpeningBook (or None), loaded on first use
+
+    def close(self):
+        if self.__pool is not None:
+            self.__pool.close()
+            self.__pool.join()
+            self.__pool = None
+
+    def remaining_answer_indices(self, guesses):
+        # indices (into all answers) of answers consistent with all guesses
+        matches = np.ones(len(self.__PATTERNS.ANSWERS), dtype=bool)
+        for guess in guesses:
+            matches &= (  self.__PATTERNS.patterns_for_guess(guess.word)
+                       == pattern_code(guess.letter_statuses))
+        return np.flatnonzero(matches)
+
+    def possible_pattern_codes(self, guesses, guess_word):
+        # distinct pattern codes that the guess could get next
+        answer_indices = self.remaining_answer_indices(guesses)
+        return [int(code)
+                for code in np.unique(self.__PATTERNS.patterns_for_guess(guess_word)[answer_indices])]
+
+    def information(self, game_core_or_guesses, guess_word):
+        # expected bits of information from making the guess next (see
+        #  _entropies())
+        if isinstance(game_core_or_guesses, GameCore):
+            guesses = game_core_or_guesses.guesses
+        else:
+            guesses = tuple(game_core_or_guesses)
+        answer_indices = self.remaining_answer_indices(guesses)
+        if len(answer_indices) == 0:
+            return 0.0
+        return float(_entropies(self.__PATTERNS.matrix,
+                                np.array([self.__PATTERNS.guess_index(guess_word)]),
+                                answer_indices,
+                                self.__NUM_PATTERNS)[0])
+
+    def __legal_guess_indices(self, guesses, hard_mode):
+        if not hard_mode:
+            return np.arange(len(self.__PATTERNS.GUESSES))
+        constraints = HardModeConstraints()
+        for guess in guesses:
+            constraints = constraints.with_guess(guess.word, guess.letter_statuses)
+        return np.array([self.__PATTERNS.guess_index(g)
+                         for g in constraints.filter(self.__LEXICON.guess_index())],
+                        dtype=np.int64)
+
+    def __parallel_entropies(self, guess_indices, answer_indices):
+        if (   self.__NUM_PROCESSES <= 1
+            or len(guess_indices)*len(answer_indices) < _MIN_CELLS_FOR_PARALLEL):
+            return _entropies(self.__PATTERNS.matrix,
+                              guess_indices,
+                              answer_indices,
+                              self.__NUM_PATTERNS)
+        if self.__pool is None:
+            self.__pool = multiprocessing.Pool(self.__NUM_PROCESSES,
+                                               _init_worker,
+                                               (self.__PATTERNS_FILE,))
+        tasks = [(part, answer_indices, self.__NUM_PATTERNS)
+                 for part in np.array_split(guess_indices, self.__NUM_PROCESSES)]
+        return np.concatenate(self.__pool.map(_worker_entropies, tasks))
+
+    def rank(self, game_core_or_guesses, hard_mode=None, limit=None):
+        # Returns (guess, expected bits of information) for every guess that
+        #  can be made next, best first.  Ties are broken in favor of guesses
+        #  that could themselves be the answer, then alphabetically.
+        if isinstance(game_core_or_guesses, GameCore):
+            guesses = game_core_or_guesses.guesses
+            if hard_mode is None:
+                hard_mode = game_core_or_guesses.HARD_MODE
+        else:
+            guesses = tuple(game_core_or_guesses)
+        hard_mode = bool(hard_mode)
+
+        if not guesses and hard_mode in self.__opening_rankings:
+            ranking = self.__opening_rankings[hard_mode]
+            return ranking if limit is None else ranking[:limit]
+
+        answer_indices = self.remaining_answer_indices(guesses)
+        guess_indices  = self.__legal_guess_indices(guesses, hard_mode)
+        if len(answer_indices) == 0:
+            return []
+        entropies = self.__parallel_entropies(guess_indices, answer_indices)
+        is_candidate = np.zeros(len(self.__PATTERNS.GUESSES), dtype=bool)
+        is_candidate[self.__ANSWER_GUESS_INDICES[answer_indices]] = True
+        # (guesses are sorted alphabetically, so sorting by index suffices)
+        order = np.lexsort((guess_indices,
+                            ~is_candidate[guess_indices],
+                            -entropies))
+        if limit is not None and guesses:
+            order = order[:limit]
+        ranking = [(self.__PATTERNS.GUESSES[guess_indices[i]], float(entropies[i]))
+                   for i in order]
+
+        if not guesses:
+            self.__opening_rankings[hard_mode] = ranking
+        return ranking if limit is None else ranking[:limit]
+
+    def best_guess(self, game_core_or_guesses, hard_mode=None):
+        # looked up in the opening book if there is one (see openingbook
+        #  module), falling back to ranking all guesses
+        if hard_mode is None and isinstance(game_core_or_guesses, GameCore):
+            book_hard_mode = game_core_or_guesses.HARD_MODE
+        else:
+            book_hard_mode = bool(hard_mode)
+        if book_hard_mode not in self.__opening_books:
+            self.__opening_books[book_hard_mode] = OpeningBook.from_cache(self.__WORDS,
+                                                                          book_hard_mode)
+        book = self.__opening_books[book_hard_mode]
+        if book is not None:
+            guess = book.best_guess(game_core_or_guesses)
+            if guess is not None:
+                return guess
+        ranking = self.rank(game_core_or_guesses, hard_mode, limit=1)
+        return ranking[0][0] if ranking else None
@@ -0,0 +1,40 @@
+# Copyright (c) 2022, cemysce
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import time
+
+class StartupProfile:
+
+    # How long each phase of starting a game took, from as early as the
+    #  program can measure (before importing most modules, see termle.py) up
+    #  to the game first being painted, so that startup can be kept within
+    #  some budget (see --profile-startup).  Each phase lasts from the end of
+    #  the one before it until it's marked as done.
+
+    def __init__(self, start_time):
+        self.__START_TIME = start_time
+        self.__last_time  = start_time
+        self.__phases     = [] # (name, elapsed seconds), in order
+
+    def mark(self, phase_name):
+        now = time.perf_counter()
+        self.__phases.append((phase_name, now - self.__last_time))
+        self.__last_time = now
+
+    def total_msec(self):
+        return (self.__last_time - self.__START_TIME) * 1000
+
+    def print_results(self, budget_msec=None):
+        name_width = max(len(name) for name,_ in self.__phases)
+        for name,elapsed in self.__phases:
+            print(f'{name:<{name_width}} {elapsed*1000:7.1f}ms')
+        print(f'{"total":<{name_width}} {self.total_msec():7.1f}ms', end='')
+        if budget_msec is None:
+            print()
+        elif self.total_msec() <= budget_msec:
+            print(f' (within {budget_msec}ms budget)')
+        else:
+            print(f' (OVER {budget_msec}ms budget)')
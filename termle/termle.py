@@ -6,23 +6,78 @@
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
 
+import time
+
+# (taken before importing anything else, so that --profile-startup can time
+#  importing too)
+START_TIME = time.perf_counter()
+
+import glob
+import os
 import sys
 
 import constants
 
-from arguments         import Arguments
-from configuration     import Configuration
-from gamecore          import GameCore
-from graphics.graphics import Graphics
-from savedstate        import DailyStateManager
-from words             import Words
+# NOTE: Modules only needed by some modes (including by some kinds of game,
+#        and by playing at all, i.e. graphics) are imported in those modes'
+#        branches below, so that each mode only waits on importing what it
+#        uses.
+from arguments      import Arguments
+from configuration  import Configuration
+from gamecore       import GameCore
+from savedstate     import DailyStateManager
+from startupprofile import StartupProfile
+from words          import Words
 
 def main():
+    startup_profile = StartupProfile(START_TIME)
+    startup_profile.mark('imports')
     args = Arguments()
+    startup_profile.mark('argument parsing')
     if args.download:
-        word_lists = Words(constants.WORDS_FILENAME, True)
+        # Caches (pattern matrix, opening books, difficulty index) are named
+        #  after the word lists' hash digest, so any for the word lists being
+        #  replaced are stale once new word lists are downloaded.  They're
+        #  removed, and since they were in use, rebuilt for the new word lists
+        #  right away instead of on next use (importing NumPy only if actually
+        #  needed).
+        #  Caches for other word lists files (see -w) are left alone.
+        old_digest = None
+        if os.path.exists(args.words_file):
+            try:
+                old_digest = Words(args.words_file).hash_digest()
+            except Exception:
+                pass # unreadable, so being overwritten regardless
+        word_lists = Words(args.words_file, True, args.upstream_url)
+        if old_digest is not None and old_digest != word_lists.hash_digest():
+            stale_patterns_file_paths   = glob.glob(constants.PATTERNS_FILENAME.format(digest=old_digest))
+            stale_book_file_paths       = glob.glob(constants.BOOK_FILENAME.format(digest=old_digest,
+                                                                                   mode='*'))
+            stale_difficulty_file_paths = glob.glob(constants.DIFFICULTY_FILENAME.format(digest=old_digest))
+            for stale_file_path in (  stale_patterns_file_paths
+                                    + stale_book_file_paths
+                                    + stale_difficulty_file_paths):
+                os.remove(stale_file_path)
+            if stale_patterns_file_paths:
+                from patterns import PatternMatrix
+                PatternMatrix.from_cache(word_lists)
+            if stale_book_file_paths:
+                from openingbook import OpeningBook
+                from solver      import Solver
+                solver = Solver(word_lists)
+                for hard_mode in (False, True):
+                    OpeningBook.build_cache(solver, word_lists, hard_mode)
+                solver.close()
+            if stale_difficulty_file_paths:
+                from difficulty import DifficultyIndex
+                DifficultyIndex.build_cache(args.words_file)
+    elif args.benchmark_scoring:
+        # (doesn't need word lists)
+        from benchmark import print_scoring_benchmark
+        print_scoring_benchmark()
     else:
-        word_lists = Words(constants.WORDS_FILENAME)
+        word_lists = Words(args.words_file, upstream_url=args.upstream_url)
+        startup_profile.mark('word lists load')
         if args.deobfuscate or args.deobfuscate_with_spoilers:
             if args.deobfuscate:
                 print('Sorted answers:')
@@ -41,6 +96,57 @@ def main():
             pass
         elif args.word_stats:
             word_lists.print_statistics()
+        elif args.simulate:
+            from simulation import Simulation
+            config = Configuration(constants.CONFIG_FILENAME)
+            simulation = Simulation(args.words_file,
+                                    args.simulate,
+                                    config.max_guesses,
+                                    config.hard_mode)
+            simulation.run()
+            simulation.print_results()
+        elif args.analyze_history:
+            from history import HistoryAnalysis
+            history_analysis = HistoryAnalysis(args.words_file,
+                                               constants.DAILY_STATE_FILENAME)
+            history_analysis.run()
+            history_analysis.print_results()
+        elif args.difficulty is not None:
+            from difficulty import DifficultyIndex
+            (day_offset, _, _) = word_lists.daily_answer(args.difficulty)
+            if day_offset is None:
+                print(f'No answer for day {args.difficulty}')
+            else:
+                difficulty_index = (   DifficultyIndex.from_cache(word_lists)
+                                    or DifficultyIndex.build_cache(args.words_file))
+                answer_difficulty = difficulty_index.day(day_offset)
+                print(f'#{day_offset}: {difficulty_index.describe(day_offset)}')
+                print(f'  Answers left after first guess: {answer_difficulty.first_bucket_size:.1f}')
+                print(f'  Letter rarity: {round(answer_difficulty.letter_rarity*100)}%')
+        elif args.invert_share_grid is not None:
+            from sharegrid import ShareGridInversion
+            share_grid_inversion = ShareGridInversion(args.words_file,
+                                                      sys.stdin.read(),
+                                                      args.invert_share_grid)
+            share_grid_inversion.run()
+            share_grid_inversion.print_results()
+        elif args.serve_upstream_fixture is not None:
+            from upstreamfixture import UpstreamFixture
+            upstream_fixture = UpstreamFixture(word_lists, args.serve_upstream_fixture)
+            print(f'Serving stand-in for upstream at {upstream_fixture.URL}'
+                  f' (download with: -D --upstream-url {upstream_fixture.URL})')
+            upstream_fixture.serve_forever()
+        elif args.build_opening_book is not None:
+            # imported here so that NumPy is only needed if a book is built
+            from openingbook import OpeningBook
+            from solver      import Solver
+            solver = Solver(word_lists)
+            for hard_mode in (False, True):
+                OpeningBook.build_cache(solver,
+                                        word_lists,
+                                        hard_mode,
+                                        args.build_opening_book)
+            solver.close()
         else:
             config = Configuration(constants.CONFIG_FILENAME)
             if args.play_daily:
@@ -50,15 +156,18 @@ def main():
                 if any(x is None for x in (day_offset, is_for_today, answer)):
                     raise
                 if is_for_today:
+                    digest = word_lists.hash_digest()
+                    startup_profile.mark('hash digest')
                     daily_state_manager = DailyStateManager(constants.DAILY_STATE_FILENAME,
-                                                            word_lists.hash_digest(),
+                                                            digest,
                                                             config.max_guesses,
                                                             day_offset)
                     (saved_play_stats,
                      saved_guesses,
                      saved_pending_guess_letters) = daily_state_manager.get()
+                    startup_profile.mark('saved state load')
                     game_core = GameCore(answer,
-                                         word_lists.valid_guesses(),
+                                         word_lists.lexicon(),
                                          config.max_guesses,
                                          config.hard_mode,
                                          saved_play_stats,
@@ -66,24 +175,74 @@ def main():
                                          saved_pending_guess_letters)
                 else:
                     game_core = GameCore(answer,
-                                         word_lists.valid_guesses(),
+                                         word_lists.lexicon(),
                                          config.max_guesses,
                                          config.hard_mode)
+            elif args.adversarial:
+                from adversary import Adversary
+                lexicon = word_lists.adversarial_lexicon()
+                game_core = GameCore(None,
+                                     lexicon,
+                                     config.max_guesses,
+                                     config.hard_mode,
+                                     adversary=Adversary(lexicon))
+            elif args.boards > 1:
+                from multigame import MultiGameCore
+                game_core = MultiGameCore(word_lists.random_answers(args.boards),
+                                          word_lists.lexicon(),
+                                          config.max_guesses + args.boards-1,
+                                          config.hard_mode)
             else:
                 game_core = GameCore(word_lists.random_answer(),
-                                     word_lists.valid_guesses(),
+                                     word_lists.lexicon(),
                                      config.max_guesses,
                                      config.hard_mode)
 
+            # (hints and analysis are only for a single board with an answer,
+            #  and not for games whose play stats are tracked, i.e. today's
+            #  daily game, so that hinted games can't count towards them)
+            hinter = None
+            if (    args.boards == 1
+                and not args.adversarial
+                and game_core.play_stats is None):
+                from hints import Hinter
+                hinter = Hinter(word_lists)
+            # (difficulty only shown if already worked out, since that takes a
+            #  while, see --difficulty)
+            difficulty_index = None
             if args.play_daily:
-                gui = Graphics(game_core, config, str(day_offset))
-            else:
-                gui = Graphics(game_core, config)
+                from difficulty import DifficultyIndex
+                difficulty_index = DifficultyIndex.from_cache(word_lists)
+            startup_profile.mark('game setup')
+
+            from graphics.graphics import Graphics
+            startup_profile.mark('graphics imports')
+
+            # (when only profiling startup, game quits as soon as it's first
+            #  painted, without saving anything)
+            profiling_startup = args.profile_startup is not False
+            gui = Graphics(game_core,
+                           config,
+                           str(day_offset) if args.play_daily else None,
+                           hinter,
+                           (None
+                            if difficulty_index is None else
+                            difficulty_index.describe(day_offset)),
+                           startup_profile if profiling_startup else None)
             gui.run()
 
+            if profiling_startup:
+                budget_msec = (None
+                               if args.profile_startup is True else
+                               args.profile_startup)
+                startup_profile.print_results(budget_msec)
+                return (1
+                        if budget_msec is not None and startup_profile.total_msec() > budget_msec else
+                        0)
+
             if args.play_daily and is_for_today:
                 daily_state_manager.save(game_core.play_stats,
-                                         [guess['word']
+                                         [guess.word
                                           for guess in game_core.guesses],
                                          game_core.pending_guess_letters[:], # shallow copy the list (each element is immutable so no need to deep copy)
                                          game_core.is_completed())
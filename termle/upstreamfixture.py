@@ -0,0 +1,78 @@
+# Copyright (c) 2022, cemysce
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import email.utils
+import hashlib
+import http.server
+import time
+
+# number of bytes of filler code around the word lists in the JavaScript
+#  source, so that it's roughly as big as upstream's and downloading it takes
+#  more than a single chunk (see Words)
+_FILLER_SIZE = 1024 * 1024
+
+class UpstreamFixture:
+
+    # Local stand-in for the upstream game's site, serving a page and the
+    #  JavaScript source it refers to, with word lists in the JavaScript source
+    #  the way upstream's has them, so that downloading word lists (see -D and
+    #  --upstream-url) can be tested and timed without network access.  Like
+    #  upstream, it answers conditional requests (If-None-Match or
+    #  If-Modified-Since) with 304 Not Modified if nothing changed, which for
+    #  a stand-in means for as long as it's running.
+
+    def __init__(self, words, port=0):
+        filler = b'var _=0;' * (_FILLER_SIZE // (2*len(b'var _=0;')))
+        def array(word_list):
+            return b'[' + b','.join(b'"%s"' % w.encode() for w in word_list) + b']'
+        js = (  filler
+              + b'var Ma=' + array(words.all_answers())
+              + b',Oa=' + array(words.additional_valid_guesses())
+              + b';'
+              + filler)
+        js_name = f'main.{hashlib.sha256(js).hexdigest()[:8]}.js'
+        html = (  '<!DOCTYPE html><html><head>'
+                 f'<script src="{js_name}"></script>'
+                  '</head><body></body></html>').encode()
+        last_modified = email.utils.formatdate(time.time(), usegmt=True)
+        # path -> (content type, ETag, content)
+        resources = {'/':            ('text/html',
+                                      f'"{hashlib.sha256(html).hexdigest()[:16]}"',
+                                      html),
+                     f'/{js_name}': ('application/javascript',
+                                      f'"{hashlib.sha256(js).hexdigest()[:16]}"',
+                                      js)}
+
+        class RequestHandler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path not in resources:
+                    self.send_error(404)
+                    return
+                (content_type, etag, content) = resources[self.path]
+                if (   self.headers.get('If-None-Match') == etag
+                    or self.headers.get('If-Modified-Since') == last_modified):
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type',   content_type)
+                self.send_header('Content-Length', str(len(content)))
+                self.send_header('ETag',           etag)
+                self.send_header('Last-Modified',  last_modified)
+                self.end_headers()
+                self.wfile.write(content)
+
+        self.__server = http.server.ThreadingHTTPServer(('127.0.0.1', port),
+                                                        RequestHandler)
+        self.URL = f'http://127.0.0.1:{self.__server.server_address[1]}'
+
+    def serve_forever(self):
+        try:
+            self.__server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.__server.server_close()
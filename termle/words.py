@@ -4,6 +4,7 @@
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
 
+import array
 import base64
 import datetime
 import hashlib
@@ -12,14 +13,44 @@ import json
 import os
 import random
 import re
-import requests
 import signal
+import struct
 import sys
 
 from collections import Counter
 
-#_UPSTREAM_GAME_URL = 'https://www.powerlanguage.co.uk/wordle' :'(
-_UPSTREAM_GAME_URL = 'https://www.nytimes.com/games/wordle'
+import packedwords
+
+from constants import UPSTREAM_GAME_URL, WORDS_DIGEST_SUFFIX, WORDS_HTTP_SUFFIX
+from lexicon   import Lexicon
+
+# size of each chunk of JavaScript source scanned for word lists as it's
+#  downloaded
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+def _find_word_arrays(chunks, word_length):
+    # Yields each array literal of quoted lowercase words of the specified
+    #  length (e.g. =["abcde","fghij"]) as a list of words, from JavaScript
+    #  source given as chunks of bytes, holding on to no more than the chunk
+    #  being scanned plus the start of any array literal it continues.
+    word = rb'"[a-z]{%d}"' % word_length
+    array_pattern   = re.compile(rb'=\[(' + word + rb'(?:,' + word + rb')*)\]')
+    partial_pattern = re.compile(rb'=\[(?:' + word + rb',)*(?:"[a-z]{0,%d}"?)?' % word_length)
+    scanned = b''
+    for chunk in chunks:
+        scanned += chunk
+        end = 0
+        for m in array_pattern.finditer(scanned):
+            yield [w.strip(b'"').decode() for w in m.group(1).split(b',')]
+            end = m.end()
+        # keep whatever could be an array literal that the next chunk
+        #  continues (or, failing that, the last byte, which could be the
+        #  start of one)
+        start = scanned.rfind(b'=[', end)
+        if start >= 0 and partial_pattern.fullmatch(scanned, start):
+            scanned = scanned[start:]
+        else:
+            scanned = scanned[-1:]
 
 class Words:
 
@@ -30,80 +61,292 @@ class Words:
                       'Base64':  {'encode': base64.b64encode, 'decode': base64.b64decode},
                       'Base85':  {'encode': base64.b85encode, 'decode': base64.b85decode},
                       'Ascii85': {'encode': base64.a85encode, 'decode': base64.a85decode}}
-    __DEFAULT_OBFUSCATION = 'Ascii85'
+
+    # Word lists are written in a binary format (though the file keeps its
+    #  name), starting with a fixed-size header:
+    #   - magic bytes, telling it apart from the older JSON format (which is
+    #     still read, with each word obfuscated using one of the codecs above)
+    #   - format version
+    #   - word length
+    #   - width of each word's record, in bytes
+    #   - number of answers, then of additional valid guesses
+    #   - word lists' hash digest (see hash_digest())
+    #  followed by an obfuscation key (one record wide), then every answer in
+    #  series order and every additional valid guess in sorted order, each as
+    #  a fixed-width record holding the word packed (see packedwords module),
+    #  little-endian.  Packed words fit in 8-byte records unless they're
+    #  longer than 12 letters, so that usually the records can be copied
+    #  straight into an array of 64-bit unsigned integers.  Every record is
+    #  XOR-ed with the key, so that answers can't be read straight off the
+    #  file, but the whole buffer can be deobfuscated at once.
+    __MAGIC                = b'TRMLWRDS'
+    __FORMAT_VERSION       = 1
+    __HEADER               = struct.Struct('<8sBBBxII32s')
+    __COMPACT_RECORD_WIDTH = 8 # bytes (see packedwords.as_compact_sequence())
 
     @classmethod
     def __calc_day_offset(cls, date=datetime.date.today()):
         return (date - cls.__FIRST_DAY).days
 
     @classmethod
-    def __obfuscate(cls, word_list, codec):
-        return [cls.__OBFUSCATIONS[codec]['encode'](w.encode()).decode()
-                for w in word_list]
+    def __record_width(cls, word_length):
+        num_bytes = (word_length*packedwords.BITS_PER_LETTER + 7) // 8
+        return max(num_bytes, cls.__COMPACT_RECORD_WIDTH)
+
+    @staticmethod
+    def __xor_with_key(data, key):
+        # (as a single arbitrarily large integer, so that the whole buffer is
+        #  XOR-ed at once rather than a byte or record at a time)
+        return (  int.from_bytes(data, 'little')
+                ^ int.from_bytes(key * (len(data)//len(key)), 'little')).to_bytes(len(data), 'little')
+
+    @classmethod
+    def __records_to_packed_words(cls, records, record_width):
+        if record_width == cls.__COMPACT_RECORD_WIDTH:
+            packed_words = array.array('Q')
+            packed_words.frombytes(records)
+            if sys.byteorder != 'little':
+                packed_words.byteswap()
+            return packed_words
+        return [int.from_bytes(records[i:i+record_width], 'little')
+                for i in range(0, len(records), record_width)]
+
+    @classmethod
+    def __packed_words_to_records(cls, packed_words, record_width):
+        if record_width == cls.__COMPACT_RECORD_WIDTH:
+            packed_words = array.array('Q', packed_words)
+            if sys.byteorder != 'little':
+                packed_words.byteswap()
+            return packed_words.tobytes()
+        return b''.join(p.to_bytes(record_width, 'little') for p in packed_words)
 
     @classmethod
     def __deobfuscate(cls, obfuscated_word_list, codec):
         return [cls.__OBFUSCATIONS[codec]['decode'](ow.encode()).decode()
                 for ow in obfuscated_word_list]
 
-    def __init__(self, file_path, force_download=False):
-        self.__answer_series            = []
-        self.__additional_valid_guesses = set()
-        self.__word_length              = None
+    def __init__(self, file_path, force_download=False, upstream_url=UPSTREAM_GAME_URL):
+        # Both word lists are stored packed (see packedwords module), with
+        #  additional valid guesses sorted, but each is only decoded from the
+        #  file once something actually needs it, using decoders set up when
+        #  reading the file.  Until then, an answer can still be decoded on its
+        #  own, so that e.g. a daily game only decodes that day's answer up
+        #  front.
+        self.__answer_series                   = None # decoded on first use
+        self.__additional_valid_guesses        = None # likewise
+        self.__num_answers                     = None
+        self.__word_length                     = None
+        self.__decode_answer_series            = None
+        self.__decode_answer                   = None # (by index in answer series)
+        self.__decode_additional_valid_guesses = None
+        self.__hash_digest                     = None # worked out on first use, unless stored (see hash_digest())
+        self.__digest_cache_file_path          = None
+        self.__digest_cache_key                = None
+        self.__lexicon                         = None # built on first use
+        self.__adversarial_lexicon             = None # likewise
         if force_download or not os.path.exists(file_path):
-            self.__download_lists_and_write_file(file_path)
+            self.__download_lists_and_write_file(file_path, upstream_url)
         else:
             self.__read_file(file_path)
 
     def __read_file(self, file_path):
+        with open(file_path, 'rb') as f:
+            magic = f.read(len(self.__MAGIC))
+            if magic == self.__MAGIC:
+                data = magic + f.read()
+        if magic == self.__MAGIC:
+            self.__read_binary_file(data)
+        else:
+            self.__read_json_file(file_path)
+
+    def __read_binary_file(self, data):
+        # (the whole file is read in at once, being small enough that reading
+        #  it takes next to no time, unlike decoding the word lists in it)
+        if len(data) < self.__HEADER.size:
+            raise
+        (_,
+         format_version,
+         word_length,
+         record_width,
+         num_answers,
+         num_additional_valid_guesses,
+         digest) = self.__HEADER.unpack_from(data)
+        if (   format_version != self.__FORMAT_VERSION
+            or record_width != self.__record_width(word_length)):
+            raise
+        records_start = self.__HEADER.size + record_width
+        records_end   = records_start + (num_answers+num_additional_valid_guesses)*record_width
+        if len(data) != records_end:
+            raise
+        key     = data[self.__HEADER.size:records_start]
+        records = data[records_start:records_end] # (still obfuscated)
+        answers_end = num_answers * record_width
+        self.__num_answers = num_answers
+        self.__word_length = word_length
+        self.__hash_digest = digest.hex()
+        def deobfuscate(start, end):
+            return self.__xor_with_key(records[start:end], key)
+        self.__decode_answer_series            = lambda: self.__records_to_packed_words(deobfuscate(0, answers_end),
+                                                                                        record_width)
+        self.__decode_answer                   = lambda i: int.from_bytes(deobfuscate(i*record_width, (i+1)*record_width),
+                                                                          'little')
+        self.__decode_additional_valid_guesses = lambda: self.__records_to_packed_words(deobfuscate(answers_end, len(records)),
+                                                                                        record_width)
+
+    def __write_binary_file(self, file_path):
+        # (written to a temporary file then renamed into place, so that the
+        #  file is never seen partially written)
+        record_width = self.__record_width(self.__word_length)
+        key = os.urandom(record_width)
+        answer_series            = self.__packed_answer_series()
+        additional_valid_guesses = self.__packed_additional_valid_guesses()
+        records = (  self.__packed_words_to_records(answer_series,
+                                                    record_width)
+                   + self.__packed_words_to_records(additional_valid_guesses,
+                                                    record_width))
+        temp_file_path = f'{file_path}.{os.getpid()}.tmp'
+        with open(temp_file_path, 'wb') as f:
+            f.write(self.__HEADER.pack(self.__MAGIC,
+                                       self.__FORMAT_VERSION,
+                                       self.__word_length,
+                                       record_width,
+                                       len(answer_series),
+                                       len(additional_valid_guesses),
+                                       bytes.fromhex(self.hash_digest())))
+            f.write(key)
+            f.write(self.__xor_with_key(records, key))
+        os.replace(temp_file_path, file_path)
+
+        # (any digest cached for a JSON word lists file this replaced no longer
+        #  applies, since this format stores its own)
+        digest_cache_file_path = f'{file_path}{WORDS_DIGEST_SUFFIX}'
+        if os.path.exists(digest_cache_file_path):
+            os.remove(digest_cache_file_path)
+
+    def __read_json_file(self, file_path):
+        # This format has no hash digest stored in it, so one is cached in a
+        #  separate file next to it once worked out, along with the word lists
+        #  file's size and modification time, so that whether it's still for
+        #  the same word lists can be checked without even reading them.
+        stat = os.stat(file_path)
+        self.__digest_cache_file_path = f'{file_path}{WORDS_DIGEST_SUFFIX}'
+        self.__digest_cache_key       = {'size':     stat.st_size,
+                                         'mtime_ns': stat.st_mtime_ns}
+        try:
+            with open(self.__digest_cache_file_path, 'r') as f:
+                digest_cache = json.load(f)
+        except (OSError, ValueError):
+            pass # not cached yet (or unreadable, so just worked out again)
+        else:
+            if all(digest_cache.get(k) == v for k,v in self.__digest_cache_key.items()):
+                self.__hash_digest = digest_cache.get('digest')
+
         with open(file_path, 'r') as f:
             words = json.load(f)
         if not all(list_name in words for list_name in ('answer_series', 'additional_valid_guesses')):
             raise
-        if 'obfuscation' in words:
-            if words['obfuscation'] not in self.__OBFUSCATIONS:
-                raise
-            for list_name in ('answer_series', 'additional_valid_guesses'):
-                words[list_name] = self.__deobfuscate(words[list_name], words['obfuscation'])
-        lengths = {len(w)
-                   for w in itertools.chain(words['answer_series'],
-                                            words['additional_valid_guesses'])}
-        if len(lengths) > 1:
+        if 'obfuscation' in words and words['obfuscation'] not in self.__OBFUSCATIONS:
             raise
-        self.__answer_series            =     words['answer_series']
-        self.__additional_valid_guesses = set(words['additional_valid_guesses'])
-        self.__word_length              = lengths.pop()
+        if not words['answer_series']:
+            raise
+        def deobfuscate(obfuscated_word_list):
+            if 'obfuscation' not in words:
+                return obfuscated_word_list
+            return self.__deobfuscate(obfuscated_word_list, words['obfuscation'])
+        def decode_word_list(list_name):
+            # (every word's length is checked against the first answer's, as
+            #  each list is decoded)
+            word_list = deobfuscate(words[list_name])
+            if any(len(w) != self.__word_length for w in word_list):
+                raise
+            return word_list
+        self.__num_answers = len(words['answer_series'])
+        self.__word_length = len(deobfuscate(words['answer_series'][:1])[0])
+        self.__decode_answer_series            = lambda: packedwords.pack_all(decode_word_list('answer_series'))
+        self.__decode_answer                   = lambda i: packedwords.pack(deobfuscate(words['answer_series'][i:i+1])[0])
+        self.__decode_additional_valid_guesses = lambda: packedwords.pack_all(sorted(decode_word_list('additional_valid_guesses')))
+
+    def __download_lists_and_write_file(self, file_path, upstream_url):
+        # imported here so that Requests is only needed (and only takes time
+        #  to import) when word lists are actually downloaded
+        import requests
 
-    def __download_lists_and_write_file(self, file_path):
-        def get_text_or_abort(url):
-            rs = requests.get(url)
+        # Validators (ETag and Last-Modified) from upstream's last responses,
+        #  cached next to the word lists file along with the JavaScript file's
+        #  URL and the digest of the word lists that were written from it, so
+        #  that if the file still holds those word lists, upstream can answer
+        #  each request with 304 Not Modified instead of resending everything.
+        http_cache_file_path = f'{file_path}{WORDS_HTTP_SUFFIX}'
+        http_cache = {}
+        if os.path.exists(file_path):
+            try:
+                with open(http_cache_file_path, 'r') as f:
+                    http_cache = json.load(f)
+                if http_cache.get('digest') != Words(file_path).hash_digest():
+                    http_cache = {}
+            except Exception:
+                http_cache = {} # not cached yet (or unreadable, or file is), so everything is downloaded
+        validators = http_cache.get('validators', {}) # URL -> {header name: value}
+        new_validators = {}
+
+        def get_or_abort(url, stream=False):
+            # returns None if not modified since last response (see above)
+            headers = {}
+            if 'ETag' in validators.get(url, {}):
+                headers['If-None-Match'] = validators[url]['ETag']
+            if 'Last-Modified' in validators.get(url, {}):
+                headers['If-Modified-Since'] = validators[url]['Last-Modified']
+            rs = requests.get(url, headers=headers, stream=stream)
+            if rs.status_code == requests.codes.not_modified:
+                new_validators[url] = validators[url]
+                return None
             if not rs.ok:
                 print(f'Failed to get URL "{url}", with status {rs.status_code}!',
                       file=sys.stderr)
-                return None
-            return rs.text
+                raise
+            new_validators[url] = {name: rs.headers[name]
+                                   for name in ('ETag', 'Last-Modified')
+                                   if name in rs.headers}
+            return rs
 
-        # download page to discover URL for JavaScript file
-        html = get_text_or_abort(_UPSTREAM_GAME_URL)
-        if not html:
-            raise
-        matches = re.findall(r'<script src="(main\.[0-9a-f]+\.js)">', html)
-        if len(matches) != 1:
-            print('Failed to determine URL for JavaScript source!',
-                  file=sys.stderr)
-            raise
+        def write_http_cache():
+            # (written to a temporary file then renamed into place, like the
+            #  word lists file itself)
+            temp_file_path = f'{http_cache_file_path}.{os.getpid()}.tmp'
+            with open(temp_file_path, 'w') as f:
+                json.dump({'digest':     self.hash_digest(),
+                           'script_url': js_url,
+                           'validators': new_validators},
+                          f,
+                          indent=4)
+            os.replace(temp_file_path, http_cache_file_path)
+
+        # download page to discover URL for JavaScript file (unless it's not
+        #  modified, in which case neither is the URL)
+        rs = get_or_abort(upstream_url)
+        if rs is None:
+            js_url = http_cache['script_url']
+        else:
+            matches = re.findall(r'<script src="(main\.[0-9a-f]+\.js)">', rs.text)
+            if len(matches) != 1:
+                print('Failed to determine URL for JavaScript source!',
+                      file=sys.stderr)
+                raise
+            js_url = f'{upstream_url}/{matches[0]}'
 
-        # download JavaScript file to discover word lists
+        # download JavaScript file to discover word lists (unless it's not
+        #  modified, in which case the file already holds them), scanning it
+        #  as it's downloaded rather than holding all of it
         EXPECTED_WORD_LENGTH = 5
-        js_url = f'{_UPSTREAM_GAME_URL}/{matches[0]}'
-        js = get_text_or_abort(js_url)
-        word_lists = [[word.strip('"') for word in word_list.split(',')]
-                      for word_list in re.findall( r'=\[("[a-z]{'
-                                                  +str(EXPECTED_WORD_LENGTH)
-                                                  +r'}"(?:,"[a-z]{'
-                                                  +str(EXPECTED_WORD_LENGTH)
-                                                  +r'}")*)\]',
-                                                  js)]
+        rs = get_or_abort(js_url, stream=True)
+        if rs is None:
+            print('Word lists not modified upstream, keeping them.')
+            self.__read_file(file_path)
+            write_http_cache()
+            return
+        with rs:
+            word_lists = list(_find_word_arrays(rs.iter_content(_DOWNLOAD_CHUNK_SIZE),
+                                                EXPECTED_WORD_LENGTH))
         if len(word_lists) != 2:
             print('Failed to locate word lists within JavaScript source!',
                   file=sys.stderr)
@@ -115,42 +358,53 @@ class Words:
 
         # determine which word list is which, then load them
         if len(word_lists[0]) < len(word_lists[1]):
-            self.__answer_series            =     word_lists[0]
-            self.__additional_valid_guesses = set(word_lists[1])
+            (answer_series, additional_valid_guesses) = word_lists
         elif len(word_lists[0]) > len(word_lists[1]):
-            self.__answer_series            =     word_lists[1]
-            self.__additional_valid_guesses = set(word_lists[0])
+            (additional_valid_guesses, answer_series) = word_lists
         else:
             assert False
-        self.__word_length = EXPECTED_WORD_LENGTH
-
-        # obfuscate word lists before writing them
-        obfuscation = self.__DEFAULT_OBFUSCATION
-        obfuscated_answer_series            = self.__obfuscate(self.__answer_series,
-                                                               obfuscation)
-        obfuscated_additional_valid_guesses = self.__obfuscate(sorted(self.__additional_valid_guesses),
-                                                               obfuscation)
-
-        # write obfuscated word lists to file
-        with open(file_path, 'w') as f:
-            json.dump({'source':                   js_url,
-                       'answer_series':            obfuscated_answer_series,
-                       'additional_valid_guesses': obfuscated_additional_valid_guesses,
-                       'obfuscation':              obfuscation},
-                      f,
-                      indent=4)
+        additional_valid_guesses = sorted(set(additional_valid_guesses))
+        self.__answer_series            = packedwords.pack_all(answer_series)
+        self.__additional_valid_guesses = packedwords.pack_all(additional_valid_guesses)
+        self.__num_answers              = len(answer_series)
+        self.__word_length              = EXPECTED_WORD_LENGTH
+
+        # write word lists to file, obfuscated (unless file already holds
+        #  them, despite upstream resending them)
+        if (   not os.path.exists(file_path)
+            or Words(file_path).hash_digest() != self.hash_digest()):
+            self.__write_binary_file(file_path)
+        else:
+            print('Word lists not changed upstream, keeping them.')
+        write_http_cache()
+
+    def __packed_answer_series(self):
+        if self.__answer_series is None:
+            self.__answer_series = self.__decode_answer_series()
+        return self.__answer_series
+
+    def __packed_additional_valid_guesses(self):
+        if self.__additional_valid_guesses is None:
+            self.__additional_valid_guesses = self.__decode_additional_valid_guesses()
+        return self.__additional_valid_guesses
+
+    def __packed_answer(self, index):
+        if self.__answer_series is None:
+            return self.__decode_answer(index)
+        return self.__answer_series[index]
 
     def print_statistics(self):
-        overall_total_num_letters = len(self.__answer_series) * self.__word_length
+        answer_series = self.all_answers()
+        overall_total_num_letters = len(answer_series) * self.__word_length
         overall_letter_count_print_width = len(str(overall_total_num_letters))
         print(f'Overall Statistics:')
-        for letter_count in Counter(itertools.chain(*self.__answer_series)).most_common():
+        for letter_count in Counter(itertools.chain(*answer_series)).most_common():
             print(f'{letter_count[1]:{overall_letter_count_print_width}}/{overall_total_num_letters} {letter_count[0]}')
-        per_letter_total_num_letters = len(self.__answer_series)
-        per_letter_count_print_width = len(str(len(self.__answer_series)))
+        per_letter_total_num_letters = len(answer_series)
+        per_letter_count_print_width = len(str(len(answer_series)))
         for i in range(self.__word_length):
             print(f'\nLetter {i+1} Statistics:')
-            for letter_count in Counter(a[i] for a in self.__answer_series).most_common():
+            for letter_count in Counter(a[i] for a in answer_series).most_common():
                 print(f'{letter_count[1]:{per_letter_count_print_width}}/{per_letter_total_num_letters} {letter_count[0]}')
 
     def daily_answer(self, day_spec=True):
@@ -182,21 +436,82 @@ class Words:
             return FAILURE
         return (day_offset,
                 day_offset==day_offset_for_today,
-                self.__answer_series[day_offset % len(self.__answer_series)])
+                packedwords.unpack(self.__packed_answer(day_offset % self.__num_answers)))
 
     def random_answer(self):
-        return random.choice(self.__answer_series)
+        return packedwords.unpack(self.__packed_answer(random.randrange(self.__num_answers)))
+
+    def random_answers(self, n):
+        # n different answers
+        return [packedwords.unpack(a)
+                for a in random.sample(sorted(set(self.__packed_answer_series())), n)]
 
     def valid_guesses(self):
-        return set(self.__answer_series) | self.__additional_valid_guesses
+        return {packedwords.unpack(w)
+                for w in itertools.chain(self.__packed_answer_series(),
+                                         self.__packed_additional_valid_guesses())}
+
+    def packed_valid_guesses(self):
+        # sorted, so in same order as sorted(self.valid_guesses())
+        return packedwords.as_compact_sequence(sorted(set(itertools.chain(self.__packed_answer_series(),
+                                                                          self.__packed_additional_valid_guesses()))))
+
+    def lexicon(self):
+        # Built once, then shared by every game created from these word lists.
+        #  Built straight from the packed word lists, which are already
+        #  validated, and with the additional valid guesses (by far the longer
+        #  list) only decoded once the lexicon needs them (see
+        #  Lexicon.from_packed()), e.g. once the first guess is submitted.
+        if self.__lexicon is None:
+            self.__lexicon = Lexicon.from_packed(self.__word_length,
+                                                 self.__packed_answer_series(),
+                                                 lambda: itertools.chain(self.__packed_answer_series(),
+                                                                         self.__packed_additional_valid_guesses()))
+        return self.__lexicon
+
+    def adversarial_lexicon(self):
+        # Same as lexicon(), but with every valid guess as a candidate answer
+        #  (see Adversary), built only if asked for, since it's only for
+        #  adversarial games.
+        if self.__adversarial_lexicon is None:
+            packed_valid_guesses = self.packed_valid_guesses()
+            self.__adversarial_lexicon = Lexicon.from_packed(self.__word_length,
+                                                             packed_valid_guesses,
+                                                             lambda: packed_valid_guesses)
+        return self.__adversarial_lexicon
 
     def all_answers(self):
-        return list(self.__answer_series)
+        return [packedwords.unpack(a) for a in self.__packed_answer_series()]
+
+    def packed_answers(self):
+        return self.__packed_answer_series()[:] # copy, so caller can't modify ours
 
     def additional_valid_guesses(self):
-        return sorted(self.__additional_valid_guesses)
+        return [packedwords.unpack(g) for g in self.__packed_additional_valid_guesses()]
 
     def hash_digest(self):
+        # Needed by every daily game (to key its saved state), so worked out
+        #  at most once, and usually not at all, since word lists files store
+        #  it (or for the older JSON format, have it cached next to them, see
+        #  __read_json_file()).
+        if self.__hash_digest is None:
+            self.__hash_digest = self.__calc_hash_digest()
+            if self.__digest_cache_file_path is not None:
+                # (written to a temporary file then renamed into place, like
+                #  the word lists file itself; if it can't be written, it's
+                #  just worked out again next time)
+                temp_file_path = f'{self.__digest_cache_file_path}.{os.getpid()}.tmp'
+                try:
+                    with open(temp_file_path, 'w') as f:
+                        json.dump({**self.__digest_cache_key,
+                                   'digest': self.__hash_digest},
+                                  f)
+                    os.replace(temp_file_path, self.__digest_cache_file_path)
+                except OSError:
+                    pass
+        return self.__hash_digest
+
+    def __calc_hash_digest(self):
         h = hashlib.sha256()
 
         # The strings chosen here are arbitrary, all that is important is that
@@ -207,11 +522,11 @@ class Words:
         WORD_DELIMITER                  = b':'
 
         h.update(ANSWER_SERIES_HEADER)
-        for a in self.__answer_series:
+        for a in self.all_answers():
             h.update(WORD_DELIMITER+a.encode())
 
         h.update(ADDITIONAL_VALID_GUESSES_HEADER)
-        for g in sorted(self.__additional_valid_guesses):
+        for g in self.additional_valid_guesses(): # already sorted
             h.update(WORD_DELIMITER+g.encode())
 
         return h.hexdigest()
@@ -0,0 +1,56 @@
+# Copyright (c) 2022, cemysce
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import itertools
+import json
+import os
+import subprocess
+import sys
+
+from difficulty import DifficultyIndex
+
+def _write_words_file(tmp_path):
+    words = [''.join(p) for p in itertools.product('abcd', repeat=5)]
+    file_path = tmp_path / 'words.json'
+    file_path.write_text(json.dumps({'answer_series':            words[::7],
+                                     'additional_valid_guesses': words}))
+    return str(file_path)
+
+def _run_isolated(tmp_path, code):
+    # (in a fresh interpreter, so that which modules get imported isn't
+    #  affected by other tests)
+    termle_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                              'termle')
+    return subprocess.run([sys.executable, '-c', code],
+                          cwd=tmp_path,
+                          env={**os.environ, 'PYTHONPATH': termle_dir},
+                          capture_output=True,
+                          text=True,
+                          check=True).stdout
+
+def test_import_does_not_load_multiprocessing(tmp_path):
+    # Daily games import this module on every launch, only to look up a
+    #  cached index.
+    out = _run_isolated(tmp_path,
+                        'import sys\n'
+                        'import difficulty\n'
+                        'print("multiprocessing" in sys.modules, "simulation" in sys.modules)\n')
+    assert out.split() == ['False', 'False']
+
+def test_lookup_from_cache_does_not_load_simulation(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path) # (index is cached in working directory)
+    words_file_path = _write_words_file(tmp_path)
+    built = DifficultyIndex.build_cache(words_file_path, num_processes=1)
+    out = _run_isolated(tmp_path,
+                        'import sys\n'
+                        'from difficulty import DifficultyIndex\n'
+                        'from words      import Words\n'
+                        f'index = DifficultyIndex.from_cache(Words({words_file_path!r}))\n'
+                        'print(index.describe(0))\n'
+                        'print("multiprocessing" in sys.modules, "simulation" in sys.modules)\n')
+    (description, modules) = out.splitlines()
+    assert description == built.describe(0)
+    assert modules.split() == ['False', 'False']
@@ -0,0 +1,52 @@
+# Copyright (c) 2022, cemysce
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import itertools
+import json
+import time
+
+from sharegrid import ShareGridInversion
+
+# every word of 5 letters out of 6 (7776 words, every 13th of them an
+#  answer), so that there are many guesses per row for the hard mode search
+#  to get through
+_LETTERS = 'abcdef'
+
+def _write_words_file(tmp_path):
+    words = [''.join(p) for p in itertools.product(_LETTERS, repeat=5)]
+    file_path = tmp_path / 'words.json'
+    file_path.write_text(json.dumps({'answer_series':            words[::13],
+                                     'additional_valid_guesses': words}))
+    return str(file_path)
+
+def _invert(tmp_path, monkeypatch, share_text):
+    monkeypatch.chdir(tmp_path) # (pattern matrix is cached in working directory)
+    inversion = ShareGridInversion(_write_words_file(tmp_path),
+                                   share_text,
+                                   num_processes=1)
+    start_time = time.perf_counter()
+    results = inversion.run()
+    return (results, time.perf_counter() - start_time)
+
+def test_unsatisfiable_hard_mode_grid(tmp_path, monkeypatch):
+    # A right letter that isn't right in the next guess is impossible in hard
+    #  mode, for every answer (but not in normal mode).
+    grid = '\U0001f7e9⬛⬛⬛⬛\n⬛⬛⬛⬛⬛\n'
+    (results, _) = _invert(tmp_path, monkeypatch, f'Termle 1 X/6\n\n{grid}')
+    assert results
+    (results, elapsed) = _invert(tmp_path, monkeypatch, f'Termle 1 X/6*\n\n{grid}')
+    assert results == []
+    # (giving up on each answer only once the search hits its cap took about
+    #  20 times longer than this)
+    assert elapsed < 5
+
+def test_satisfiable_hard_mode_grid(tmp_path, monkeypatch):
+    grid = '⬛\U0001f7e8⬛⬛⬛\n\U0001f7e8⬛⬛⬛⬛\n\U0001f7e9\U0001f7e9\U0001f7e9\U0001f7e9\U0001f7e9\n'
+    (results, _) = _invert(tmp_path, monkeypatch, f'Termle 1 3/6*\n\n{grid}')
+    assert results
+    assert all(grid_answer.example_guesses is not None
+               and grid_answer.example_guesses[-1] == grid_answer.answer
+               for grid_answer in results)